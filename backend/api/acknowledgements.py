@@ -0,0 +1,177 @@
+"""Safety Alert Acknowledgement Tracking for V2V Safety Ecosystem
+
+Vehicles acknowledge the safety alerts they have shown to their driver, and
+the human-in-the-loop verification flow re-broadcasts an alert to nearby
+vehicles that have not acknowledged it yet.
+
+Each vehicle is assigned a small integer row id on its first acknowledgement.
+Each alert keeps one bitmap (a ``bytearray``) with bit ``row`` set once that
+vehicle has acknowledged it. Acknowledging is idempotent, with O(1) set and
+membership checks. An alert costs one bit per vehicle row instead of a growing
+list of vehicle id strings. Row ids of removed vehicles are cleared from every
+bitmap and then reused, and the bitmap of an alert is dropped when the alert
+expires, so the tracker only holds bitmaps of active alerts.
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+
+class AcknowledgementTracker:
+    """Per-alert acknowledgement bitmaps over vehicle row ids.
+
+    Attributes:
+        stats (dict): Counters of new and duplicate acknowledgements
+    """
+
+    def __init__(self):
+        """Initialize an empty tracker."""
+        self._rows: Dict[str, int] = {}     # vehicle_id -> row id
+        self._vehicle_ids: List[str] = []   # row id -> vehicle_id (None when free)
+        self._free_rows: List[int] = []
+        self._bitmaps: Dict[str, bytearray] = {}
+        self._lock = threading.Lock()
+        self.stats = {'acknowledged': 0, 'duplicates': 0}
+
+    def _row_for(self, vehicle_id: str) -> int:
+        row = self._rows.get(vehicle_id)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+                self._vehicle_ids[row] = vehicle_id
+            else:
+                row = len(self._vehicle_ids)
+                self._vehicle_ids.append(vehicle_id)
+            self._rows[vehicle_id] = row
+        return row
+
+    @staticmethod
+    def _has_bit(bitmap: bytearray, row: int) -> bool:
+        byte = row >> 3
+        return byte < len(bitmap) and bool(bitmap[byte] & (1 << (row & 7)))
+
+    def _acknowledge(self, alert_id: str, vehicle_id: str) -> bool:
+        row = self._row_for(vehicle_id)
+        bitmap = self._bitmaps.setdefault(alert_id, bytearray())
+        byte, mask = row >> 3, 1 << (row & 7)
+        if byte >= len(bitmap):
+            bitmap.extend(bytes(byte + 1 - len(bitmap)))
+        elif bitmap[byte] & mask:
+            self.stats['duplicates'] += 1
+            return False
+        bitmap[byte] |= mask
+        self.stats['acknowledged'] += 1
+        return True
+
+    def acknowledge(self, alert_id: str, vehicle_id: str) -> bool:
+        """Record that a vehicle acknowledged an alert.
+
+        Args:
+            alert_id: Alert identifier
+            vehicle_id: Acknowledging vehicle
+
+        Returns:
+            True if this is the vehicle's first acknowledgement of the alert
+        """
+        with self._lock:
+            return self._acknowledge(alert_id, vehicle_id)
+
+    def acknowledge_many(self, pairs: Iterable[tuple]) -> List[bool]:
+        """Record many acknowledgements under one lock acquisition.
+
+        Args:
+            pairs: (alert_id, vehicle_id) tuples
+
+        Returns:
+            list: Per pair, whether it was a new acknowledgement
+        """
+        with self._lock:
+            return [self._acknowledge(alert_id, vehicle_id) for alert_id, vehicle_id in pairs]
+
+    def is_acknowledged(self, alert_id: str, vehicle_id: str) -> bool:
+        """Return whether a vehicle has acknowledged an alert."""
+        row = self._rows.get(vehicle_id)
+        bitmap = self._bitmaps.get(alert_id)
+        return row is not None and bitmap is not None and self._has_bit(bitmap, row)
+
+    def count(self, alert_id: str) -> int:
+        """Number of vehicles that acknowledged an alert."""
+        bitmap = self._bitmaps.get(alert_id)
+        return int.from_bytes(bitmap, 'little').bit_count() if bitmap else 0
+
+    def acknowledged_by(self, alert_id: str) -> List[str]:
+        """Vehicle ids that acknowledged an alert, in row order."""
+        with self._lock:
+            bitmap = self._bitmaps.get(alert_id)
+            bits = int.from_bytes(bitmap, 'little') if bitmap else 0
+            vehicle_ids = []
+            while bits:
+                lowest = bits & -bits
+                vehicle_ids.append(self._vehicle_ids[lowest.bit_length() - 1])
+                bits ^= lowest
+            return vehicle_ids
+
+    def unacknowledged(self, alert_id: str, vehicles: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Filter vehicle records down to those that have not acknowledged an alert.
+
+        Args:
+            alert_id: Alert identifier
+            vehicles: Vehicle records with ``vehicle_id`` (e.g. from a proximity query)
+
+        Returns:
+            list: The records of vehicles without an acknowledgement, in input order
+        """
+        bitmap = self._bitmaps.get(alert_id)
+        if not bitmap:
+            return list(vehicles)
+        results = []
+        for vehicle in vehicles:
+            row = self._rows.get(vehicle['vehicle_id'])
+            if row is None or not self._has_bit(bitmap, row):
+                results.append(vehicle)
+        return results
+
+    def forget_vehicle(self, vehicle_id: str) -> None:
+        """Clear a removed vehicle's acknowledgements and release its row id.
+
+        Args:
+            vehicle_id: Unique vehicle identifier
+        """
+        with self._lock:
+            row = self._rows.pop(vehicle_id, None)
+            if row is None:
+                return
+            byte, mask = row >> 3, ~(1 << (row & 7)) & 0xFF
+            for bitmap in self._bitmaps.values():
+                if byte < len(bitmap):
+                    bitmap[byte] &= mask
+            self._vehicle_ids[row] = None
+            self._free_rows.append(row)
+
+    def forget_alert(self, alert_id: str) -> bool:
+        """Drop an expired alert's bitmap.
+
+        Args:
+            alert_id: Alert identifier
+
+        Returns:
+            True if the alert had acknowledgements
+        """
+        with self._lock:
+            return self._bitmaps.pop(alert_id, None) is not None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return acknowledgement counters and bitmap sizes."""
+        return {
+            **self.stats,
+            'alerts': len(self._bitmaps),
+            'vehicle_rows': len(self._rows),
+            'bitmap_bytes': sum(len(bitmap) for bitmap in self._bitmaps.values())
+        }
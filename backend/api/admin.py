@@ -0,0 +1,115 @@
+"""Admin API Module for V2V Safety Ecosystem
+
+This module contains operator-only endpoints, currently the controls of the
+on-demand sampling profiler. Every request must carry the token configured in
+``V2V_ADMIN_TOKEN`` (``Authorization: Bearer <token>`` or ``X-Admin-Token``);
+when no token is configured the admin API is disabled.
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+from flask import Blueprint, Response, request
+import hmac
+import logging
+import os
+
+from api.profiling import profiler
+from api.routes import create_api_response
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Create blueprint
+admin_bp = Blueprint('admin', __name__)
+
+
+def check_admin_token(token: str) -> bool:
+    """Check a presented token against V2V_ADMIN_TOKEN in constant time.
+
+    Args:
+        token: Token presented by the client
+
+    Returns:
+        True if admin access is enabled and the token matches
+    """
+    expected = os.environ.get('V2V_ADMIN_TOKEN')
+    if not expected or not token:
+        return False
+    return hmac.compare_digest(token.encode(), expected.encode())
+
+
+def request_token() -> str:
+    """Extract the admin token from the current request's headers."""
+    authorization = request.headers.get('Authorization', '')
+    if authorization.startswith('Bearer '):
+        return authorization[len('Bearer '):].strip()
+    return request.headers.get('X-Admin-Token', '')
+
+
+@admin_bp.before_request
+def require_admin_token():
+    """Reject requests without a valid admin token."""
+    if not os.environ.get('V2V_ADMIN_TOKEN'):
+        return create_api_response(False, message="Admin API is disabled", status_code=403)
+    if not check_admin_token(request_token()):
+        logger.warning(f"Rejected admin request to {request.path} from {request.remote_addr}")
+        return create_api_response(False, message="Invalid admin token", status_code=401)
+
+
+@admin_bp.route('/profiler/start', methods=['POST'])
+def start_profiler():
+    """Start a profiling session.
+
+    Expected JSON payload (all optional):
+    {
+        "duration_seconds": number,   # time window; omit to run until stopped
+        "sample_rate": number,        # fraction of requests to profile, (0, 1]
+        "interval_ms": number         # sampling interval
+    }
+    """
+    data = request.get_json(silent=True) or {}
+    try:
+        session = profiler.start(
+            duration=data.get('duration_seconds'),
+            sample_rate=float(data.get('sample_rate', 1.0)),
+            interval_ms=float(data.get('interval_ms', 5.0))
+        )
+    except (TypeError, ValueError) as e:
+        return create_api_response(False, message=str(e), status_code=400)
+    except RuntimeError as e:
+        return create_api_response(False, message=str(e), status_code=409)
+
+    return create_api_response(True, data=session.summary(), message="Profiling started")
+
+
+@admin_bp.route('/profiler/stop', methods=['POST'])
+def stop_profiler():
+    """Stop the running session and return its summary."""
+    session = profiler.stop()
+    if session is None:
+        return create_api_response(False, message="No profiling session", status_code=404)
+    return create_api_response(True, data=session.summary(), message="Profiling stopped")
+
+
+@admin_bp.route('/profiler', methods=['GET'])
+def profiler_status():
+    """Summary of the running or most recent session."""
+    session = profiler.session
+    if session is None:
+        return create_api_response(False, message="No profiling session", status_code=404)
+    return create_api_response(True, data=session.summary(), message="Profiling session retrieved")
+
+
+@admin_bp.route('/profiler/collapsed', methods=['GET'])
+def profiler_collapsed():
+    """Collapsed stacks of the current session for flame graph tools.
+
+    Query parameters:
+        endpoint: Only include samples of this endpoint (e.g. api.get_vehicles)
+    """
+    session = profiler.session
+    if session is None:
+        return create_api_response(False, message="No profiling session", status_code=404)
+    return Response(session.collapsed(request.args.get('endpoint')), mimetype='text/plain')
@@ -0,0 +1,138 @@
+"""Safety Alert Aggregation for V2V Safety Ecosystem
+
+When a hazard occurs, many nearby vehicles report it within seconds of each
+other. This module collapses those reports into one canonical alert per
+(alert_type, location, time window) so that each hazard is stored, and later
+broadcast, once.
+
+A report merges into an existing canonical alert when it has the same
+alert_type, lies within ``merge_distance_m`` of the canonical position and
+arrives within ``window_seconds`` of that alert's latest report. Merging bumps
+``reporter_count`` (once per distinct vehicle), grows ``radius`` to cover the new
+report's circle and escalates ``severity``. Candidates are found through a grid
+index per alert_type rather than by scanning stored alerts.
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Tuple
+
+from api.geo import GridIndex, distance_m
+
+logger = logging.getLogger(__name__)
+
+SEVERITY_RANK = {'low': 0, 'medium': 1, 'high': 2, 'critical': 3}
+
+
+class AlertAggregator:
+    """Spatio-temporal deduplication of incoming safety alerts.
+
+    Attributes:
+        merge_distance_m (float): Maximum distance from a canonical alert to merge
+        window_seconds (float): Maximum age of a canonical alert's last report
+    """
+
+    def __init__(self, alerts, merge_distance_m: float = 150.0, window_seconds: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """Initialize the aggregator.
+
+        Args:
+            alerts: RecordLog of safety alerts receiving canonical alerts
+            merge_distance_m: Merge distance in meters (default: 150)
+            window_seconds: Merge window in seconds (default: 60)
+            clock: Monotonic time source
+        """
+        self.alerts = alerts
+        self.merge_distance_m = merge_distance_m
+        self.window_seconds = window_seconds
+        self.clock = clock
+        self._indexes: Dict[str, GridIndex] = {}
+        self._last_report = OrderedDict()  # alert_id -> (monotonic time, alert_type), oldest first
+        self._reporters = {}               # alert_id -> set of reporting vehicle ids
+        self._lock = threading.Lock()
+        self.stats = {'created': 0, 'merged': 0}
+
+    def __len__(self) -> int:
+        """Number of canonical alerts still open for merging."""
+        return len(self._last_report)
+
+    def ingest(self, record: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """Store a new alert report, merging it into a nearby canonical alert if any.
+
+        Args:
+            record: Fully built alert record (alert_id, alert_type, severity,
+                position, radius, source_vehicle_id, ...)
+
+        Returns:
+            tuple: (canonical alert record, True if the report was merged)
+        """
+        now = self.clock()
+        lat, lon = record['position']['lat'], record['position']['lon']
+        alert_type = record['alert_type']
+        reporter = record['source_vehicle_id']
+
+        with self._lock:
+            self._prune(now)
+            index = self._indexes.get(alert_type)
+            if index is None:
+                index = self._indexes[alert_type] = GridIndex(self.merge_distance_m)
+
+            best_id, best_distance = None, None
+            for alert_id in index.query(lat, lon, self.merge_distance_m):
+                canonical = self.alerts.get(alert_id)
+                if canonical is None or canonical.get('status') != 'active':
+                    continue
+                position = canonical['position']
+                distance = distance_m(position['lat'], position['lon'], lat, lon)
+                if distance <= self.merge_distance_m and (best_distance is None or distance < best_distance):
+                    best_id, best_distance = alert_id, distance
+
+            if best_id is None:
+                merged_record = {**record, 'reporter_count': 1}
+                self.alerts.append(merged_record)
+                index.insert(record['alert_id'], lat, lon)
+                self._last_report[record['alert_id']] = (now, alert_type)
+                self._reporters[record['alert_id']] = {reporter}
+                self.stats['created'] += 1
+                return merged_record, False
+
+            reporters = self._reporters[best_id]
+            new_reporter = reporter not in reporters
+            reporters.add(reporter)
+            self._last_report[best_id] = (now, alert_type)
+            self._last_report.move_to_end(best_id)
+            covering_radius = best_distance + record.get('radius', 0)
+
+            def merge(current):
+                severity = current['severity']
+                if SEVERITY_RANK.get(record['severity'], -1) > SEVERITY_RANK.get(severity, -1):
+                    severity = record['severity']
+                return {
+                    **current,
+                    'severity': severity,
+                    'radius': max(current['radius'], covering_radius),
+                    'reporter_count': current.get('reporter_count', 1) + (1 if new_reporter else 0),
+                    'last_reported_at': datetime.now().isoformat()
+                }
+
+            canonical = self.alerts.modify(best_id, merge)
+            self.stats['merged'] += 1
+            return canonical, True
+
+    def _prune(self, now: float) -> None:
+        """Close canonical alerts whose merge window has passed (oldest first)."""
+        horizon = now - self.window_seconds
+        while self._last_report:
+            alert_id, (last_seen, alert_type) = next(iter(self._last_report.items()))
+            if last_seen >= horizon:
+                break
+            del self._last_report[alert_id]
+            self._reporters.pop(alert_id, None)
+            self._indexes[alert_type].remove(alert_id)
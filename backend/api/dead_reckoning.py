@@ -0,0 +1,163 @@
+"""Dead Reckoning for V2V Safety Ecosystem
+
+This module predicts where a vehicle is now from its last reported state, so
+readers of the registry do not treat an old report as the current position and
+vehicles do not have to report at a high fixed rate to stay accurate.
+
+The motion model is constant acceleration and constant turn rate, both
+estimated from the two most recent trajectory samples when available (falling
+back to constant velocity), clamped to plausible road-vehicle limits and
+integrated over at most ``max_horizon`` seconds.
+
+``AdaptiveReporter`` is the vehicle-side half: it runs the same predictor over
+the samples it has already sent and only reports when the server's prediction
+would be off by more than ``threshold_m`` (or a heartbeat interval elapses).
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import math
+from typing import Dict, Optional, Sequence
+
+from api.geo import distance_m, offset_position
+from api.trajectory import TrajectoryBuffer, Sample
+
+# Physical limits applied to history-derived estimates
+MAX_ACCELERATION = 4.0     # m/s^2
+MAX_DECELERATION = 9.0     # m/s^2
+MAX_TURN_RATE = 30.0       # degrees/s
+INTEGRATION_STEP = 0.5     # seconds
+DEFAULT_MAX_HORIZON = 5.0  # seconds
+
+
+def _wrap_degrees(angle: float) -> float:
+    """Wrap an angle difference into [-180, 180)."""
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+def estimate_rates(history: Sequence[Sample]) -> tuple:
+    """Estimate acceleration and turn rate from the last two samples.
+
+    Args:
+        history: Samples (timestamp, lat, lon, speed, heading), oldest first
+
+    Returns:
+        tuple: (acceleration m/s^2, turn rate degrees/s); zeros if unknown
+    """
+    if len(history) < 2:
+        return 0.0, 0.0
+    t0, _, _, v0, h0 = history[-2]
+    t1, _, _, v1, h1 = history[-1]
+    dt = t1 - t0
+    if dt <= 1e-3:
+        return 0.0, 0.0
+    acceleration = min(max((v1 - v0) / dt, -MAX_DECELERATION), MAX_ACCELERATION)
+    turn_rate = min(max(_wrap_degrees(h1 - h0) / dt, -MAX_TURN_RATE), MAX_TURN_RATE)
+    return acceleration, turn_rate
+
+
+def predict_state(lat: float, lon: float, speed: float, heading: float, elapsed: float,
+                  history: Optional[Sequence[Sample]] = None,
+                  max_horizon: float = DEFAULT_MAX_HORIZON) -> Dict[str, float]:
+    """Extrapolate a vehicle's state ``elapsed`` seconds past its last report.
+
+    Args:
+        lat, lon: Last reported position (degrees)
+        speed: Last reported speed (m/s)
+        heading: Last reported heading (degrees clockwise from north)
+        elapsed: Seconds since the report
+        history: Recent trajectory samples ending with the report, oldest first
+        max_horizon: Extrapolation cap in seconds
+
+    Returns:
+        dict: Predicted lat, lon, speed and heading
+    """
+    horizon = min(max(elapsed, 0.0), max_horizon)
+    acceleration, turn_rate = estimate_rates(history) if history else (0.0, 0.0)
+
+    if acceleration == 0.0 and turn_rate == 0.0:
+        lat, lon = offset_position(lat, lon, speed * horizon, heading)
+        return {'lat': lat, 'lon': lon, 'speed': speed, 'heading': heading}
+
+    steps = max(1, math.ceil(horizon / INTEGRATION_STEP))
+    dt = horizon / steps
+    for _ in range(steps):
+        next_speed = max(0.0, speed + acceleration * dt)
+        next_heading = (heading + turn_rate * dt) % 360.0
+        # Midpoint rule for the distance and direction of this step
+        lat, lon = offset_position(lat, lon, 0.5 * (speed + next_speed) * dt,
+                                   heading + 0.5 * _wrap_degrees(next_heading - heading))
+        speed, heading = next_speed, next_heading
+    return {'lat': lat, 'lon': lon, 'speed': speed, 'heading': heading}
+
+
+def predict_from_history(history: Sequence[Sample], now: float,
+                         max_horizon: float = DEFAULT_MAX_HORIZON) -> Optional[Dict[str, float]]:
+    """Predict the state at ``now`` from trajectory samples.
+
+    Args:
+        history: Samples ending with the latest report, oldest first
+        now: Current time (epoch seconds, same clock as the samples)
+        max_horizon: Extrapolation cap in seconds
+
+    Returns:
+        dict: Predicted state plus ``age_seconds`` of the latest report, or None
+            if there are no samples
+    """
+    if not history:
+        return None
+    timestamp, lat, lon, speed, heading = history[-1]
+    predicted = predict_state(lat, lon, speed, heading, now - timestamp, history, max_horizon)
+    predicted['age_seconds'] = max(0.0, now - timestamp)
+    return predicted
+
+
+class AdaptiveReporter:
+    """Vehicle-side report suppression mirroring the server's dead reckoning.
+
+    Attributes:
+        threshold_m (float): Prediction error that triggers a report
+        max_interval (float): Heartbeat interval; keep below the server's
+            V2V_VEHICLE_STALE_SECONDS
+    """
+
+    def __init__(self, threshold_m: float = 5.0, max_interval: float = 10.0,
+                 max_horizon: float = DEFAULT_MAX_HORIZON):
+        """Initialize the reporter.
+
+        Args:
+            threshold_m: Position error in meters that triggers a report
+            max_interval: Longest allowed silence in seconds
+            max_horizon: Extrapolation cap; must match the server's
+        """
+        self.threshold_m = threshold_m
+        self.max_interval = max_interval
+        self.max_horizon = max_horizon
+        self._sent = TrajectoryBuffer(3)
+        self.reports = 0
+        self.suppressed = 0
+
+    def should_report(self, now: float, lat: float, lon: float, speed: float, heading: float) -> bool:
+        """Decide whether the current state must be reported, and record it if so.
+
+        Args:
+            now: Current time (epoch seconds)
+            lat, lon: Actual position (degrees)
+            speed: Actual speed (m/s)
+            heading: Actual heading (degrees)
+
+        Returns:
+            True if the caller should send this state to the server
+        """
+        history = self._sent.samples()
+        if history:
+            predicted = predict_from_history(history, now, self.max_horizon)
+            error = distance_m(predicted['lat'], predicted['lon'], lat, lon)
+            if error <= self.threshold_m and predicted['age_seconds'] < self.max_interval:
+                self.suppressed += 1
+                return False
+        self._sent.append(now, lat, lon, speed, heading)
+        self.reports += 1
+        return True
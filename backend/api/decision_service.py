@@ -0,0 +1,313 @@
+"""Decision Service for V2V Safety Ecosystem
+
+This module serves collision-avoidance decisions from the RL agents to the API.
+Each request carries one state vector, but the agents are cheapest when asked
+about many states at once, so ``MicroBatcher`` holds incoming requests for at
+most ``max_wait_ms`` (or until ``max_batch_size`` are queued), runs one batched
+inference call, and resolves each caller's future with its own row.
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 2.0
+DEFAULT_MODEL_RETRY_SECONDS = 30.0
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-item calls into batched calls.
+
+    ``infer_fn`` receives a list of items and must return one result per item,
+    in order. It runs on a single worker thread, so it does not need to be
+    thread-safe itself.
+
+    Attributes:
+        max_batch_size (int): Largest batch handed to ``infer_fn``
+        max_wait_ms (float): Longest a request waits for others to join it
+    """
+
+    def __init__(self, infer_fn: Callable[[List[Any]], Sequence[Any]],
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_wait_ms: float = DEFAULT_MAX_WAIT_MS, name: str = 'micro-batcher'):
+        """Initialize the batcher and start its worker thread.
+
+        Args:
+            infer_fn: Batched inference function
+            max_batch_size: Largest batch size
+            max_wait_ms: Batching window in milliseconds
+            name: Worker thread name
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._infer_fn = infer_fn
+        self._queue: queue.Queue = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.requests = 0
+        self.largest_batch = 0
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def submit(self, item: Any) -> Future:
+        """Queue one item for the next batch.
+
+        Args:
+            item: Input for ``infer_fn``
+
+        Returns:
+            Future resolved with the item's result (or the batch's exception)
+        """
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def __call__(self, item: Any, timeout: float = None) -> Any:
+        """Submit an item and wait for its result."""
+        return self.submit(item).result(timeout)
+
+    def close(self, timeout: float = 1.0) -> None:
+        """Stop the worker after it drains the queued requests."""
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join(timeout)
+
+    def _collect(self, first) -> list:
+        """Gather requests arriving within the window after ``first``."""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait_ms / 1000.0
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                entry = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is None:
+                # Re-post the shutdown marker for the main loop
+                self._queue.put(None)
+                break
+            batch.append(entry)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = self._collect(first)
+            items = [item for item, _ in batch]
+            try:
+                results = self._infer_fn(items)
+                if len(results) != len(batch):
+                    raise RuntimeError(f"infer_fn returned {len(results)} results "
+                                       f"for a batch of {len(batch)}")
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+            except Exception as exc:
+                logger.error(f"Batched inference failed for {len(batch)} requests: {exc}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+
+            with self._stats_lock:
+                self.batches += 1
+                self.requests += len(batch)
+                self.largest_batch = max(self.largest_batch, len(batch))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return batching counters."""
+        with self._stats_lock:
+            return {
+                'batches': self.batches,
+                'requests': self.requests,
+                'mean_batch_size': round(self.requests / self.batches, 2) if self.batches else 0.0,
+                'largest_batch': self.largest_batch,
+                'max_batch_size': self.max_batch_size,
+                'max_wait_ms': self.max_wait_ms
+            }
+
+
+class ModelUnavailableError(RuntimeError):
+    """Raised when the DQN agent is requested but no trained model is loaded."""
+
+
+class DecisionService:
+    """Micro-batched access to the DQN and rule-based agents.
+
+    The agents (and NumPy) are only imported when the first decision is
+    requested. The DQN agent answers greedily from the trained model at
+    ``model_path``; without one, 'dqn' requests raise ``ModelUnavailableError``
+    instead of being answered by randomly initialized weights. A failed load
+    is retried once ``model_retry_seconds`` have passed, or as soon as the
+    model file appears or its modification time changes. ``cache_size``
+    enables the DQN decision cache (safe here because served agents never
+    train).
+
+    Attributes:
+        model_loaded (bool): Whether a trained DQN model has been loaded
+    """
+
+    AGENTS = ('dqn', 'rule')
+
+    def __init__(self, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_wait_ms: float = DEFAULT_MAX_WAIT_MS, model_path: str = None,
+                 cache_size: int = 0, allow_untrained: bool = False,
+                 model_retry_seconds: float = DEFAULT_MODEL_RETRY_SECONDS):
+        """Initialize the service.
+
+        Args:
+            max_batch_size: Largest batch per inference call
+            max_wait_ms: Batching window in milliseconds
+            model_path: Saved DQN model to serve
+            cache_size: DQN decision cache entries (0 disables the cache)
+            allow_untrained: Serve an untrained DQN agent when no model loads
+                (for benchmarks that only measure inference cost)
+            model_retry_seconds: Seconds before a failed model load is retried
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.model_path = model_path
+        self.cache_size = cache_size
+        self.allow_untrained = allow_untrained
+        self.model_retry_seconds = model_retry_seconds
+        self.model_loaded = False
+        # agent name -> (reason it cannot be served, monotonic failure time, model mtime)
+        self._unavailable: Dict[str, Tuple[str, float, Optional[float]]] = {}
+        self._agents: Dict[str, Any] = {}
+        self._batchers: Dict[str, MicroBatcher] = {}
+        self._lock = threading.Lock()
+
+    def _create_agent(self, name: str):
+        from rl_engine.dqn_agent import DQNAgent, RuleBasedAgent
+
+        if name == 'rule':
+            return RuleBasedAgent()
+        agent = DQNAgent(decision_cache_size=self.cache_size)
+        agent.epsilon = 0.0
+        if not self.model_path:
+            reason = "V2V_DQN_MODEL_PATH is not set"
+        elif not os.path.exists(self.model_path):
+            reason = f"model file {self.model_path} does not exist"
+        else:
+            try:
+                agent.load_model(self.model_path)
+                self.model_loaded = True
+                logger.info(f"Loaded DQN model from {self.model_path}")
+                return agent
+            except (OSError, ValueError, KeyError) as exc:
+                reason = f"model file {self.model_path} could not be loaded: {exc}"
+
+        if self.allow_untrained:
+            logger.warning(f"Serving an untrained DQN agent: {reason}")
+            return agent
+        raise ModelUnavailableError(f"No trained DQN model: {reason}")
+
+    def _model_mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.model_path) if self.model_path else None
+        except OSError:
+            return None
+
+    def _batcher(self, name: str) -> MicroBatcher:
+        batcher = self._batchers.get(name)
+        if batcher is not None:
+            return batcher
+        with self._lock:
+            failure = self._unavailable.get(name)
+            if failure is not None:
+                reason, failed_at, mtime = failure
+                if (time.monotonic() - failed_at < self.model_retry_seconds
+                        and self._model_mtime() == mtime):
+                    raise ModelUnavailableError(reason)
+            if name not in self._batchers:
+                mtime = self._model_mtime()
+                try:
+                    agent = self._create_agent(name)
+                except ModelUnavailableError as exc:
+                    # Remember the failure so it is logged once per distinct
+                    # reason, not per request or per retry
+                    if failure is None or failure[0] != str(exc):
+                        logger.error(f"Decision agent '{name}' unavailable: {exc}")
+                    self._unavailable[name] = (str(exc), time.monotonic(), mtime)
+                    raise
+                self._unavailable.pop(name, None)
+                self._agents[name] = agent
+                self._batchers[name] = MicroBatcher(
+                    lambda states, agent=agent: self._infer(agent, states),
+                    self.max_batch_size, self.max_wait_ms, name=f"decisions-{name}")
+                logger.info(f"Decision service started for agent '{name}'")
+            return self._batchers[name]
+
+    @staticmethod
+    def _infer(agent, states: List[Sequence[float]]) -> List[Dict[str, Any]]:
+        from rl_engine.dqn_agent import ACTION_NAMES, collision_risk_batch
+
+        actions = agent.act_batch(states)
+        risks = collision_risk_batch(states)
+        batch_size = len(states)
+        return [
+            {'action': int(action), 'action_name': ACTION_NAMES.get(int(action), 'Unknown'),
+             'risk': round(float(risk), 4), 'batch_size': batch_size}
+            for action, risk in zip(actions, risks)
+        ]
+
+    def decide(self, state: Sequence[float], agent: str = 'dqn', timeout: float = 5.0) -> Dict[str, Any]:
+        """Get an action and collision risk for one state.
+
+        Args:
+            state: State vector (8 features)
+            agent: 'dqn' or 'rule'
+            timeout: Seconds to wait for the batch result
+
+        Returns:
+            dict: action, action_name, risk, agent and the size of the batch
+                the request was served in
+
+        Raises:
+            ValueError: If the agent name is unknown
+            ModelUnavailableError: If 'dqn' is requested without a trained model
+        """
+        if agent not in self.AGENTS:
+            raise ValueError(f"Unknown agent: {agent}")
+        result = dict(self._batcher(agent)(state, timeout))
+        result['agent'] = agent
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return batching (and decision cache) counters per started agent.
+
+        The 'dqn' entry always reports ``model_loaded``, plus the reason when
+        the agent could not be started.
+        """
+        stats = {}
+        for name, batcher in list(self._batchers.items()):
+            stats[name] = batcher.get_stats()
+            cache = getattr(self._agents.get(name), 'decision_cache', None)
+            if cache is not None:
+                stats[name]['decision_cache'] = cache.get_stats()
+        dqn = stats.setdefault('dqn', {})
+        dqn['model_loaded'] = self.model_loaded
+        if 'dqn' in self._unavailable:
+            dqn['unavailable'] = self._unavailable['dqn'][0]
+        return stats
+
+    def close(self) -> None:
+        """Stop all batcher threads."""
+        for batcher in self._batchers.values():
+            batcher.close()
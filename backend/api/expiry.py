@@ -0,0 +1,286 @@
+"""Timer-Wheel Expiry for V2V Safety Ecosystem
+
+This module expires silent vehicles and old safety alerts without periodic full
+scans of the stores. A hashed timer wheel keyed on monotonic time holds one
+deadline per tracked entity; rescheduling on every vehicle update is O(1), and
+advancing the wheel only visits the slots whose ticks have elapsed.
+
+Vehicle lifecycle:
+    active --(stale_after s of silence)--> stale --(remove_after s)--> removed
+An update from a stale vehicle makes it active again.
+
+Alert lifecycle:
+    active --(alert_ttl s)--> expired --(alert_retention s)--> removed
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TimerWheel:
+    """Hashed timer wheel with O(1) schedule/cancel.
+
+    Deadlines are rounded up to whole ticks and hashed into ``slots`` buckets by
+    ``tick % slots``. Deadlines further away than one rotation share a bucket with
+    nearer ones and are simply skipped until their own rotation comes round.
+
+    Attributes:
+        tick_seconds (float): Wheel resolution
+        slots (int): Number of buckets
+    """
+
+    def __init__(self, tick_seconds: float = 1.0, slots: int = 512,
+                 clock: Callable[[], float] = time.monotonic):
+        """Initialize the wheel.
+
+        Args:
+            tick_seconds: Duration of one tick (default: 1.0)
+            slots: Number of wheel buckets (default: 512)
+            clock: Monotonic time source, injectable for replay and benchmarks
+        """
+        if tick_seconds <= 0 or slots < 1:
+            raise ValueError("tick_seconds must be positive and slots at least 1")
+        self.tick_seconds = tick_seconds
+        self.slots = slots
+        self.clock = clock
+        self._buckets = [set() for _ in range(slots)]
+        self._deadlines = {}  # key -> deadline tick
+        self._current_tick = self._tick_of(clock())
+        self._lock = threading.Lock()
+
+    def _tick_of(self, timestamp: float) -> int:
+        return int(timestamp // self.tick_seconds)
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def schedule(self, key: Hashable, delay: float, now: Optional[float] = None) -> None:
+        """Schedule (or reschedule) ``key`` to expire after ``delay`` seconds.
+
+        Args:
+            key: Entity key; an existing deadline for it is replaced
+            delay: Seconds from now
+            now: Current monotonic time (default: clock())
+        """
+        now = self.clock() if now is None else now
+        deadline = max(math.ceil((now + delay) / self.tick_seconds), self._current_tick + 1)
+        with self._lock:
+            previous = self._deadlines.get(key)
+            if previous is not None:
+                self._buckets[previous % self.slots].discard(key)
+            self._deadlines[key] = deadline
+            self._buckets[deadline % self.slots].add(key)
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel the deadline for ``key``.
+
+        Args:
+            key: Entity key
+
+        Returns:
+            True if a deadline was cancelled
+        """
+        with self._lock:
+            deadline = self._deadlines.pop(key, None)
+            if deadline is None:
+                return False
+            self._buckets[deadline % self.slots].discard(key)
+            return True
+
+    def advance(self, now: Optional[float] = None) -> List[Hashable]:
+        """Advance the wheel to ``now`` and pop every key whose deadline passed.
+
+        Args:
+            now: Current monotonic time (default: clock())
+
+        Returns:
+            Expired keys, in no particular order
+        """
+        target = self._tick_of(self.clock() if now is None else now)
+        if target <= self._current_tick:
+            return []
+
+        expired = []
+        with self._lock:
+            if target <= self._current_tick:
+                return []
+            # Visit each elapsed slot once, even if more than a rotation elapsed
+            steps = min(target - self._current_tick, self.slots)
+            for offset in range(1, steps + 1):
+                bucket = self._buckets[(self._current_tick + offset) % self.slots]
+                due = [key for key in bucket if self._deadlines[key] <= target]
+                for key in due:
+                    bucket.discard(key)
+                    del self._deadlines[key]
+                expired.extend(due)
+            self._current_tick = target
+        return expired
+
+
+class ExpiryManager:
+    """Applies timer-wheel deadlines to the vehicle registry and alert log.
+
+    Callers touch vehicles on every register/update and track alerts on creation;
+    ``expire_due`` is cheap enough to call at the start of every request.
+
+    Attributes:
+        stale_after (float): Silence before a vehicle is marked stale
+        remove_after (float): Silence before a vehicle is removed
+        alert_ttl (float): Lifetime of an active alert
+        alert_retention (float): Time an expired alert is kept before removal
+    """
+
+    def __init__(self, registry, alerts, stale_after: float = 30.0,
+                 remove_after: float = 300.0, alert_ttl: float = 600.0,
+                 alert_retention: float = 3600.0,
+                 wheel: Optional[TimerWheel] = None,
+                 on_vehicle_removed: Optional[Callable[[str], None]] = None,
+                 on_alert_expired: Optional[Callable[[str], None]] = None):
+        """Initialize the manager.
+
+        Args:
+            registry: VehicleRegistry to expire vehicles from
+            alerts: RecordLog of safety alerts
+            stale_after: Seconds of silence before a vehicle is marked stale
+            remove_after: Seconds of silence before a vehicle is removed
+            alert_ttl: Seconds before an active alert expires
+            alert_retention: Seconds an expired alert stays in the log (for
+                listing and export) before it is removed
+            wheel: TimerWheel to use (default: 1 s resolution)
+            on_vehicle_removed: Called with the vehicle_id of each removed vehicle,
+                so per-vehicle state held elsewhere can be released
+            on_alert_expired: Called with the alert_id of each expired alert,
+                so per-alert state held elsewhere can be released
+        """
+        if remove_after < stale_after:
+            raise ValueError("remove_after must not be shorter than stale_after")
+        self.registry = registry
+        self.alerts = alerts
+        self.stale_after = stale_after
+        self.remove_after = remove_after
+        self.alert_ttl = alert_ttl
+        self.alert_retention = alert_retention
+        self.wheel = wheel if wheel is not None else TimerWheel()
+        self.on_vehicle_removed = on_vehicle_removed
+        self.on_alert_expired = on_alert_expired
+        self._last_seen: Dict[str, float] = {}  # vehicle_id -> wheel clock of last touch
+        self.stats = {'vehicles_staled': 0, 'vehicles_removed': 0, 'alerts_expired': 0, 'alerts_removed': 0}
+
+    def touch_vehicle(self, vehicle_id: str) -> None:
+        """Record activity for a vehicle, pushing back its stale deadline.
+
+        Call this before writing the vehicle's record, so a sweep running
+        concurrently either sees the new activity or has already marked the
+        vehicle stale for the write to reactivate.
+
+        Args:
+            vehicle_id: Unique vehicle identifier
+        """
+        now = self.wheel.clock()
+        self._last_seen[vehicle_id] = now
+        self.wheel.schedule(('vehicle', vehicle_id), self.stale_after, now)
+
+    def forget_vehicle(self, vehicle_id: str) -> None:
+        """Stop tracking a vehicle.
+
+        Args:
+            vehicle_id: Unique vehicle identifier
+        """
+        self.wheel.cancel(('vehicle', vehicle_id))
+        self._last_seen.pop(vehicle_id, None)
+
+    def track_alert(self, alert_id: str, ttl: Optional[float] = None) -> None:
+        """Start the expiry clock of an alert.
+
+        Args:
+            alert_id: Alert identifier
+            ttl: Lifetime override in seconds (default: alert_ttl)
+        """
+        self.wheel.schedule(('alert', alert_id), self.alert_ttl if ttl is None else ttl)
+
+    def expire_due(self, now: Optional[float] = None) -> Dict[str, int]:
+        """Apply every deadline that has passed.
+
+        Args:
+            now: Current monotonic time (default: wheel clock)
+
+        Returns:
+            Counts of vehicles staled/removed and alerts expired/removed by this call
+        """
+        now = self.wheel.clock() if now is None else now
+        counts = {'vehicles_staled': 0, 'vehicles_removed': 0, 'alerts_expired': 0, 'alerts_removed': 0}
+        for kind, key in self.wheel.advance(now):
+            if kind == 'vehicle':
+                self._expire_vehicle(key, counts, now)
+            elif kind == 'alert':
+                if self.alerts.update(key, {'status': 'expired'}) is not None:
+                    self.wheel.schedule(('alert_removal', key), self.alert_retention, now)
+                    if self.on_alert_expired is not None:
+                        self.on_alert_expired(key)
+                    counts['alerts_expired'] += 1
+            elif kind == 'alert_removal':
+                if self.alerts.remove(key) is not None:
+                    counts['alerts_removed'] += 1
+
+        for name, value in counts.items():
+            self.stats[name] += value
+        if any(counts.values()):
+            logger.info(f"Expiry sweep: {counts}")
+        return counts
+
+    def _expire_vehicle(self, vehicle_id: str, counts: Dict[str, int], now: float) -> None:
+        if ('vehicle', vehicle_id) in self.wheel:
+            return  # Touched again after the deadline was popped
+
+        def silent_for(seconds: float) -> bool:
+            last_seen = self._last_seen.get(vehicle_id)
+            return last_seen is None or now - last_seen >= seconds
+
+        # Check and act under the vehicle's stripe lock: an update that lands
+        # in between has touched the vehicle first, so the check sees it
+        record = self.registry.get(vehicle_id)
+        if record is None:
+            self._last_seen.pop(vehicle_id, None)
+            return
+        if record.get('status') == 'stale':
+            removed = self.registry.remove_if(
+                vehicle_id, lambda current: current.get('status') == 'stale' and silent_for(self.remove_after))
+            if removed is not None:
+                self._last_seen.pop(vehicle_id, None)
+                if self.on_vehicle_removed is not None:
+                    self.on_vehicle_removed(vehicle_id)
+                counts['vehicles_removed'] += 1
+                return
+        else:
+            marked = []
+
+            def mark_stale(current):
+                if current.get('status') == 'stale' or not silent_for(self.stale_after):
+                    return current
+                marked.append(vehicle_id)
+                return {**current, 'status': 'stale'}
+
+            self.registry.modify(vehicle_id, mark_stale)
+            if marked:
+                self.wheel.schedule(('vehicle', vehicle_id), self.remove_after - self.stale_after, now)
+                counts['vehicles_staled'] += 1
+                return
+
+        # Activity raced with the sweep; keep the vehicle on the wheel
+        current = self.registry.get(vehicle_id)
+        if ('vehicle', vehicle_id) not in self.wheel and current is not None:
+            silence = self.remove_after if current.get('status') == 'stale' else self.stale_after
+            last_seen = self._last_seen.get(vehicle_id, now)
+            self.wheel.schedule(('vehicle', vehicle_id), max(last_seen + silence - now, 0.0), now)
@@ -0,0 +1,87 @@
+"""NDJSON Export Helpers for V2V Safety Ecosystem
+
+This module turns record logs into streamed NDJSON (one JSON object per line)
+so exports never build the whole response in memory. Records are serialized
+one at a time and flushed in chunks of roughly ``chunk_bytes``.
+
+Time-range filters compare ISO-8601 strings directly: every record timestamp is
+produced by ``datetime.now().isoformat()``, whose output sorts lexicographically
+in time order, so no per-record parsing is needed.
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+DEFAULT_CHUNK_BYTES = 64 * 1024
+
+
+def parse_time_bound(value: Optional[str]) -> Optional[str]:
+    """Normalize a ``since``/``until`` query value to a comparable ISO string.
+
+    Args:
+        value: ISO-8601 timestamp, optionally with a UTC offset
+
+    Returns:
+        Naive local-time ISO string, or None if ``value`` is empty
+
+    Raises:
+        ValueError: If ``value`` is not a valid ISO-8601 timestamp
+    """
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.isoformat()
+
+
+def filter_time_range(records: Iterable[Dict[str, Any]], time_field: str,
+                      since: Optional[str] = None, until: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield records whose ``time_field`` lies in ``[since, until)``.
+
+    Args:
+        records: Records in any order
+        time_field: Name of the ISO timestamp field
+        since: Inclusive lower bound (normalized by parse_time_bound)
+        until: Exclusive upper bound (normalized by parse_time_bound)
+    """
+    for record in records:
+        timestamp = record.get(time_field, '')
+        if since is not None and timestamp < since:
+            continue
+        if until is not None and timestamp >= until:
+            continue
+        yield record
+
+
+def iter_ndjson_chunks(records: Iterable[Dict[str, Any]],
+                       chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[str]:
+    """Serialize records as NDJSON, yielding chunks of about ``chunk_bytes``.
+
+    Args:
+        records: Records to serialize
+        chunk_bytes: Target chunk size in characters
+
+    Returns:
+        Iterator of NDJSON text chunks, each ending with a newline
+    """
+    encode = json.JSONEncoder(separators=(',', ':'), default=str).encode
+    buffer = []
+    size = 0
+    for record in records:
+        line = encode(record)
+        buffer.append(line)
+        size += len(line) + 1
+        if size >= chunk_bytes:
+            buffer.append('')
+            yield '\n'.join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        buffer.append('')
+        yield '\n'.join(buffer)
@@ -0,0 +1,159 @@
+"""Geospatial Helpers for V2V Safety Ecosystem
+
+This module provides the distance math and the uniform grid index shared by the
+API features that need "what is near this point" answers without comparing
+against every stored record.
+
+Distances use the equirectangular approximation, which is accurate to well under
+1% at the sub-kilometre ranges V2V features work with.
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import math
+import threading
+from typing import Dict, Hashable, Iterator, Set, Tuple
+
+EARTH_RADIUS_M = 6371000.0
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180.0
+
+
+def distance_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Approximate ground distance between two points in meters.
+
+    Args:
+        lat1, lon1: First point (degrees)
+        lat2, lon2: Second point (degrees)
+
+    Returns:
+        Distance in meters
+    """
+    mean_lat = math.radians((lat1 + lat2) * 0.5)
+    dx = (lon2 - lon1) * math.cos(mean_lat)
+    dy = lat2 - lat1
+    return math.sqrt(dx * dx + dy * dy) * METERS_PER_DEGREE
+
+
+def offset_position(lat: float, lon: float, distance: float, heading: float) -> Tuple[float, float]:
+    """Move a point ``distance`` meters along a compass heading.
+
+    Args:
+        lat, lon: Start point (degrees)
+        distance: Distance in meters
+        heading: Degrees clockwise from north
+
+    Returns:
+        tuple: (lat, lon) of the end point
+    """
+    bearing = math.radians(heading)
+    north = distance * math.cos(bearing)
+    east = distance * math.sin(bearing)
+    new_lat = lat + north / METERS_PER_DEGREE
+    scale = max(math.cos(math.radians((lat + new_lat) * 0.5)), 1e-6)
+    return new_lat, lon + east / (METERS_PER_DEGREE * scale)
+
+
+class GridIndex:
+    """Uniform grid over lat/lon mapping cells to the keys located in them.
+
+    Rows are ``cell_size_m`` tall; each row's column width is scaled by the cosine
+    of the row's centre latitude so cells stay roughly square. ``query`` returns
+    candidates from the cells overlapping a circle; callers filter by exact
+    distance.
+
+    Attributes:
+        cell_size_m (float): Cell edge length in meters
+    """
+
+    def __init__(self, cell_size_m: float):
+        """Initialize the index.
+
+        Args:
+            cell_size_m: Cell edge length in meters
+        """
+        if cell_size_m <= 0:
+            raise ValueError("cell_size_m must be positive")
+        self.cell_size_m = cell_size_m
+        self._lat_step = cell_size_m / METERS_PER_DEGREE
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._key_cells: Dict[Hashable, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._key_cells)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._key_cells
+
+    def _lon_step(self, row: int) -> float:
+        centre = math.radians((row + 0.5) * self._lat_step)
+        return self._lat_step / max(math.cos(centre), 1e-6)
+
+    def cell_of(self, lat: float, lon: float) -> Tuple[int, int]:
+        """Return the (row, col) cell containing a point."""
+        row = math.floor(lat / self._lat_step)
+        return row, math.floor(lon / self._lon_step(row))
+
+    def insert(self, key: Hashable, lat: float, lon: float) -> None:
+        """Insert ``key`` at a point, moving it if already indexed.
+
+        Args:
+            key: Record key
+            lat, lon: Position (degrees)
+        """
+        cell = self.cell_of(lat, lon)
+        with self._lock:
+            previous = self._key_cells.get(key)
+            if previous == cell:
+                return
+            if previous is not None:
+                self._discard(key, previous)
+            self._key_cells[key] = cell
+            self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove ``key`` from the index.
+
+        Returns:
+            True if the key was indexed
+        """
+        with self._lock:
+            cell = self._key_cells.pop(key, None)
+            if cell is None:
+                return False
+            self._discard(key, cell)
+            return True
+
+    def _discard(self, key: Hashable, cell: Tuple[int, int]) -> None:
+        members = self._cells[cell]
+        members.discard(key)
+        if not members:
+            del self._cells[cell]
+
+    def query(self, lat: float, lon: float, radius_m: float) -> Iterator[Hashable]:
+        """Yield keys in cells overlapping the circle around a point.
+
+        Args:
+            lat, lon: Circle centre (degrees)
+            radius_m: Circle radius in meters
+
+        Returns:
+            Iterator over candidate keys (superset of the keys within radius)
+        """
+        lat_span = radius_m / METERS_PER_DEGREE
+        first_row = math.floor((lat - lat_span) / self._lat_step)
+        last_row = math.floor((lat + lat_span) / self._lat_step)
+        lon_span = lat_span / max(math.cos(math.radians(min(abs(lat) + lat_span, 89.9))), 1e-6)
+        candidates = []
+        with self._lock:
+            for row in range(first_row, last_row + 1):
+                lon_step = self._lon_step(row)
+                first_col = math.floor((lon - lon_span) / lon_step)
+                last_col = math.floor((lon + lon_span) / lon_step)
+                for col in range(first_col, last_col + 1):
+                    members = self._cells.get((row, col))
+                    if members:
+                        candidates.extend(members)
+        return iter(candidates)
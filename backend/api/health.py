@@ -9,7 +9,6 @@ Version: 1.0.0
 """
 
 from flask import Blueprint, jsonify, request
-import psutil
 import datetime
 import logging
 import time
@@ -53,6 +52,9 @@ def detailed_health_check():
         dict: Comprehensive system health information
     """
     try:
+        # psutil is only needed here; keep it off the startup path
+        import psutil
+        
         # System metrics
         cpu_percent = psutil.cpu_percent(interval=1)
         memory = psutil.virtual_memory()
@@ -172,12 +174,34 @@ def liveness_check():
         'uptime_seconds': (datetime.datetime.now() - service_start_time).total_seconds()
     }), 200
 
+@health_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """Operational counters of the API layer.
+    
+    Returns:
+        dict: Rate limiting, expiry, alert aggregation, acknowledgement,
+        decision batching and logging pipeline counters
+    """
+    from api.routes import rate_limits, expiry_manager, alert_aggregator, acknowledgements, decision_service
+    from api.logging_pipeline import get_logging_stats
+    
+    return jsonify({
+        'service': 'V2V Safety Ecosystem Backend',
+        'timestamp': datetime.datetime.now().isoformat(),
+        'rate_limits': rate_limits.get_metrics(),
+        'expiry': dict(expiry_manager.stats),
+        'alert_aggregation': dict(alert_aggregator.stats),
+        'acknowledgements': acknowledgements.get_stats(),
+        'decisions': decision_service.get_stats(),
+        'logging': get_logging_stats()
+    }), 200
+
 @health_bp.errorhandler(404)
 def not_found(error):
     """Handle 404 errors in health blueprint."""
     return jsonify({
         'error': 'Health endpoint not found',
-        'message': 'Available endpoints: /, /status, /detailed, /ready, /live'
+        'message': 'Available endpoints: /, /status, /detailed, /ready, /live, /metrics'
     }), 404
 
 @health_bp.errorhandler(500)
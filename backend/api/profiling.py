@@ -0,0 +1,286 @@
+"""Sampling Profiler for V2V Safety Ecosystem
+
+This module provides an on-demand, low-overhead profiler for the running
+server. Instead of tracing every call, a background thread wakes every
+``interval_ms`` and reads the current stack of each thread that is serving a
+profiled request (``sys._current_frames``), attributing the sample to the
+request's Flask endpoint. Background threads whose names match
+``thread_prefixes`` (the decision batchers) are sampled under
+``thread:<name>``, so hot agent calls show up as well.
+
+A session covers either a time window (``duration``) or runs until stopped,
+and profiles a random ``sample_rate`` fraction of the requests started during
+it. Results are aggregated per endpoint and exported as collapsed stacks
+(``frame;frame;frame count``), the input format of flamegraph.pl and
+speedscope.
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_MS = 5.0
+MAX_STACK_DEPTH = 64
+MAX_DURATION_SECONDS = 600.0
+
+
+def frame_label(code) -> str:
+    """Collapsed-stack label for a code object: ``qualname (file.py:line)``."""
+    name = getattr(code, 'co_qualname', code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame, max_depth: int = MAX_STACK_DEPTH) -> str:
+    """Render a frame's call stack root-first, joined with ``;``."""
+    labels = []
+    while frame is not None and len(labels) < max_depth:
+        labels.append(frame_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return ';'.join(labels)
+
+
+class ProfileSession:
+    """Samples collected by one profiler run.
+
+    Attributes:
+        sample_rate (float): Fraction of requests profiled
+        interval_ms (float): Sampling interval
+        duration (float): Time window in seconds, or None if run until stopped
+    """
+
+    def __init__(self, sample_rate: float, interval_ms: float, duration: Optional[float]):
+        self.sample_rate = sample_rate
+        self.interval_ms = interval_ms
+        self.duration = duration
+        self.started_at = time.time()
+        self.stopped_at = None
+        self.stacks: Dict[str, Counter] = {}
+        self.requests_profiled = 0
+        self.samples = 0
+        self.sampling_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, endpoint: str, stack: str) -> None:
+        with self._lock:
+            counter = self.stacks.get(endpoint)
+            if counter is None:
+                counter = self.stacks[endpoint] = Counter()
+            counter[stack] += 1
+            self.samples += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Copy of the per-endpoint stack counts, safe to read while sampling."""
+        with self._lock:
+            return {name: dict(counter) for name, counter in self.stacks.items()}
+
+    def collapsed(self, endpoint: str = None) -> str:
+        """Collapsed-stack text, one ``endpoint;frames count`` line per stack.
+
+        Args:
+            endpoint: Restrict output to one endpoint
+
+        Returns:
+            str: Lines sorted by sample count, highest first
+        """
+        lines = []
+        for name, counter in self.snapshot().items():
+            if endpoint is not None and name != endpoint:
+                continue
+            for stack, count in counter.items():
+                lines.append((count, f"{name};{stack} {count}"))
+        lines.sort(key=lambda line: -line[0])
+        return '\n'.join(line for _, line in lines) + ('\n' if lines else '')
+
+    def summary(self, top: int = 5) -> Dict[str, Any]:
+        """Per-endpoint sample counts and hottest leaf frames."""
+        end = self.stopped_at or time.time()
+        endpoints = {}
+        for name, counter in self.snapshot().items():
+            leaves = Counter()
+            for stack, count in counter.items():
+                leaves[stack.rsplit(';', 1)[-1]] += count
+            endpoints[name] = {
+                'samples': sum(counter.values()),
+                'hottest_frames': [{'frame': frame, 'samples': count} for frame, count in leaves.most_common(top)]
+            }
+        elapsed = max(end - self.started_at, 1e-9)
+        return {
+            'active': self.stopped_at is None,
+            'started_at': self.started_at,
+            'stopped_at': self.stopped_at,
+            'duration_seconds': self.duration,
+            'sample_rate': self.sample_rate,
+            'interval_ms': self.interval_ms,
+            'requests_profiled': self.requests_profiled,
+            'samples': self.samples,
+            'sampler_overhead_percent': round(100.0 * self.sampling_seconds / elapsed, 3),
+            'endpoints': endpoints
+        }
+
+
+class SamplingProfiler:
+    """Start/stop sampling sessions and attribute samples to endpoints.
+
+    ``install(app)`` registers request hooks that mark the current thread as
+    serving an endpoint while a session is active; with no session the hooks
+    cost one attribute check.
+    """
+
+    def __init__(self, thread_prefixes: tuple = ('decisions-',)):
+        """Initialize an idle profiler.
+
+        Args:
+            thread_prefixes: Name prefixes of background threads to sample
+        """
+        self.thread_prefixes = thread_prefixes
+        self.session: Optional[ProfileSession] = None
+        self._active_threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._listeners: List[Callable[[ProfileSession], None]] = []
+
+    @property
+    def running(self) -> bool:
+        return self.session is not None and self.session.stopped_at is None
+
+    def add_listener(self, callback: Callable[[ProfileSession], None]) -> None:
+        """Call ``callback(session)`` whenever a session finishes."""
+        self._listeners.append(callback)
+
+    def install(self, app) -> None:
+        """Register the request hooks on a Flask app."""
+        from flask import request
+
+        @app.before_request
+        def _profile_request_start():
+            session = self.session
+            if session is None or session.stopped_at is not None:
+                return
+            if session.sample_rate < 1.0 and random.random() >= session.sample_rate:
+                return
+            self._active_threads[threading.get_ident()] = request.endpoint or request.path
+            session.requests_profiled += 1
+
+        @app.teardown_request
+        def _profile_request_end(exc):
+            if self._active_threads:
+                self._active_threads.pop(threading.get_ident(), None)
+
+    def start(self, duration: float = None, sample_rate: float = 1.0,
+              interval_ms: float = DEFAULT_INTERVAL_MS) -> ProfileSession:
+        """Start a session, replacing the results of the previous one.
+
+        Args:
+            duration: Seconds to profile (default: until ``stop``)
+            sample_rate: Fraction of requests to profile (0-1]
+            interval_ms: Sampling interval in milliseconds
+
+        Returns:
+            ProfileSession: The new session
+
+        Raises:
+            ValueError: On out-of-range arguments
+            RuntimeError: If a session is already running
+        """
+        if not 0.0 < sample_rate <= 1.0:
+            raise ValueError("sample_rate must be in (0, 1]")
+        if interval_ms < 1.0:
+            raise ValueError("interval_ms must be at least 1")
+        if duration is not None and not 0.0 < duration <= MAX_DURATION_SECONDS:
+            raise ValueError(f"duration must be in (0, {MAX_DURATION_SECONDS:g}] seconds")
+
+        with self._lock:
+            if self.running:
+                raise RuntimeError("A profiling session is already running")
+            self._active_threads.clear()
+            self._stop.clear()
+            self.session = ProfileSession(sample_rate, interval_ms, duration)
+            self._sampler = threading.Thread(target=self._sample_loop, args=(self.session,),
+                                             name='sampling-profiler', daemon=True)
+            self._sampler.start()
+
+        logger.info(f"Profiling started (duration={duration}, sample_rate={sample_rate}, interval_ms={interval_ms})")
+        return self.session
+
+    def stop(self) -> Optional[ProfileSession]:
+        """Stop the running session and wait for the sampler to finish.
+
+        Returns:
+            ProfileSession: The stopped (or most recent) session, or None
+        """
+        self._stop.set()
+        sampler = self._sampler
+        if sampler is not None and sampler is not threading.current_thread():
+            sampler.join()
+        return self.session
+
+    def _background_threads(self) -> Dict[int, str]:
+        if not self.thread_prefixes:
+            return {}
+        return {
+            thread.ident: f"thread:{thread.name}"
+            for thread in threading.enumerate()
+            if thread.name.startswith(self.thread_prefixes)
+        }
+
+    def _sample_loop(self, session: ProfileSession) -> None:
+        interval = session.interval_ms / 1000.0
+        deadline = time.monotonic() + session.duration if session.duration else None
+        background = self._background_threads()
+        refreshed = time.monotonic()
+        own_ident = threading.get_ident()
+
+        while not self._stop.wait(interval):
+            started = time.perf_counter()
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                break
+            if now - refreshed > 1.0:
+                background, refreshed = self._background_threads(), now
+
+            targets = dict(self._active_threads)
+            targets.update(background)
+            if targets:
+                frames = sys._current_frames()
+                for ident, endpoint in targets.items():
+                    frame = frames.get(ident)
+                    if frame is None or ident == own_ident:
+                        continue
+                    if endpoint.startswith('thread:') and _is_idle(frame):
+                        continue
+                    session.add(endpoint, collapse_stack(frame))
+                del frames
+            session.sampling_seconds += time.perf_counter() - started
+
+        session.stopped_at = time.time()
+        self._active_threads.clear()
+        logger.info(f"Profiling stopped: {session.samples} samples from {session.requests_profiled} requests")
+        for listener in self._listeners:
+            try:
+                listener(session)
+            except Exception as e:
+                logger.error(f"Profiler listener failed: {str(e)}")
+
+
+def _is_idle(frame) -> bool:
+    """True if a background thread is blocked waiting for work."""
+    code = frame.f_code
+    return code.co_name in ('wait', 'get', '_wait_for_tstate_lock') and \
+        os.path.basename(code.co_filename) in ('threading.py', 'queue.py')
+
+
+# Process-wide profiler shared by the admin HTTP and Socket.IO interfaces
+profiler = SamplingProfiler()
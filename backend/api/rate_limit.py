@@ -0,0 +1,180 @@
+"""Per-Client Rate Limiting for V2V Safety Ecosystem
+
+This module implements token-bucket rate limiting keyed by client id
+(vehicle_id or sender_id), configured per endpoint. Each endpoint's buckets live
+in an ``OrderedDict`` in least-recently-used order: taking a token is O(1), and
+buckets idle longer than ``idle_seconds`` are evicted from the front in
+amortized O(1), so memory tracks the set of recently active clients.
+
+Rejected requests are counted per endpoint and exposed via ``get_metrics``;
+their responses carry a ``Retry-After`` header with the seconds until the
+client's bucket holds a token again.
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucketLimiter:
+    """Token buckets for one endpoint, keyed by client id.
+
+    Attributes:
+        rate (float): Tokens refilled per second
+        burst (float): Bucket capacity
+        idle_seconds (float): Idle time after which a bucket is evicted
+    """
+
+    def __init__(self, rate: float, burst: float, idle_seconds: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """Initialize the limiter.
+
+        Args:
+            rate: Sustained requests per second per client
+            burst: Maximum burst size per client
+            idle_seconds: Evict buckets untouched for this long (default: 300)
+            clock: Monotonic time source
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.idle_seconds = idle_seconds
+        self.clock = clock
+        self._buckets = OrderedDict()  # key -> [tokens, last_refill]
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.rejected = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def allow(self, key: str, cost: float = 1.0) -> bool:
+        """Take ``cost`` tokens from the bucket of ``key`` if available.
+
+        Args:
+            key: Client id
+            cost: Tokens consumed by this request
+
+        Returns:
+            True if the request is within the rate limit
+        """
+        now = self.clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.burst, now]
+            else:
+                bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+                self._buckets.move_to_end(key)
+            self._evict_idle(now)
+
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                self.allowed += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def retry_after(self, key: str, cost: float = 1.0) -> float:
+        """Seconds until the bucket of ``key`` holds ``cost`` tokens.
+
+        Args:
+            key: Client id
+            cost: Tokens the next request will consume
+
+        Returns:
+            Wait time in seconds (0 if a request would be allowed now)
+        """
+        now = self.clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                return 0.0
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        return max(0.0, (cost - tokens) / self.rate)
+
+    def _evict_idle(self, now: float) -> None:
+        horizon = now - self.idle_seconds
+        buckets = self._buckets
+        while buckets:
+            key, bucket = next(iter(buckets.items()))
+            if bucket[1] >= horizon:
+                break
+            del buckets[key]
+            self.evicted += 1
+
+
+class RateLimitRegistry:
+    """Per-endpoint limiters sharing one metrics view."""
+
+    def __init__(self, limits: Dict[str, Dict[str, float]]):
+        """Initialize limiters.
+
+        Args:
+            limits: Mapping of endpoint name to ``{'rate': ..., 'burst': ...}``
+                (optionally ``idle_seconds``)
+        """
+        self.limiters = {name: TokenBucketLimiter(**config) for name, config in limits.items()}
+
+    def allow(self, endpoint: str, key: str) -> bool:
+        """Check the limit of ``key`` on ``endpoint``; unknown endpoints are unlimited."""
+        limiter = self.limiters.get(endpoint)
+        return limiter is None or limiter.allow(key)
+
+    def retry_after(self, endpoint: str, key: str) -> float:
+        """Seconds until ``key`` may call ``endpoint`` again."""
+        limiter = self.limiters.get(endpoint)
+        return 0.0 if limiter is None else limiter.retry_after(key)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Return allowed/rejected/evicted counters and live bucket counts per endpoint."""
+        return {
+            name: {
+                'rate': limiter.rate,
+                'burst': limiter.burst,
+                'allowed': limiter.allowed,
+                'rejected': limiter.rejected,
+                'evicted_buckets': limiter.evicted,
+                'active_buckets': len(limiter)
+            }
+            for name, limiter in self.limiters.items()
+        }
+
+
+def rate_limited(registry: RateLimitRegistry, endpoint: str,
+                 key_func: Callable[..., Optional[str]], on_reject: Callable[[float], Any]):
+    """Decorate a Flask view with per-client rate limiting.
+
+    Args:
+        registry: RateLimitRegistry holding the endpoint's limiter
+        endpoint: Endpoint name in the registry
+        key_func: Called with the view's kwargs; returns the client id or None
+            (None skips limiting, e.g. for payloads the view will reject anyway)
+        on_reject: Called with the client's retry delay in seconds; returns the
+            response for rejected requests
+
+    Returns:
+        Decorator
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = key_func(**kwargs)
+            if key is not None and not registry.allow(endpoint, key):
+                logger.debug(f"Rate limit exceeded on {endpoint} by {key}")
+                return on_reject(registry.retry_after(endpoint, key))
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
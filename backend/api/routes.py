@@ -8,23 +8,129 @@ Date: September 7, 2025
 Version: 1.0.0
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 from datetime import datetime
 import logging
 import uuid
 import json
+import math
+import os
+import time
 from typing import Dict, List, Any
 
+from api.stores import VehicleRegistry, RecordLog
+from api.expiry import ExpiryManager
+from api.alert_aggregation import AlertAggregator
+from api.rate_limit import RateLimitRegistry, rate_limited
+from api.export import parse_time_bound, filter_time_range, iter_ndjson_chunks
+from api.trajectory import TrajectoryStore, FIELDS as TRAJECTORY_FIELDS
+from api.geo import GridIndex, distance_m
+from api.dead_reckoning import predict_from_history
+from api.decision_service import DecisionService, ModelUnavailableError
+from api.acknowledgements import AcknowledgementTracker
+from api.validation import (
+    validate_vehicle_registration,
+    validate_vehicle_update,
+    validate_vehicle_batch_update,
+    validate_safety_alert,
+    validate_v2v_message,
+    validate_decision_request,
+    validate_acknowledgement,
+    validate_acknowledgement_batch
+)
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Create blueprint
 api_bp = Blueprint('api', __name__)
 
-# In-memory storage for development (replace with database in production)
-vehicle_registry = {}
-safety_alerts = []
-communication_logs = []
+# In-memory storage for development (replace with database in production).
+# The server runs with async_mode='threading', so stores must be thread-safe.
+vehicle_registry = VehicleRegistry()
+safety_alerts = RecordLog('alert_id')
+communication_logs = RecordLog('message_id')
+
+# Bounded motion history per vehicle (packed ring buffers)
+trajectory_store = TrajectoryStore(capacity=int(os.environ.get('V2V_TRAJECTORY_CAPACITY', 120)))
+
+# Dead reckoning: reads extrapolate from the last report for up to this long
+PREDICTION_HORIZON_SECONDS = float(os.environ.get('V2V_PREDICTION_HORIZON_SECONDS', 5))
+ADAPTIVE_REPORTING = {
+    'threshold_m': float(os.environ.get('V2V_ADAPTIVE_THRESHOLD_M', 5)),
+    'max_interval_seconds': float(os.environ.get('V2V_ADAPTIVE_MAX_INTERVAL_SECONDS', 10)),
+    'max_horizon_seconds': PREDICTION_HORIZON_SECONDS
+}
+
+# Vehicles indexed at their last reported position; proximity queries widen the
+# search by the farthest a vehicle can travel within the prediction horizon
+MAX_VEHICLE_SPEED = 150.0  # m/s, matches validation.SPEED
+vehicle_index = GridIndex(cell_size_m=250.0)
+
+# Per-alert acknowledgement bitmaps over vehicle row ids
+acknowledgements = AcknowledgementTracker()
+
+def forget_vehicle(vehicle_id: str) -> None:
+    """Release per-vehicle state held outside the registry."""
+    trajectory_store.discard(vehicle_id)
+    vehicle_index.remove(vehicle_id)
+    acknowledgements.forget_vehicle(vehicle_id)
+
+# Expire silent vehicles and old alerts (timer wheel, no full scans)
+expiry_manager = ExpiryManager(
+    vehicle_registry,
+    safety_alerts,
+    stale_after=float(os.environ.get('V2V_VEHICLE_STALE_SECONDS', 30)),
+    remove_after=float(os.environ.get('V2V_VEHICLE_REMOVE_SECONDS', 300)),
+    alert_ttl=float(os.environ.get('V2V_ALERT_TTL_SECONDS', 600)),
+    alert_retention=float(os.environ.get('V2V_ALERT_RETENTION_SECONDS', 3600)),
+    on_vehicle_removed=forget_vehicle,
+    on_alert_expired=acknowledgements.forget_alert
+)
+
+# Collapse reports of the same hazard into one canonical alert
+alert_aggregator = AlertAggregator(
+    safety_alerts,
+    merge_distance_m=float(os.environ.get('V2V_ALERT_MERGE_DISTANCE_M', 150)),
+    window_seconds=float(os.environ.get('V2V_ALERT_MERGE_WINDOW_SECONDS', 60))
+)
+
+# Agent decisions, micro-batched across concurrent requests
+decision_service = DecisionService(
+    max_batch_size=int(os.environ.get('V2V_DECISION_MAX_BATCH', 64)),
+    max_wait_ms=float(os.environ.get('V2V_DECISION_BATCH_WINDOW_MS', 2)),
+    model_path=os.environ.get('V2V_DQN_MODEL_PATH'),
+    cache_size=int(os.environ.get('V2V_DECISION_CACHE_SIZE', 0))
+)
+
+def rate_limit_config(name: str, rate: float, burst: float) -> Dict[str, float]:
+    """Read an endpoint's token-bucket settings from the environment."""
+    prefix = f"V2V_RATE_LIMIT_{name.upper()}"
+    return {
+        'rate': float(os.environ.get(f"{prefix}_RATE", rate)),
+        'burst': float(os.environ.get(f"{prefix}_BURST", burst))
+    }
+
+# Per-client token buckets on the ingest endpoints
+rate_limits = RateLimitRegistry({
+    'vehicle_update': rate_limit_config('vehicle_update', rate=20, burst=40),
+    'v2v_message': rate_limit_config('v2v_message', rate=10, burst=20),
+    'safety_alert': rate_limit_config('safety_alert', rate=1, burst=5)
+})
+
+def json_field(field: str):
+    """Build a rate-limit key function reading ``field`` from the JSON body."""
+    def key_func(**kwargs):
+        data = request.get_json(silent=True)
+        value = data.get(field) if isinstance(data, dict) else None
+        return value if isinstance(value, str) else None
+    return key_func
+
+def rate_limit_exceeded(retry_after: float):
+    """Response for requests rejected by the rate limiter, with a Retry-After header."""
+    response, status_code = create_api_response(False, message="Rate limit exceeded", status_code=429)
+    response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response, status_code
 
 # Helper functions
 def validate_vehicle_data(data: Dict[str, Any]) -> tuple:
@@ -36,17 +142,131 @@ def validate_vehicle_data(data: Dict[str, Any]) -> tuple:
     Returns:
         tuple: (is_valid, error_message)
     """
-    required_fields = ['vehicle_id', 'position', 'speed', 'heading']
+    return validate_vehicle_registration(data)
+
+def record_motion(vehicle: Dict[str, Any]) -> None:
+    """Append a vehicle record's current motion state to its trajectory history."""
+    position = vehicle['position']
+    trajectory_store.record(
+        vehicle['vehicle_id'], time.time(),
+        position['lat'], position['lon'], vehicle['speed'], vehicle['heading']
+    )
+    vehicle_index.insert(vehicle['vehicle_id'], position['lat'], position['lon'])
+
+def record_kinematics(vehicle: Dict[str, Any]) -> None:
+    """Append a sample for a speed/heading report that carries no position.
+    
+    The last known position is carried forward to now by dead reckoning, so the
+    sample neither drags the prediction back to an old fix nor moves the
+    vehicle's reported (indexed) position.
+    """
+    now = time.time()
+    predicted = predict_vehicle(vehicle['vehicle_id'], now)
+    position = predicted if predicted is not None else vehicle['position']
+    trajectory_store.record(
+        vehicle['vehicle_id'], now,
+        position['lat'], position['lon'], vehicle['speed'], vehicle['heading']
+    )
+
+def predict_vehicle(vehicle_id: str, now: float = None) -> Dict[str, float]:
+    """Dead-reckoned state of a vehicle at ``now`` (default: current time).
+    
+    Returns:
+        dict: Predicted lat, lon, speed, heading and age_seconds, or None if
+        the vehicle has no recorded motion
+    """
+    history = trajectory_store.track(vehicle_id, limit=2)
+    if not history:
+        return None
+    return predict_from_history(history, time.time() if now is None else now, PREDICTION_HORIZON_SECONDS)
+
+def with_prediction(vehicle: Dict[str, Any], now: float) -> Dict[str, Any]:
+    """Copy of a vehicle record with its predicted position attached."""
+    predicted = predict_vehicle(vehicle['vehicle_id'], now)
+    if predicted is None:
+        return vehicle
+    return {
+        **vehicle,
+        'predicted_position': {'lat': predicted['lat'], 'lon': predicted['lon']},
+        'position_age_seconds': round(predicted['age_seconds'], 3)
+    }
+
+def nearby_vehicles(lat: float, lon: float, radius: float, now: float = None) -> List[Dict[str, Any]]:
+    """Find vehicles whose predicted position lies within ``radius`` meters.
+    
+    Args:
+        lat, lon: Query point (degrees)
+        radius: Search radius in meters
+        now: Prediction time (default: current time)
+        
+    Returns:
+        list: Vehicle records with predicted position and ``distance_m``, nearest first
+    """
+    now = time.time() if now is None else now
+    reach = radius + MAX_VEHICLE_SPEED * PREDICTION_HORIZON_SECONDS
+    results = []
+    for vehicle_id in vehicle_index.query(lat, lon, reach):
+        vehicle = vehicle_registry.get(vehicle_id)
+        predicted = predict_vehicle(vehicle_id, now)
+        if vehicle is None or predicted is None:
+            continue
+        distance = distance_m(lat, lon, predicted['lat'], predicted['lon'])
+        if distance <= radius:
+            results.append({
+                **vehicle,
+                'predicted_position': {'lat': predicted['lat'], 'lon': predicted['lon']},
+                'position_age_seconds': round(predicted['age_seconds'], 3),
+                'distance_m': round(distance, 2)
+            })
+    results.sort(key=lambda v: v['distance_m'])
+    return results
+
+def apply_vehicle_update(vehicle_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a validated update payload to a registered vehicle.
+    
+    Args:
+        vehicle_id: Unique vehicle identifier
+        data: Update payload (position, speed, heading, status)
+        
+    Returns:
+        dict: The updated vehicle record, or None if the vehicle is not registered
+    """
+    # Collect fields to update
+    fields = {}
+    
+    # Update position if provided
+    if 'position' in data:
+        fields['position'] = data['position']
+    
+    # Update other fields
+    updateable_fields = ['speed', 'heading', 'status']
+    for field in updateable_fields:
+        if field in data:
+            fields[field] = data[field]
     
-    for field in required_fields:
-        if field not in data:
-            return False, f"Missing required field: {field}"
+    fields['last_update'] = datetime.now().isoformat()
     
-    # Validate position format
-    if not isinstance(data['position'], dict) or 'lat' not in data['position'] or 'lon' not in data['position']:
-        return False, "Position must contain 'lat' and 'lon' coordinates"
+    def apply_update(current):
+        record = {**current, **fields}
+        # A report from a stale vehicle makes it active again
+        if 'status' not in fields and current.get('status') == 'stale':
+            record['status'] = 'active'
+        return record
     
-    return True, None
+    # Touch before writing so a concurrent expiry sweep sees the activity
+    if vehicle_id in vehicle_registry:
+        expiry_manager.touch_vehicle(vehicle_id)
+    
+    # Apply atomically under the vehicle's lock stripe
+    vehicle = vehicle_registry.modify(vehicle_id, apply_update)
+    # A new position is a trajectory sample as is; a speed/heading change
+    # alone is sampled at the dead-reckoned position, not the old fix
+    if vehicle is not None:
+        if 'position' in fields:
+            record_motion(vehicle)
+        elif 'speed' in fields or 'heading' in fields:
+            record_kinematics(vehicle)
+    return vehicle
 
 def create_api_response(success: bool, data: Any = None, message: str = None, status_code: int = 200) -> tuple:
     """Create standardized API response.
@@ -71,6 +291,11 @@ def create_api_response(success: bool, data: Any = None, message: str = None, st
         
     return jsonify(response), status_code
 
+@api_bp.before_request
+def apply_expiry():
+    """Apply due vehicle/alert expiries before serving any API request."""
+    expiry_manager.expire_due()
+
 # Vehicle Registration and Management Endpoints
 @api_bp.route('/vehicles/register', methods=['POST'])
 def register_vehicle():
@@ -107,19 +332,28 @@ def register_vehicle():
             'heading': data['heading'],
             'vehicle_type': data.get('vehicle_type', 'unknown'),
             'capabilities': data.get('capabilities', []),
+            'reporting_mode': data.get('reporting_mode', 'periodic'),
             'registered_at': datetime.now().isoformat(),
             'last_update': datetime.now().isoformat(),
             'status': 'active'
         }
         
         # Store in registry
-        vehicle_registry[vehicle_id] = vehicle_record
+        expiry_manager.touch_vehicle(vehicle_id)
+        vehicle_registry.put(vehicle_id, vehicle_record)
+        trajectory_store.discard(vehicle_id)  # Re-registration starts a new track
+        record_motion(vehicle_record)
         
         logger.info(f"Vehicle {vehicle_id} registered successfully")
         
+        response_data = {'vehicle_id': vehicle_id, 'status': 'registered'}
+        if vehicle_record['reporting_mode'] == 'adaptive':
+            # Vehicle reports only when server-side prediction drifts past threshold
+            response_data['reporting'] = ADAPTIVE_REPORTING
+        
         return create_api_response(
             True, 
-            data={'vehicle_id': vehicle_id, 'status': 'registered'},
+            data=response_data,
             message="Vehicle registered successfully"
         )
         
@@ -128,6 +362,7 @@ def register_vehicle():
         return create_api_response(False, message="Internal server error", status_code=500)
 
 @api_bp.route('/vehicles/<vehicle_id>/update', methods=['PUT'])
+@rate_limited(rate_limits, 'vehicle_update', lambda vehicle_id: vehicle_id, rate_limit_exceeded)
 def update_vehicle_status(vehicle_id: str):
     """Update vehicle position and status.
     
@@ -142,22 +377,16 @@ def update_vehicle_status(vehicle_id: str):
         if not data:
             return create_api_response(False, message="No JSON data provided", status_code=400)
         
-        # Update vehicle record
-        vehicle = vehicle_registry[vehicle_id]
-        
-        # Update position if provided
-        if 'position' in data:
-            vehicle['position'] = data['position']
-        
-        # Update other fields
-        updateable_fields = ['speed', 'heading', 'status']
-        for field in updateable_fields:
-            if field in data:
-                vehicle[field] = data[field]
+        is_valid, error_msg = validate_vehicle_update(data)
+        if not is_valid:
+            return create_api_response(False, message=error_msg, status_code=400)
         
-        vehicle['last_update'] = datetime.now().isoformat()
+        vehicle = apply_vehicle_update(vehicle_id, data)
+        if vehicle is None:
+            return create_api_response(False, message="Vehicle not found", status_code=404)
         
-        logger.info(f"Vehicle {vehicle_id} status updated")
+        logger.info(f"Vehicle {vehicle_id} status updated",
+                    extra={'event': 'vehicle_update', 'vehicle_id': vehicle_id})
         
         return create_api_response(
             True,
@@ -169,6 +398,121 @@ def update_vehicle_status(vehicle_id: str):
         logger.error(f"Error updating vehicle {vehicle_id}: {str(e)}")
         return create_api_response(False, message="Internal server error", status_code=500)
 
+@api_bp.route('/vehicles/updates', methods=['PUT'])
+def batch_update_vehicles():
+    """Apply position/status updates for many vehicles in one request.
+    
+    Valid items are applied; invalid or unknown-vehicle items are reported by index.
+    
+    Expected JSON payload:
+    {
+        "updates": [
+            {"vehicle_id": "string", "position": {"lat": float, "lon": float},
+             "speed": float, "heading": float, "status": "string"}
+        ]
+    }
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or 'updates' not in data:
+            return create_api_response(False, message="Missing required field: updates", status_code=400)
+        
+        updates = data['updates']
+        _, error_msg, item_errors = validate_vehicle_batch_update(updates)
+        if error_msg:
+            return create_api_response(False, message=error_msg, status_code=400)
+        
+        invalid = {error['index'] for error in item_errors}
+        errors = list(item_errors)
+        applied = 0
+        for index, item in enumerate(updates):
+            if index in invalid:
+                continue
+            if not rate_limits.allow('vehicle_update', item['vehicle_id']):
+                errors.append({'index': index, 'error': "Rate limit exceeded"})
+            elif apply_vehicle_update(item['vehicle_id'], item) is None:
+                errors.append({'index': index, 'error': "Vehicle not found"})
+            else:
+                applied += 1
+        errors.sort(key=lambda e: e['index'])
+        
+        logger.info(f"Batch update applied to {applied} of {len(updates)} vehicles",
+                    extra={'event': 'vehicle_batch_update', 'applied': applied, 'rejected': len(errors)})
+        
+        return create_api_response(
+            not errors,
+            data={'applied': applied, 'rejected': len(errors), 'errors': errors},
+            message="Batch update processed",
+            status_code=200 if applied or not errors else 400
+        )
+        
+    except Exception as e:
+        logger.error(f"Error applying batch vehicle update: {str(e)}")
+        return create_api_response(False, message="Internal server error", status_code=500)
+
+@api_bp.route('/vehicles/nearby', methods=['GET'])
+def get_nearby_vehicles():
+    """Get vehicles whose predicted position is within a radius of a point.
+    
+    Query parameters:
+        lat, lon: Query point (degrees, required)
+        radius: Search radius in meters (default: 150)
+    """
+    try:
+        lat = request.args.get('lat', type=float)
+        lon = request.args.get('lon', type=float)
+        radius = request.args.get('radius', 150.0, type=float)
+        if lat is None or lon is None:
+            return create_api_response(False, message="Query parameters 'lat' and 'lon' are required", status_code=400)
+        if not 0 < radius <= 10000:
+            return create_api_response(False, message="radius must be between 0 and 10000 meters", status_code=400)
+        
+        vehicles = nearby_vehicles(lat, lon, radius)
+        
+        return create_api_response(
+            True,
+            data={'vehicles': vehicles, 'count': len(vehicles), 'radius': radius},
+            message="Nearby vehicles retrieved successfully"
+        )
+        
+    except Exception as e:
+        logger.error(f"Error retrieving nearby vehicles: {str(e)}")
+        return create_api_response(False, message="Internal server error", status_code=500)
+
+@api_bp.route('/vehicles/<vehicle_id>/track', methods=['GET'])
+def get_vehicle_track(vehicle_id: str):
+    """Get a vehicle's recent motion history, oldest sample first.
+    
+    Query parameters:
+        limit: Maximum number of samples, at least 1 (default: all retained)
+    
+    Each sample has timestamp (epoch seconds), lat, lon, speed and heading.
+    """
+    try:
+        limit = request.args.get('limit', type=int)
+        if 'limit' in request.args and (limit is None or limit < 1):
+            return create_api_response(False, message="limit must be a positive integer", status_code=400)
+        
+        samples = trajectory_store.track(vehicle_id, limit)
+        if samples is None:
+            return create_api_response(False, message="Vehicle not found", status_code=404)
+        
+        return create_api_response(
+            True,
+            data={
+                'vehicle_id': vehicle_id,
+                'samples': [dict(zip(TRAJECTORY_FIELDS, sample)) for sample in samples],
+                'count': len(samples),
+                'capacity': trajectory_store.capacity
+            },
+            message="Vehicle track retrieved successfully"
+        )
+        
+    except Exception as e:
+        logger.error(f"Error retrieving track for vehicle {vehicle_id}: {str(e)}")
+        return create_api_response(False, message="Internal server error", status_code=500)
+
 @api_bp.route('/vehicles', methods=['GET'])
 def get_vehicles():
     """Get list of all registered vehicles."""
@@ -177,7 +521,7 @@ def get_vehicles():
         status_filter = request.args.get('status')
         vehicle_type_filter = request.args.get('type')
         
-        vehicles = list(vehicle_registry.values())
+        vehicles = vehicle_registry.values()
         
         # Apply filters
         if status_filter:
@@ -186,6 +530,10 @@ def get_vehicles():
         if vehicle_type_filter:
             vehicles = [v for v in vehicles if v.get('vehicle_type') == vehicle_type_filter]
         
+        # Attach dead-reckoned positions
+        now = time.time()
+        vehicles = [with_prediction(v, now) for v in vehicles]
+        
         return create_api_response(
             True,
             data={
@@ -205,6 +553,7 @@ def get_vehicles():
 
 # Safety Alert Endpoints
 @api_bp.route('/safety/alerts', methods=['POST'])
+@rate_limited(rate_limits, 'safety_alert', json_field('vehicle_id'), rate_limit_exceeded)
 def create_safety_alert():
     """Create a new safety alert.
     
@@ -224,11 +573,10 @@ def create_safety_alert():
         if not data:
             return create_api_response(False, message="No JSON data provided", status_code=400)
         
-        # Validate required fields
-        required_fields = ['alert_type', 'severity', 'position', 'message', 'vehicle_id']
-        for field in required_fields:
-            if field not in data:
-                return create_api_response(False, message=f"Missing required field: {field}", status_code=400)
+        # Validate fields
+        is_valid, error_msg = validate_safety_alert(data)
+        if not is_valid:
+            return create_api_response(False, message=error_msg, status_code=400)
         
         # Create alert record
         alert_id = str(uuid.uuid4())
@@ -241,20 +589,34 @@ def create_safety_alert():
             'message': data['message'],
             'source_vehicle_id': data['vehicle_id'],
             'created_at': datetime.now().isoformat(),
-            'status': 'active',
-            'acknowledged_by': []
+            'status': 'active'
         }
         
-        # Store alert
-        safety_alerts.append(alert_record)
+        # Store alert, merging duplicate reports of the same hazard
+        alert, merged = alert_aggregator.ingest(alert_record)
+        alert_id = alert['alert_id']
+        if not merged:
+            # The TTL runs from the first report; merged reports do not extend it
+            expiry_manager.track_alert(alert_id)
+        if data['vehicle_id'] in vehicle_registry:
+            acknowledgements.acknowledge(alert_id, data['vehicle_id'])  # Reporters have seen the hazard
+        
+        if merged:
+            logger.info(f"Safety alert report from vehicle {data['vehicle_id']} merged into {alert_id}")
+            return create_api_response(
+                True,
+                data={'alert_id': alert_id, 'status': 'merged', 'reporter_count': alert['reporter_count']},
+                message="Safety alert merged into existing alert"
+            )
         
         logger.info(f"Safety alert {alert_id} created by vehicle {data['vehicle_id']}")
         
         # TODO: Implement real-time broadcast to nearby vehicles via SocketIO
+        # (only new canonical alerts need broadcasting; merged reports do not)
         
         return create_api_response(
             True,
-            data={'alert_id': alert_id, 'status': 'created'},
+            data={'alert_id': alert_id, 'status': 'created', 'reporter_count': 1},
             message="Safety alert created successfully"
         )
         
@@ -272,7 +634,7 @@ def get_safety_alerts():
         status_filter = request.args.get('status', 'active')
         
         # Filter alerts
-        filtered_alerts = safety_alerts.copy()
+        filtered_alerts = safety_alerts.snapshot()
         
         if severity_filter:
             filtered_alerts = [a for a in filtered_alerts if a.get('severity') == severity_filter]
@@ -286,6 +648,10 @@ def get_safety_alerts():
         # Sort by creation time (newest first)
         filtered_alerts.sort(key=lambda x: x['created_at'], reverse=True)
         
+        # Acknowledgements live in bitmaps, not in the alert records
+        filtered_alerts = [{**a, 'acknowledged_count': acknowledgements.count(a['alert_id'])}
+                           for a in filtered_alerts]
+        
         return create_api_response(
             True,
             data={
@@ -304,8 +670,163 @@ def get_safety_alerts():
         logger.error(f"Error retrieving safety alerts: {str(e)}")
         return create_api_response(False, message="Internal server error", status_code=500)
 
+@api_bp.route('/safety/alerts/<alert_id>/acknowledge', methods=['POST'])
+def acknowledge_safety_alert(alert_id: str):
+    """Record that a vehicle acknowledged a safety alert.
+    
+    Acknowledging the same alert again is a no-op.
+    
+    Expected JSON payload:
+    {
+        "vehicle_id": "string"
+    }
+    """
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return create_api_response(False, message="No JSON data provided", status_code=400)
+        
+        is_valid, error_msg = validate_acknowledgement(data)
+        if not is_valid:
+            return create_api_response(False, message=error_msg, status_code=400)
+        
+        vehicle_id = data['vehicle_id']
+        alert = safety_alerts.get(alert_id)
+        if alert is None:
+            return create_api_response(False, message="Alert not found", status_code=404)
+        if alert.get('status') == 'expired':
+            return create_api_response(False, message="Alert has expired", status_code=410)
+        if vehicle_id not in vehicle_registry:
+            return create_api_response(False, message="Vehicle not found", status_code=404)
+        
+        newly_acknowledged = acknowledgements.acknowledge(alert_id, vehicle_id)
+        if newly_acknowledged:
+            logger.info(f"Safety alert {alert_id} acknowledged by vehicle {vehicle_id}",
+                        extra={'event': 'alert_acknowledgement', 'alert_id': alert_id, 'vehicle_id': vehicle_id})
+        
+        return create_api_response(
+            True,
+            data={
+                'alert_id': alert_id,
+                'vehicle_id': vehicle_id,
+                'newly_acknowledged': newly_acknowledged,
+                'acknowledged_count': acknowledgements.count(alert_id)
+            },
+            message="Safety alert acknowledged"
+        )
+        
+    except Exception as e:
+        logger.error(f"Error acknowledging safety alert {alert_id}: {str(e)}")
+        return create_api_response(False, message="Internal server error", status_code=500)
+
+@api_bp.route('/safety/alerts/acknowledgements', methods=['POST'])
+def acknowledge_safety_alerts():
+    """Record many alert acknowledgements in one request.
+    
+    Valid items are recorded; invalid items and unknown alerts/vehicles are
+    reported by index.
+    
+    Expected JSON payload:
+    {
+        "acknowledgements": [
+            {"alert_id": "string", "vehicle_id": "string"}
+        ]
+    }
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or 'acknowledgements' not in data:
+            return create_api_response(False, message="Missing required field: acknowledgements", status_code=400)
+        
+        items = data['acknowledgements']
+        _, error_msg, item_errors = validate_acknowledgement_batch(items)
+        if error_msg:
+            return create_api_response(False, message=error_msg, status_code=400)
+        
+        invalid = {error['index'] for error in item_errors}
+        errors = list(item_errors)
+        pairs = []
+        for index, item in enumerate(items):
+            if index in invalid:
+                continue
+            alert = safety_alerts.get(item['alert_id'])
+            if alert is None:
+                errors.append({'index': index, 'error': "Alert not found"})
+            elif alert.get('status') == 'expired':
+                errors.append({'index': index, 'error': "Alert has expired"})
+            elif item['vehicle_id'] not in vehicle_registry:
+                errors.append({'index': index, 'error': "Vehicle not found"})
+            else:
+                pairs.append((item['alert_id'], item['vehicle_id']))
+        errors.sort(key=lambda e: e['index'])
+        
+        new = sum(acknowledgements.acknowledge_many(pairs))
+        
+        logger.info(f"Bulk acknowledgement recorded {new} new of {len(items)} acknowledgements")
+        
+        return create_api_response(
+            not errors,
+            data={
+                'acknowledged': len(pairs),
+                'newly_acknowledged': new,
+                'rejected': len(errors),
+                'errors': errors
+            },
+            message="Bulk acknowledgement processed",
+            status_code=200 if pairs or not errors else 400
+        )
+        
+    except Exception as e:
+        logger.error(f"Error recording bulk acknowledgements: {str(e)}")
+        return create_api_response(False, message="Internal server error", status_code=500)
+
+@api_bp.route('/safety/alerts/<alert_id>/unacknowledged', methods=['GET'])
+def get_unacknowledged_vehicles(alert_id: str):
+    """Get vehicles near an alert that have not acknowledged it.
+    
+    Drives re-broadcast decisions for the human-in-the-loop verification flow.
+    
+    Query parameters:
+        radius: Search radius in meters around the alert position
+            (default: the alert's own radius)
+    """
+    try:
+        alert = safety_alerts.get(alert_id)
+        if alert is None:
+            return create_api_response(False, message="Alert not found", status_code=404)
+        if alert.get('status') == 'expired':
+            return create_api_response(False, message="Alert has expired", status_code=410)
+        
+        radius = request.args.get('radius', float(alert.get('radius', 100)), type=float)
+        if not 0 < radius <= 10000:
+            return create_api_response(False, message="radius must be between 0 and 10000 meters", status_code=400)
+        
+        position = alert['position']
+        nearby = nearby_vehicles(position['lat'], position['lon'], radius)
+        vehicles = acknowledgements.unacknowledged(alert_id, nearby)
+        
+        return create_api_response(
+            True,
+            data={
+                'alert_id': alert_id,
+                'vehicles': vehicles,
+                'count': len(vehicles),
+                'nearby_count': len(nearby),
+                'acknowledged_count': acknowledgements.count(alert_id),
+                'radius': radius
+            },
+            message="Unacknowledged vehicles retrieved successfully"
+        )
+        
+    except Exception as e:
+        logger.error(f"Error retrieving unacknowledged vehicles for alert {alert_id}: {str(e)}")
+        return create_api_response(False, message="Internal server error", status_code=500)
+
 # Communication and Messaging Endpoints
 @api_bp.route('/communication/send', methods=['POST'])
+@rate_limited(rate_limits, 'v2v_message', json_field('sender_id'), rate_limit_exceeded)
 def send_v2v_message():
     """Send a V2V communication message.
     
@@ -324,11 +845,10 @@ def send_v2v_message():
         if not data:
             return create_api_response(False, message="No JSON data provided", status_code=400)
         
-        # Validate required fields
-        required_fields = ['sender_id', 'recipient_id', 'message_type', 'payload']
-        for field in required_fields:
-            if field not in data:
-                return create_api_response(False, message=f"Missing required field: {field}", status_code=400)
+        # Validate fields
+        is_valid, error_msg = validate_v2v_message(data)
+        if not is_valid:
+            return create_api_response(False, message=error_msg, status_code=400)
         
         # Create message record
         message_id = str(uuid.uuid4())
@@ -346,7 +866,9 @@ def send_v2v_message():
         # Store communication log
         communication_logs.append(message_record)
         
-        logger.info(f"V2V message {message_id} sent from {data['sender_id']} to {data['recipient_id']}")
+        logger.info(f"V2V message {message_id} sent from {data['sender_id']} to {data['recipient_id']}",
+                    extra={'event': 'v2v_message', 'message_id': message_id,
+                           'sender_id': data['sender_id'], 'recipient_id': data['recipient_id']})
         
         # TODO: Implement actual message delivery via SocketIO
         
@@ -360,6 +882,79 @@ def send_v2v_message():
         logger.error(f"Error sending V2V message: {str(e)}")
         return create_api_response(False, message="Internal server error", status_code=500)
 
+# Decision Endpoints
+@api_bp.route('/decisions', methods=['POST'])
+def get_decision():
+    """Get a collision-avoidance action for one state vector.
+    
+    Expected JSON payload:
+    {
+        "state": [distance, relative_speed, angle, road_type, weather,
+                  time_of_day, driver_attention, collision_probability],
+        "agent": "dqn|rule"
+    }
+    """
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return create_api_response(False, message="No JSON data provided", status_code=400)
+        
+        is_valid, error_msg = validate_decision_request(data)
+        if not is_valid:
+            return create_api_response(False, message=error_msg, status_code=400)
+        
+        decision = decision_service.decide(data['state'], data.get('agent', 'dqn'))
+        
+        return create_api_response(
+            True,
+            data=decision,
+            message="Decision computed successfully"
+        )
+        
+    except ModelUnavailableError as e:
+        return create_api_response(False, message=str(e), status_code=503)
+    except Exception as e:
+        logger.error(f"Error computing decision: {str(e)}")
+        return create_api_response(False, message="Internal server error", status_code=500)
+
+# Export Endpoints
+EXPORTABLE_LOGS = {
+    'communication_logs': (communication_logs, 'timestamp'),
+    'safety_alerts': (safety_alerts, 'created_at')
+}
+
+@api_bp.route('/export/<log_name>', methods=['GET'])
+def export_log(log_name: str):
+    """Stream a record log as NDJSON, one record per line.
+    
+    Args:
+        log_name: 'communication_logs' or 'safety_alerts'
+        
+    Query parameters:
+        since: Inclusive ISO-8601 lower bound on the record timestamp
+        until: Exclusive ISO-8601 upper bound on the record timestamp
+    """
+    if log_name not in EXPORTABLE_LOGS:
+        return create_api_response(False, message=f"Unknown log: {log_name}", status_code=404)
+    
+    try:
+        since = parse_time_bound(request.args.get('since'))
+        until = parse_time_bound(request.args.get('until'))
+    except ValueError:
+        return create_api_response(False, message="since/until must be ISO-8601 timestamps", status_code=400)
+    
+    store, time_field = EXPORTABLE_LOGS[log_name]
+    records = filter_time_range(store.snapshot(), time_field, since, until)
+    
+    logger.info(f"Streaming export of {log_name} (since={since}, until={until})")
+    
+    return Response(
+        iter_ndjson_chunks(records),
+        mimetype='application/x-ndjson',
+        headers={'Content-Disposition': f'attachment; filename={log_name}.ndjson'}
+    )
+
 # Error Handlers
 @api_bp.errorhandler(404)
 def not_found(error):
@@ -0,0 +1,299 @@
+"""Thread-safe In-Memory Stores for V2V Safety Ecosystem
+
+This module provides the concurrency-safe storage used by the API routes while
+the application runs with ``async_mode='threading'``. Two structures are provided:
+
+- ``VehicleRegistry``: vehicle records partitioned into shards, each guarded by its
+  own lock (lock striping keyed by vehicle_id), so updates to different vehicles
+  do not serialize on one global lock. Under the GIL this matters once work
+  done under a lock releases the GIL (see benchmarks/bench_registry_contention.py).
+- ``RecordLog``: an insertion-ordered log (safety alerts, communication logs)
+  whose readers take lock-free snapshots while writers serialize on a single
+  lock. Removed records are compacted away in batches.
+
+Records are copy-on-write: a stored record dict is never mutated after it is
+published. Updates build a new dict and swap it in, so a reader holding a record
+or a snapshot always sees a consistent view without locking.
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Number of lock stripes; a power of two comfortably above typical thread counts
+DEFAULT_STRIPES = 64
+
+
+class VehicleRegistry:
+    """Vehicle records keyed by vehicle_id, sharded behind striped locks.
+
+    Each vehicle_id hashes to exactly one shard. Writers lock only that shard;
+    readers get the published record object, which is never mutated in place.
+
+    Attributes:
+        stripes (int): Number of shards/locks
+    """
+
+    def __init__(self, stripes: int = DEFAULT_STRIPES):
+        """Initialize the registry.
+
+        Args:
+            stripes: Number of independent shards (default: 64)
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        self.stripes = stripes
+        self._shards = tuple({} for _ in range(stripes))
+        self._locks = tuple(threading.Lock() for _ in range(stripes))
+
+    def _slot(self, vehicle_id: str) -> int:
+        return hash(vehicle_id) % self.stripes
+
+    def lock_for(self, vehicle_id: str) -> threading.Lock:
+        """Return the stripe lock guarding ``vehicle_id``.
+
+        Args:
+            vehicle_id: Unique vehicle identifier
+
+        Returns:
+            Lock shared by every vehicle in the same shard
+        """
+        return self._locks[self._slot(vehicle_id)]
+
+    def __contains__(self, vehicle_id: str) -> bool:
+        return vehicle_id in self._shards[self._slot(vehicle_id)]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def get(self, vehicle_id: str) -> Optional[Dict[str, Any]]:
+        """Return the current record for a vehicle, or None.
+
+        Args:
+            vehicle_id: Unique vehicle identifier
+
+        Returns:
+            Published (read-only by convention) vehicle record
+        """
+        return self._shards[self._slot(vehicle_id)].get(vehicle_id)
+
+    def put(self, vehicle_id: str, record: Dict[str, Any]) -> None:
+        """Insert or replace a vehicle record.
+
+        Args:
+            vehicle_id: Unique vehicle identifier
+            record: Vehicle record; must not be mutated by the caller afterwards
+        """
+        slot = self._slot(vehicle_id)
+        with self._locks[slot]:
+            self._shards[slot][vehicle_id] = record
+
+    def update(self, vehicle_id: str, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Atomically merge ``fields`` into a vehicle record (copy-on-write).
+
+        Args:
+            vehicle_id: Unique vehicle identifier
+            fields: Fields to overwrite
+
+        Returns:
+            The new record, or None if the vehicle is not registered
+        """
+        return self.modify(vehicle_id, lambda current: {**current, **fields})
+
+    def modify(self, vehicle_id: str,
+               fn: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Atomically replace a vehicle record with ``fn(current)``.
+
+        Args:
+            vehicle_id: Unique vehicle identifier
+            fn: Function returning the new record; must not mutate its argument
+
+        Returns:
+            The new record, or None if the vehicle is not registered
+        """
+        slot = self._slot(vehicle_id)
+        shard = self._shards[slot]
+        with self._locks[slot]:
+            current = shard.get(vehicle_id)
+            if current is None:
+                return None
+            record = fn(current)
+            shard[vehicle_id] = record
+        return record
+
+    def remove(self, vehicle_id: str) -> Optional[Dict[str, Any]]:
+        """Remove a vehicle record.
+
+        Args:
+            vehicle_id: Unique vehicle identifier
+
+        Returns:
+            The removed record, or None if the vehicle was not registered
+        """
+        slot = self._slot(vehicle_id)
+        with self._locks[slot]:
+            return self._shards[slot].pop(vehicle_id, None)
+
+    def remove_if(self, vehicle_id: str,
+                  predicate: Callable[[Dict[str, Any]], bool]) -> Optional[Dict[str, Any]]:
+        """Atomically remove a vehicle record if ``predicate(current)`` holds.
+
+        Args:
+            vehicle_id: Unique vehicle identifier
+            predicate: Check run on the current record under the stripe lock
+
+        Returns:
+            The removed record, or None if the vehicle was kept or not registered
+        """
+        slot = self._slot(vehicle_id)
+        shard = self._shards[slot]
+        with self._locks[slot]:
+            current = shard.get(vehicle_id)
+            if current is None or not predicate(current):
+                return None
+            return shard.pop(vehicle_id)
+
+    def values(self) -> List[Dict[str, Any]]:
+        """Return a snapshot list of all vehicle records.
+
+        Shards are copied one at a time, so the snapshot never blocks writers
+        on more than one shard.
+
+        Returns:
+            List of published vehicle records
+        """
+        records = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                records.extend(shard.values())
+        return records
+
+
+class RecordLog:
+    """Record log with copy-on-write updates, removal and lock-free snapshots.
+
+    Writers (append/update/remove) serialize on one lock; readers never take it.
+    The backing list and its key index are published together as one tuple, so
+    a reader always sees a list/index pair that belong together. Removed records
+    leave a ``None`` tombstone; once tombstones make up half of the list, it is
+    compacted into a fresh list/index pair that replaces the published one.
+
+    Attributes:
+        key_field (str): Record field used as the unique lookup key
+    """
+
+    def __init__(self, key_field: str, compact_min: int = 64):
+        """Initialize the log.
+
+        Args:
+            key_field: Name of the unique id field of each record
+            compact_min: Tombstones tolerated before compaction is considered
+        """
+        self.key_field = key_field
+        self.compact_min = compact_min
+        self._state = ([], {})  # (records, key -> position)
+        self._tombstones = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._state[0]) - self._tombstones
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.snapshot())
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a record to the log.
+
+        Args:
+            record: Record dict containing ``key_field``
+        """
+        with self._lock:
+            records, index = self._state
+            # Publish the record before its index entry so lock-free readers
+            # never see a position past the end of the list
+            records.append(record)
+            index[record[self.key_field]] = len(records) - 1
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the current record for ``key``, or None.
+
+        Args:
+            key: Record id
+
+        Returns:
+            Published record
+        """
+        records, index = self._state
+        position = index.get(key)
+        if position is None:
+            return None
+        return records[position]
+
+    def update(self, key: str, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Atomically merge ``fields`` into a record (copy-on-write).
+
+        Args:
+            key: Record id
+            fields: Fields to overwrite
+
+        Returns:
+            The new record, or None if ``key`` is unknown
+        """
+        return self.modify(key, lambda current: {**current, **fields})
+
+    def modify(self, key: str, fn: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Atomically replace a record with ``fn(current)``.
+
+        Args:
+            key: Record id
+            fn: Function returning the new record; must not mutate its argument
+
+        Returns:
+            The new record, or None if ``key`` is unknown
+        """
+        with self._lock:
+            records, index = self._state
+            position = index.get(key)
+            if position is None:
+                return None
+            record = fn(records[position])
+            records[position] = record
+        return record
+
+    def remove(self, key: str) -> Optional[Dict[str, Any]]:
+        """Remove a record, compacting the log when tombstones pile up.
+
+        Args:
+            key: Record id
+
+        Returns:
+            The removed record, or None if ``key`` is unknown
+        """
+        with self._lock:
+            records, index = self._state
+            position = index.pop(key, None)
+            if position is None:
+                return None
+            record = records[position]
+            records[position] = None
+            self._tombstones += 1
+            if self._tombstones >= max(self.compact_min, len(records) // 2):
+                self._compact()
+        return record
+
+    def _compact(self) -> None:
+        records = [record for record in self._state[0] if record is not None]
+        index = {record[self.key_field]: position for position, record in enumerate(records)}
+        self._state = (records, index)
+        self._tombstones = 0
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Return a point-in-time copy of the log without taking the writer lock.
+
+        Returns:
+            List of published records in insertion order
+        """
+        return [record for record in self._state[0][:] if record is not None]
@@ -0,0 +1,158 @@
+"""Per-Vehicle Trajectory History for V2V Safety Ecosystem
+
+This module keeps a bounded motion history for every registered vehicle so that
+prediction, acceleration estimates and replays have more than the last reported
+state to work with.
+
+Each vehicle gets a fixed-capacity ring buffer of (timestamp, lat, lon, speed,
+heading) samples stored in one packed ``array('d')`` — 40 bytes per sample and
+no per-sample Python objects — so the memory cost per vehicle is fixed at
+``capacity * 40`` bytes plus a small constant.
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import threading
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+FIELDS = ('timestamp', 'lat', 'lon', 'speed', 'heading')
+WIDTH = len(FIELDS)
+
+Sample = Tuple[float, float, float, float, float]
+
+
+class TrajectoryBuffer:
+    """Fixed-capacity ring buffer of motion samples in a packed double array.
+
+    Attributes:
+        capacity (int): Maximum number of samples retained
+    """
+
+    __slots__ = ('capacity', '_data', '_next', '_size')
+
+    def __init__(self, capacity: int):
+        """Initialize the buffer.
+
+        Args:
+            capacity: Maximum number of samples retained
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._data = array('d', bytes(8 * WIDTH * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the sample storage."""
+        return self._data.itemsize * len(self._data)
+
+    def append(self, timestamp: float, lat: float, lon: float, speed: float, heading: float) -> None:
+        """Append a sample, overwriting the oldest one when full."""
+        data = self._data
+        offset = self._next * WIDTH
+        data[offset] = timestamp
+        data[offset + 1] = lat
+        data[offset + 2] = lon
+        data[offset + 3] = speed
+        data[offset + 4] = heading
+        self._next = (self._next + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def samples(self, limit: Optional[int] = None) -> List[Sample]:
+        """Return the most recent samples in chronological order.
+
+        Args:
+            limit: Maximum number of samples (default: all retained)
+
+        Returns:
+            List of (timestamp, lat, lon, speed, heading) tuples, oldest first
+        """
+        count = self._size if limit is None else max(0, min(limit, self._size))
+        start = (self._next - count) % self.capacity
+        data = self._data
+        result = []
+        for i in range(count):
+            offset = ((start + i) % self.capacity) * WIDTH
+            result.append(tuple(data[offset:offset + WIDTH]))
+        return result
+
+    def latest(self) -> Optional[Sample]:
+        """Return the newest sample, or None if empty."""
+        if not self._size:
+            return None
+        offset = ((self._next - 1) % self.capacity) * WIDTH
+        return tuple(self._data[offset:offset + WIDTH])
+
+
+class TrajectoryStore:
+    """Trajectory buffers keyed by vehicle_id, guarded by striped locks.
+
+    Attributes:
+        capacity (int): Samples retained per vehicle
+    """
+
+    def __init__(self, capacity: int = 120, stripes: int = 64):
+        """Initialize the store.
+
+        Args:
+            capacity: Samples retained per vehicle (default: 120)
+            stripes: Number of lock stripes (default: 64)
+        """
+        self.capacity = capacity
+        self._buffers: Dict[str, TrajectoryBuffer] = {}
+        self._locks = tuple(threading.Lock() for _ in range(stripes))
+
+    def _lock(self, vehicle_id: str) -> threading.Lock:
+        return self._locks[hash(vehicle_id) % len(self._locks)]
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def __contains__(self, vehicle_id: str) -> bool:
+        return vehicle_id in self._buffers
+
+    def record(self, vehicle_id: str, timestamp: float, lat: float, lon: float,
+               speed: float, heading: float) -> None:
+        """Append a motion sample to a vehicle's history.
+
+        Args:
+            vehicle_id: Unique vehicle identifier
+            timestamp: Sample time (epoch seconds)
+            lat, lon: Position (degrees)
+            speed: Speed (m/s)
+            heading: Heading (degrees)
+        """
+        with self._lock(vehicle_id):
+            buffer = self._buffers.get(vehicle_id)
+            if buffer is None:
+                buffer = self._buffers[vehicle_id] = TrajectoryBuffer(self.capacity)
+            buffer.append(timestamp, lat, lon, speed, heading)
+
+    def track(self, vehicle_id: str, limit: Optional[int] = None) -> Optional[List[Sample]]:
+        """Return a vehicle's recent samples, oldest first, or None if unknown.
+
+        Args:
+            vehicle_id: Unique vehicle identifier
+            limit: Maximum number of samples
+        """
+        with self._lock(vehicle_id):
+            buffer = self._buffers.get(vehicle_id)
+            return None if buffer is None else buffer.samples(limit)
+
+    def discard(self, vehicle_id: str) -> None:
+        """Drop a vehicle's history."""
+        with self._lock(vehicle_id):
+            self._buffers.pop(vehicle_id, None)
+
+    def memory_bytes(self) -> int:
+        """Total bytes used by sample storage across all vehicles."""
+        return sum(buffer.nbytes for buffer in list(self._buffers.values()))
@@ -0,0 +1,258 @@
+"""Request Validation Module for V2V Safety Ecosystem
+
+This module defines declarative schemas for the API payloads and compiles them,
+once at import time, into validator functions. A compiled validator is a flat
+tuple of specialized per-field checks: no schema interpretation, option lookups
+or intermediate allocations happen per request, only the checks that field needs.
+
+Every validator returns the ``(is_valid, error_message)`` tuple used throughout
+``api/routes.py``.
+
+Example:
+    validate = compile_schema({'speed': Field(NUMBER, min_value=0)})
+    is_valid, error_msg = validate({'speed': 12.5})
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Type groups accepted by Field
+NUMBER = (int, float)
+STRING = (str,)
+OBJECT = (dict,)
+ARRAY = (list,)
+
+_TYPE_NAMES = {NUMBER: 'a number', STRING: 'a string', OBJECT: 'an object', ARRAY: 'an array'}
+
+_MISSING = object()
+
+Validator = Callable[[Any], Tuple[bool, Optional[str]]]
+
+
+class Field:
+    """Declarative rule for one payload field.
+
+    Attributes:
+        types (tuple): Accepted Python types (NUMBER, STRING, OBJECT, ARRAY)
+        required (bool): Whether the field must be present
+        min_value (float): Inclusive lower bound for numbers
+        max_value (float): Inclusive upper bound for numbers
+        choices (tuple): Allowed values
+        schema (dict): Nested schema for OBJECT fields
+        length (int): Exact length for ARRAY fields
+        item_types (tuple): Accepted types of every ARRAY item
+        finite (bool): Reject NaN and infinite numbers (the value or ARRAY items)
+        message (str): Error message overriding the missing/wrong-type messages
+    """
+
+    __slots__ = ('types', 'required', 'min_value', 'max_value', 'choices', 'schema',
+                 'length', 'item_types', 'finite', 'message')
+
+    def __init__(self, types: tuple, required: bool = True, min_value: float = None,
+                 max_value: float = None, choices: tuple = None,
+                 schema: Dict[str, 'Field'] = None, length: int = None,
+                 item_types: tuple = None, finite: bool = False, message: str = None):
+        self.types = types
+        self.required = required
+        self.min_value = min_value
+        self.max_value = max_value
+        self.choices = tuple(choices) if choices is not None else None
+        self.schema = schema
+        self.length = length
+        self.item_types = item_types
+        self.finite = finite
+        self.message = message
+
+
+def _compile_field(name: str, path: str, field: Field) -> Callable[[dict], Optional[str]]:
+    """Build a single specialized check for ``field``.
+
+    Returns:
+        Function taking the parent object and returning an error message or None
+    """
+    types = field.types
+    # bool is a subclass of int; only accept it when asked for explicitly
+    reject_bool = int in types and bool not in types
+    type_error = field.message or f"Field '{path}' must be {_TYPE_NAMES.get(types, '/'.join(t.__name__ for t in types))}"
+    missing_error = field.message or f"Missing required field: {path}"
+    required = field.required
+    low, high = field.min_value, field.max_value
+    choices = field.choices
+    nested = _compile_checks(field.schema, path + '.') if field.schema else ()
+    length = field.length
+    length_error = f"Field '{path}' must have exactly {length} items"
+    item_types = field.item_types
+    reject_bool_items = item_types is not None and int in item_types and bool not in item_types
+    item_error = f"Field '{path}' items must be {_TYPE_NAMES.get(item_types, 'valid')}"
+    finite = field.finite
+    finite_error = f"Field '{path}' must contain only finite numbers"
+
+    if low is not None and high is not None:
+        range_error = f"Field '{path}' must be between {low} and {high}"
+    elif low is not None:
+        range_error = f"Field '{path}' must be at least {low}"
+    else:
+        range_error = f"Field '{path}' must be at most {high}"
+    choices_error = f"Field '{path}' must be one of: {', '.join(map(str, choices or ()))}"
+    has_range = low is not None or high is not None
+    low = float('-inf') if low is None else low
+    high = float('inf') if high is None else high
+
+    def check(obj: dict) -> Optional[str]:
+        value = obj.get(name, _MISSING)
+        if value is _MISSING:
+            return missing_error if required else None
+        if not isinstance(value, types) or (reject_bool and value.__class__ is bool):
+            return type_error
+        if finite and value.__class__ is float and not math.isfinite(value):
+            return finite_error
+        if has_range and not low <= value <= high:
+            return range_error
+        if choices is not None and value not in choices:
+            return choices_error
+        if length is not None and len(value) != length:
+            return length_error
+        if item_types is not None:
+            for item in value:
+                if not isinstance(item, item_types) or (reject_bool_items and item.__class__ is bool):
+                    return item_error
+                if finite and item.__class__ is float and not math.isfinite(item):
+                    return finite_error
+        for nested_check in nested:
+            error = nested_check(value)
+            if error is not None:
+                return error
+        return None
+
+    return check
+
+
+def _compile_checks(schema: Dict[str, Field], prefix: str = '') -> tuple:
+    return tuple(_compile_field(name, prefix + name, field) for name, field in schema.items())
+
+
+def compile_schema(schema: Dict[str, Field]) -> Validator:
+    """Compile a declarative schema into a validator.
+
+    Args:
+        schema: Mapping of field name to Field rule
+
+    Returns:
+        Function ``validate(data) -> (is_valid, error_message)``
+    """
+    checks = _compile_checks(schema)
+
+    def validate(data: Any) -> Tuple[bool, Optional[str]]:
+        if not isinstance(data, dict):
+            return False, "Payload must be a JSON object"
+        for check in checks:
+            error = check(data)
+            if error is not None:
+                return False, error
+        return True, None
+
+    return validate
+
+
+def compile_batch_validator(item_validator: Validator, max_items: int = 1000) -> Callable:
+    """Build a validator for a list of records sharing one item validator.
+
+    Args:
+        item_validator: Compiled validator applied to every item
+        max_items: Maximum batch length
+
+    Returns:
+        Function ``validate(items) -> (is_valid, error_message, item_errors)`` where
+        ``item_errors`` lists ``{'index': int, 'error': str}`` for invalid items
+    """
+    def validate(items: Any) -> Tuple[bool, Optional[str], List[Dict[str, Any]]]:
+        if not isinstance(items, list):
+            return False, "Batch must be a JSON array", []
+        if len(items) > max_items:
+            return False, f"Batch exceeds maximum of {max_items} items", []
+        item_errors = []
+        for index, item in enumerate(items):
+            is_valid, error = item_validator(item)
+            if not is_valid:
+                item_errors.append({'index': index, 'error': error})
+        return not item_errors, None, item_errors
+
+    return validate
+
+
+# Shared field rules
+POSITION_MESSAGE = "Position must contain 'lat' and 'lon' coordinates"
+POSITION = Field(OBJECT, schema={
+    'lat': Field(NUMBER, min_value=-90.0, max_value=90.0, message=POSITION_MESSAGE),
+    'lon': Field(NUMBER, min_value=-180.0, max_value=180.0, message=POSITION_MESSAGE)
+})
+SPEED = Field(NUMBER, min_value=0.0, max_value=150.0)          # m/s
+HEADING = Field(NUMBER, min_value=0.0, max_value=360.0)        # degrees
+SEVERITIES = ('low', 'medium', 'high', 'critical')
+PRIORITIES = ('low', 'medium', 'high')
+REPORTING_MODES = ('periodic', 'adaptive')
+DECISION_AGENTS = ('dqn', 'rule')
+# Statuses a vehicle may report; 'stale' is set only by the expiry manager
+VEHICLE_STATUSES = ('active', 'inactive', 'maintenance', 'emergency')
+
+# Endpoint schemas
+VEHICLE_REGISTRATION_SCHEMA = {
+    'vehicle_id': Field(STRING),
+    'position': POSITION,
+    'speed': SPEED,
+    'heading': HEADING,
+    'vehicle_type': Field(STRING, required=False),
+    'capabilities': Field(ARRAY, required=False),
+    'reporting_mode': Field(STRING, required=False, choices=REPORTING_MODES)
+}
+
+VEHICLE_UPDATE_SCHEMA = {
+    'position': Field(OBJECT, required=False, schema=POSITION.schema),
+    'speed': Field(NUMBER, required=False, min_value=SPEED.min_value, max_value=SPEED.max_value),
+    'heading': Field(NUMBER, required=False, min_value=HEADING.min_value, max_value=HEADING.max_value),
+    'status': Field(STRING, required=False, choices=VEHICLE_STATUSES)
+}
+
+VEHICLE_BATCH_UPDATE_SCHEMA = {'vehicle_id': Field(STRING), **VEHICLE_UPDATE_SCHEMA}
+
+SAFETY_ALERT_SCHEMA = {
+    'alert_type': Field(STRING),
+    'severity': Field(STRING, choices=SEVERITIES),
+    'position': POSITION,
+    'radius': Field(NUMBER, required=False, min_value=1.0, max_value=10000.0),  # meters
+    'message': Field(STRING),
+    'vehicle_id': Field(STRING)
+}
+
+V2V_MESSAGE_SCHEMA = {
+    'sender_id': Field(STRING),
+    'recipient_id': Field(STRING),
+    'message_type': Field(STRING),
+    'payload': Field(OBJECT),
+    'priority': Field(STRING, required=False, choices=PRIORITIES)
+}
+
+DECISION_SCHEMA = {
+    'state': Field(ARRAY, length=8, item_types=NUMBER, finite=True),
+    'agent': Field(STRING, required=False, choices=DECISION_AGENTS)
+}
+
+ACKNOWLEDGEMENT_SCHEMA = {
+    'vehicle_id': Field(STRING)
+}
+
+ACKNOWLEDGEMENT_BATCH_SCHEMA = {'alert_id': Field(STRING), **ACKNOWLEDGEMENT_SCHEMA}
+
+# Compiled validators
+validate_vehicle_registration = compile_schema(VEHICLE_REGISTRATION_SCHEMA)
+validate_vehicle_update = compile_schema(VEHICLE_UPDATE_SCHEMA)
+validate_safety_alert = compile_schema(SAFETY_ALERT_SCHEMA)
+validate_v2v_message = compile_schema(V2V_MESSAGE_SCHEMA)
+validate_vehicle_batch_update = compile_batch_validator(compile_schema(VEHICLE_BATCH_UPDATE_SCHEMA))
+validate_decision_request = compile_schema(DECISION_SCHEMA)
+validate_acknowledgement = compile_schema(ACKNOWLEDGEMENT_SCHEMA)
+validate_acknowledgement_batch = compile_batch_validator(compile_schema(ACKNOWLEDGEMENT_BATCH_SCHEMA))
@@ -10,7 +10,6 @@ Version: 1.0.0
 """
 
 from flask import Flask
-from flask_socketio import SocketIO
 from flask_cors import CORS
 import os
 import logging
@@ -19,13 +18,13 @@ from datetime import datetime
 # Import blueprints (will be created later)
 from api.routes import api_bp
 from api.health import health_bp
-from socketio_handlers import init_socketio
+from api.admin import admin_bp
+from api.profiling import profiler
+from api.logging_pipeline import configure_logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: records are queued and written by a background thread,
+# high-volume events are sampled (see api/logging_pipeline.py)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 def create_app(config_name='development'):
@@ -57,6 +56,10 @@ def create_app(config_name='development'):
     # Register blueprints
     app.register_blueprint(health_bp, url_prefix='/health')
     app.register_blueprint(api_bp, url_prefix='/api')
+    app.register_blueprint(admin_bp, url_prefix='/admin')
+    
+    # Request hooks for the on-demand sampling profiler (idle unless started via /admin)
+    profiler.install(app)
     
     logger.info(f"Flask app created successfully in {config_name} mode")
     return app
@@ -67,6 +70,11 @@ def create_socketio_app():
     Returns:
         tuple: (Flask app, SocketIO instance)
     """
+    # Socket.IO and its handlers are only imported when a realtime server is built
+    from flask_socketio import SocketIO
+    from socketio_handlers import init_socketio
+    from sockets import SOCKET_CONFIG
+    
     app = create_app()
     
     # Initialize SocketIO with CORS settings
@@ -77,8 +85,8 @@ def create_socketio_app():
             "http://localhost:8080"
         ],
         async_mode='threading',
-        logger=True,
-        engineio_logger=True
+        logger=SOCKET_CONFIG['logger'],
+        engineio_logger=SOCKET_CONFIG['engineio_logger']
     )
     
     # Initialize socket handlers
@@ -0,0 +1,86 @@
+"""Adaptive Reporting Benchmark
+
+Simulates vehicles driving with random acceleration and steering, sampled at a
+fixed rate, and compares the number of reports a periodic client sends with an
+``AdaptiveReporter`` client. Also reports the server-side prediction error the
+adaptive mode leaves between reports.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_dead_reckoning --vehicles 200 --seconds 120
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import argparse
+import json
+import random
+
+from api.dead_reckoning import AdaptiveReporter, predict_from_history
+from api.geo import distance_m, offset_position
+from api.trajectory import TrajectoryBuffer
+
+
+def simulate(vehicles: int, seconds: float, rate_hz: float, threshold_m: float, seed: int) -> dict:
+    """Run the comparison and return summary statistics."""
+    rng = random.Random(seed)
+    dt = 1.0 / rate_hz
+    steps = int(seconds * rate_hz)
+    periodic_reports = adaptive_reports = 0
+    errors = []
+
+    for _ in range(vehicles):
+        lat, lon = 42.33 + rng.uniform(-0.05, 0.05), -83.05 + rng.uniform(-0.05, 0.05)
+        speed, heading = rng.uniform(5, 30), rng.uniform(0, 360)
+        acceleration, turn_rate = 0.0, 0.0
+        reporter = AdaptiveReporter(threshold_m=threshold_m)
+        server_view = TrajectoryBuffer(2)
+
+        for step in range(steps):
+            now = step * dt
+            # Driver changes behaviour every few seconds
+            if rng.random() < dt / 4.0:
+                acceleration = rng.uniform(-2.0, 1.5)
+                turn_rate = rng.choice((0.0, 0.0, rng.uniform(-8, 8)))
+            speed = min(max(speed + acceleration * dt, 0.0), 35.0)
+            heading = (heading + turn_rate * dt) % 360.0
+            lat, lon = offset_position(lat, lon, speed * dt, heading)
+
+            periodic_reports += 1
+            if reporter.should_report(now, lat, lon, speed, heading):
+                adaptive_reports += 1
+                server_view.append(now, lat, lon, speed, heading)
+            else:
+                predicted = predict_from_history(server_view.samples(), now)
+                errors.append(distance_m(predicted['lat'], predicted['lon'], lat, lon))
+
+    errors.sort()
+    return {
+        'vehicles': vehicles,
+        'update_rate_hz': rate_hz,
+        'threshold_m': threshold_m,
+        'periodic_reports': periodic_reports,
+        'adaptive_reports': adaptive_reports,
+        'reduction_factor': round(periodic_reports / max(adaptive_reports, 1), 2),
+        'prediction_error_m': {
+            'mean': round(sum(errors) / len(errors), 3) if errors else 0.0,
+            'p99': round(errors[int(0.99 * (len(errors) - 1))], 3) if errors else 0.0
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaptive reporting benchmark")
+    parser.add_argument('--vehicles', type=int, default=200)
+    parser.add_argument('--seconds', type=float, default=120.0)
+    parser.add_argument('--rate', type=float, default=10.0, help="Periodic update rate (Hz)")
+    parser.add_argument('--threshold', type=float, default=5.0, help="Adaptive error threshold (m)")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    print(json.dumps(simulate(args.vehicles, args.seconds, args.rate, args.threshold, args.seed), indent=2))
+
+
+if __name__ == '__main__':
+    main()
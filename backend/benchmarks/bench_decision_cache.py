@@ -0,0 +1,139 @@
+"""Decision Cache Benchmark
+
+Simulates vehicles in steady car-following traffic, where the gap and closing
+speed drift slowly, and times greedy ``DQNAgent.act`` calls with and without
+the decision cache. Vehicles ask for a decision every step but their sensor
+state only changes every ``--report-every`` steps, so repeated states are what
+the cache can answer. Training steps are interleaved at a configurable rate to
+show the cost of invalidation.
+
+The cached agent must pick the same action as the uncached one for at least
+``--min-agreement`` of the decisions, or the benchmark exits with status 1.
+With the default exact cache keys (``--resolution 0``) that is every decision.
+A positive ``--resolution`` bins nearby states together; pass the agreement you
+accept for it, e.g. ``--resolution 0.01 --min-agreement 0.999``.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_decision_cache --vehicles 50 --steps 400 --cache-size 1024
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from rl_engine.dqn_agent import DQNAgent
+
+
+def steady_traffic(vehicles: int, steps: int, seed: int, report_every: int = 1) -> np.ndarray:
+    """Generate state sequences of shape (steps, vehicles, 8), time-major.
+
+    Each state is held for ``report_every`` steps before the next report.
+    """
+    rng = np.random.default_rng(seed)
+    gap = rng.uniform(20, 80, vehicles)
+    closing_speed = rng.normal(0, 1.0, vehicles)
+    angle = rng.uniform(-5, 5, vehicles)
+    road = rng.integers(0, 4, vehicles)
+    weather = rng.integers(0, 5, vehicles)
+    hour = rng.integers(0, 24, vehicles)
+
+    states = np.empty((steps, vehicles, 8))
+    for t in range(steps):
+        if t % report_every:
+            states[t] = states[t - 1]
+            continue
+        closing_speed = 0.9 * closing_speed + rng.normal(0, 0.3, vehicles)
+        gap = np.clip(gap - closing_speed * 0.1, 5, 150)
+        states[t] = np.column_stack([
+            gap, closing_speed, angle, road, weather, hour,
+            rng.uniform(0.8, 1.0, vehicles), np.clip(1.0 - gap / 50.0, 0.0, 1.0)
+        ])
+    return states
+
+
+def measure(agent: DQNAgent, states: np.ndarray, train_every: int) -> dict:
+    """Time greedy decisions over the workload, training every ``train_every`` steps."""
+    decisions = 0
+    elapsed = 0.0
+    actions = []
+    for t, step_states in enumerate(states):
+        step_list = step_states.tolist()
+        started = time.perf_counter()
+        for state in step_list:
+            actions.append(agent.act(state))
+        elapsed += time.perf_counter() - started
+        decisions += len(step_list)
+        if train_every and (t + 1) % train_every == 0:
+            agent.replay(32)
+            agent.epsilon = 0.0
+    return {
+        'decisions': decisions,
+        'us_per_decision': round(elapsed / decisions * 1e6, 2),
+        'actions': actions
+    }
+
+
+def build_agent(cache_size: int, memory_states: np.ndarray, seed: int, resolution: float = 0.0) -> DQNAgent:
+    """Create a greedy agent with a filled replay memory."""
+    agent = DQNAgent(seed=seed, decision_cache_size=cache_size, decision_cache_resolution=resolution)
+    rng = np.random.default_rng(seed)
+    for i in range(len(memory_states) - 1):
+        agent.remember(memory_states[i].tolist(), int(rng.integers(0, 5)), float(rng.normal()),
+                       memory_states[i + 1].tolist(), False)
+    agent.epsilon = 0.0
+    return agent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DQNAgent decision cache benchmark")
+    parser.add_argument('--vehicles', type=int, default=50)
+    parser.add_argument('--steps', type=int, default=400, help="Decisions per vehicle")
+    parser.add_argument('--cache-size', type=int, default=1024)
+    parser.add_argument('--train-every', type=int, default=0,
+                        help="Run one replay every N steps (0: inference only)")
+    parser.add_argument('--report-every', type=int, default=5,
+                        help="Steps between state changes of a vehicle")
+    parser.add_argument('--resolution', type=float, default=0.0,
+                        help="Cache key bin width in scaled units (0: exact states)")
+    parser.add_argument('--min-agreement', type=float, default=1.0,
+                        help="Required share of decisions matching the uncached agent")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    states = steady_traffic(args.vehicles, args.steps, args.seed, args.report_every)
+    memory_states = states.reshape(-1, 8)[:500]
+
+    uncached = measure(build_agent(0, memory_states, args.seed), states, args.train_every)
+    cached_agent = build_agent(args.cache_size, memory_states, args.seed, args.resolution)
+    cached = measure(cached_agent, states, args.train_every)
+
+    agreement = np.mean(np.asarray(uncached.pop('actions')) == np.asarray(cached.pop('actions')))
+    cache_stats = cached_agent.decision_cache.get_stats()
+    results = {
+        'vehicles': args.vehicles,
+        'steps': args.steps,
+        'train_every': args.train_every,
+        'report_every': args.report_every,
+        'resolution': args.resolution,
+        'uncached': uncached,
+        'cached': cached,
+        'hit_ratio': round(cache_stats['hit_ratio'], 4),
+        'invalidations': cache_stats['invalidations'],
+        'speedup': round(uncached['us_per_decision'] / cached['us_per_decision'], 2),
+        'action_agreement': round(float(agreement), 4)
+    }
+    print(json.dumps(results, indent=2))
+    if agreement < args.min_agreement:
+        print(f"Action agreement {agreement:.4f} is below --min-agreement {args.min_agreement}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
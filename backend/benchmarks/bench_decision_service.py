@@ -0,0 +1,90 @@
+"""Decision Service Latency Benchmark
+
+Drives the ``DecisionService`` from many concurrent client threads and reports
+per-request p50/p99 latency, throughput and the achieved mean batch size, once
+with batching disabled (``max_batch_size=1``, one ``act_batch`` call per
+request) and once per configured batching window.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_decision_service --clients 32 --requests 200
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import argparse
+import json
+import threading
+import time
+
+import numpy as np
+
+from api.decision_service import DecisionService
+from benchmarks.bench_dqn_training import random_states
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[int(fraction * (len(sorted_values) - 1))]
+
+
+def run(service: DecisionService, agent: str, clients: int, requests: int, states: np.ndarray) -> dict:
+    """Run ``clients`` threads issuing ``requests`` decisions each."""
+    service.decide(states[0].tolist(), agent)  # start the batcher and agent
+    latencies = [[] for _ in range(clients)]
+    barrier = threading.Barrier(clients + 1)
+
+    def client(index: int):
+        own = states[index::clients].tolist()
+        barrier.wait()
+        for i in range(requests):
+            started = time.perf_counter()
+            service.decide(own[i % len(own)], agent)
+            latencies[index].append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    merged = sorted(value for per_client in latencies for value in per_client)
+    stats = service.get_stats()[agent]
+    return {
+        'max_batch_size': service.max_batch_size,
+        'max_wait_ms': service.max_wait_ms,
+        'p50_ms': round(percentile(merged, 0.50) * 1000, 3),
+        'p99_ms': round(percentile(merged, 0.99) * 1000, 3),
+        'throughput_rps': round(len(merged) / elapsed),
+        'mean_batch_size': stats['mean_batch_size']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decision service latency under concurrent load")
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=200, help="Requests per client")
+    parser.add_argument('--agent', choices=DecisionService.AGENTS, default='dqn')
+    parser.add_argument('--windows', type=float, nargs='+', default=[0.5, 2.0],
+                        help="Batching windows to compare (ms)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    states = random_states(np.random.default_rng(args.seed), args.clients * 64)
+    configurations = [(1, 0.0)] + [(64, window) for window in args.windows]
+
+    results = {'clients': args.clients, 'requests_per_client': args.requests, 'agent': args.agent, 'runs': []}
+    for max_batch_size, max_wait_ms in configurations:
+        service = DecisionService(max_batch_size=max_batch_size, max_wait_ms=max_wait_ms, allow_untrained=True)
+        results['runs'].append(run(service, args.agent, args.clients, args.requests, states))
+        service.close()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""Logging Overhead Benchmark
+
+Measures the request-path cost of logging under different setups, writing
+to a real file:
+
+- ``disabled``: no log output (the floor)
+- ``sync_text``: synchronous text ``StreamHandler`` (the previous
+  ``logging.basicConfig`` setup)
+- ``async_json``: queue handler with JSON records, no sampling
+- ``async_json_sampled``: queue handler with the default per-event sampling
+  and rate caps
+
+For each setup it reports the cost of one tagged ``logger.info`` call on the
+calling thread, as CPU time (which excludes the listener thread's work) and as
+wall time. It also reports the latency of ``PUT /api/vehicles/<id>/update``
+through the Flask test client. The per-endpoint rate limiter is raised so
+every request is served. Run several ``--threads`` to include handler lock
+contention.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_logging --requests 20000 --threads 4
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+os.environ.setdefault('V2V_RATE_LIMIT_VEHICLE_UPDATE_RATE', '1000000')
+os.environ.setdefault('V2V_RATE_LIMIT_VEHICLE_UPDATE_BURST', '1000000')
+
+from api.logging_pipeline import DEFAULT_EVENT_POLICIES, configure_logging  # noqa: E402
+from app import create_app  # noqa: E402
+
+MODES = {
+    'disabled': None,
+    'sync_text': {'fmt': 'text', 'async_mode': False, 'policies': {}},
+    'async_json': {'fmt': 'json', 'async_mode': True, 'policies': {}},
+    'async_json_sampled': {'fmt': 'json', 'async_mode': True, 'policies': DEFAULT_EVENT_POLICIES}
+}
+LOG_CALLS = 20000
+
+
+def install(mode: str, stream):
+    """Configure the logging setup named ``mode``."""
+    options = MODES[mode]
+    if options is None:
+        return configure_logging(level='WARNING', async_mode=False, stream=stream)
+    return configure_logging(level='INFO', stream=stream, **options)
+
+
+def log_call_cost(mode: str, log_path: str) -> dict:
+    """Per-call CPU and wall time of a tagged vehicle update log call."""
+    log = logging.getLogger('api.routes')
+    with open(log_path, 'w') as stream:
+        pipeline = install(mode, stream)
+        cpu_started, wall_started = time.thread_time(), time.perf_counter()
+        for i in range(LOG_CALLS):
+            log.info(f"Vehicle bench-{i} status updated", extra={'event': 'vehicle_update', 'vehicle_id': 'bench-0'})
+        cpu = time.thread_time() - cpu_started
+        wall = time.perf_counter() - wall_started
+        pipeline.stop()
+    return {
+        'log_call_cpu_us': round(cpu / LOG_CALLS * 1e6, 2),
+        'log_call_wall_us': round(wall / LOG_CALLS * 1e6, 2)
+    }
+
+
+def run_requests(app, mode: str, requests: int, threads: int, vehicles: int, log_path: str) -> dict:
+    """Send ``requests`` updates over ``threads`` threads and time each one."""
+    with open(log_path, 'w') as stream:
+        pipeline = install(mode, stream)
+        latencies = []
+        lock = threading.Lock()
+
+        def worker(index: int):
+            client = app.test_client()
+            local = []
+            for i in range(index, requests, threads):
+                vehicle_id = f"bench-{i % vehicles}"
+                started = time.perf_counter()
+                client.put(f'/api/vehicles/{vehicle_id}/update', json={'speed': 12.0, 'heading': 90.0})
+                local.append(time.perf_counter() - started)
+            with lock:
+                latencies.extend(local)
+
+        started = time.perf_counter()
+        workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        elapsed = time.perf_counter() - started
+
+        stats = pipeline.get_stats()
+        pipeline.stop()  # Flush the queue before measuring the file
+
+    latencies.sort()
+    return {
+        'mean_us': round(statistics.mean(latencies) * 1e6, 1),
+        'p50_us': round(latencies[len(latencies) // 2] * 1e6, 1),
+        'p99_us': round(latencies[int(len(latencies) * 0.99)] * 1e6, 1),
+        'requests_per_second': round(requests / elapsed),
+        'log_lines': sum(1 for _ in open(log_path)),
+        'dropped': stats['dropped']
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Request-path logging overhead benchmark")
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--vehicles', type=int, default=200)
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+    args = parser.parse_args()
+
+    configure_logging(level='WARNING')
+    app = create_app()
+    client = app.test_client()
+    for i in range(args.vehicles):
+        client.post('/api/vehicles/register', json={
+            'vehicle_id': f"bench-{i}", 'position': {'lat': 40.0, 'lon': -74.0 + i * 1e-4},
+            'speed': 10.0, 'heading': 90.0
+        })
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.log')
+        results = {mode: {**log_call_cost(mode, path),
+                          **run_requests(app, mode, args.requests, args.threads, args.vehicles, path)}
+                   for mode in args.modes}
+
+    if 'disabled' in results:
+        floor = results['disabled']['mean_us']
+        for result in results.values():
+            result['overhead_us'] = round(result['mean_us'] - floor, 1)
+    print(json.dumps({'requests': args.requests, 'threads': args.threads, 'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
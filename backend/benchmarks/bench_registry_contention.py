@@ -0,0 +1,123 @@
+"""Registry Contention Benchmark
+
+Measures vehicle update throughput of ``VehicleRegistry`` as the number of
+writer threads grows, comparing lock striping against a single global lock
+(``stripes=1``). Readers snapshot ``RecordLog`` concurrently to show that
+copy-on-write reads do not block writers.
+
+Striping only pays off when a writer releases the GIL while it holds its lock.
+Pure-Python updates are serialized by the GIL anyway. ``--hold-ms`` makes
+each update sleep under its lock, standing in for I/O done inside the
+critical section. Measured on one core with CPython 3.11 (ops/s):
+
+    threads  hold_ms  global_lock  striped
+          1      0.0      352,263  318,208
+          4      0.0      305,730  338,631
+         16      0.0      185,311  300,660
+          1      0.2        3,141    2,928
+          4      0.2        2,755   12,005
+         16      0.2        2,986   50,540
+
+Without held work the two are within about 10% up to 4 threads. Striping
+avoids the global lock's convoy at 16 threads. With GIL-releasing work
+under the lock, the global lock caps throughput at about 1/hold_ms. Striped
+throughput grows with the thread count.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_registry_contention --threads 1 2 4 8 16
+    python -m benchmarks.bench_registry_contention --threads 1 4 16 --hold-ms 0.2 --ops 2000
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import argparse
+import json
+import threading
+import time
+
+from api.stores import VehicleRegistry, RecordLog, DEFAULT_STRIPES
+
+
+def run_trial(stripes: int, threads: int, ops_per_thread: int, vehicles: int,
+              hold_ms: float = 0.0) -> float:
+    """Run one contention trial.
+
+    Args:
+        stripes: Number of registry lock stripes
+        threads: Number of concurrent writer threads
+        ops_per_thread: Updates issued by each writer
+        vehicles: Number of distinct vehicles
+        hold_ms: Milliseconds each update sleeps while holding its lock
+
+    Returns:
+        Aggregate updates per second
+    """
+    registry = VehicleRegistry(stripes=stripes)
+    log = RecordLog('message_id')
+    for i in range(vehicles):
+        registry.put(f"veh-{i}", {'vehicle_id': f"veh-{i}", 'speed': 0.0})
+
+    start_barrier = threading.Barrier(threads + 1)
+    stop_readers = threading.Event()
+    hold = hold_ms / 1000.0
+
+    def writer(worker: int):
+        start_barrier.wait()
+        for n in range(ops_per_thread):
+            vehicle_id = f"veh-{(worker * 7919 + n) % vehicles}"
+            if hold:
+                def slow_update(current, speed=float(n)):
+                    time.sleep(hold)  # releases the GIL with the stripe lock held
+                    return {**current, 'speed': speed}
+                registry.modify(vehicle_id, slow_update)
+            else:
+                registry.update(vehicle_id, {'speed': float(n)})
+            if n % 16 == 0:
+                log.append({'message_id': f"{worker}-{n}"})
+
+    def reader():
+        # Poll rather than spin, so readers do not monopolize the GIL
+        while not stop_readers.wait(0.001):
+            log.snapshot()
+            registry.get("veh-0")
+
+    workers = [threading.Thread(target=writer, args=(w,)) for w in range(threads)]
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    for t in workers + readers:
+        t.start()
+
+    start_barrier.wait()
+    started = time.perf_counter()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    stop_readers.set()
+    for t in readers:
+        t.join()
+
+    return threads * ops_per_thread / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VehicleRegistry contention benchmark")
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--ops', type=int, default=20000, help="Updates per thread")
+    parser.add_argument('--vehicles', type=int, default=1000)
+    parser.add_argument('--hold-ms', type=float, default=0.0,
+                        help="GIL-releasing work (sleep) per update while the lock is held")
+    args = parser.parse_args()
+
+    results = []
+    for threads in args.threads:
+        row = {'threads': threads, 'hold_ms': args.hold_ms}
+        for label, stripes in (('global_lock', 1), ('striped', DEFAULT_STRIPES)):
+            row[f"{label}_ops_per_sec"] = round(run_trial(stripes, threads, args.ops, args.vehicles, args.hold_ms))
+        results.append(row)
+        print(json.dumps(row))
+
+
+if __name__ == '__main__':
+    main()
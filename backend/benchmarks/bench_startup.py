@@ -0,0 +1,118 @@
+"""Cold Start Profile
+
+Starts fresh interpreters that import ``app`` and call ``create_app()``, and
+reports the slowest modules from ``python -X importtime`` together with the
+time spent importing the app and building it. Exits with status 1 when the
+median cold start exceeds the budget. ``tests/test_startup.py`` enforces the
+same budget under pytest.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_startup --runs 5 --top 15
+    V2V_STARTUP_BUDGET_MS=800 python -m benchmarks.bench_startup
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the child interpreter; prints its timings as JSON on the last line
+CHILD_SCRIPT = """
+import json, logging, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+app.create_app()
+created = time.perf_counter()
+print(json.dumps({'import_ms': (imported - started) * 1000, 'create_app_ms': (created - imported) * 1000}))
+"""
+
+
+def parse_importtime(stderr: str) -> list:
+    """Parse ``-X importtime`` output into (module, self_us, cumulative_us) rows."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|', 2)
+        rows.append((module.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def run_child(importtime: bool) -> tuple:
+    """Start one fresh interpreter and return (timings, importtime rows)."""
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+    command += ['-c', CHILD_SCRIPT]
+    completed = subprocess.run(command, cwd=BACKEND_DIR, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Startup failed:\n{completed.stderr}")
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    return timings, parse_importtime(completed.stderr) if importtime else []
+
+
+def measure_startup(runs: int) -> dict:
+    """Median import, create_app() and total cold start times over ``runs`` fresh interpreters."""
+    timings = [run_child(importtime=False)[0] for _ in range(runs)]
+    return {
+        'import_ms': statistics.median(run['import_ms'] for run in timings),
+        'create_app_ms': statistics.median(run['create_app_ms'] for run in timings),
+        'cold_start_ms': statistics.median(run['import_ms'] + run['create_app_ms'] for run in timings)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile backend cold start")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters to time")
+    parser.add_argument('--top', type=int, default=15, help="Modules to list by cumulative time")
+    parser.add_argument('--budget-ms', type=float,
+                        default=float(os.environ.get('V2V_STARTUP_BUDGET_MS', 1500)),
+                        help="Cold start budget for import + create_app() (default: V2V_STARTUP_BUDGET_MS or 1500)")
+    args = parser.parse_args()
+
+    # Profile imports once; time startup without the importtime overhead
+    _, rows = run_child(importtime=True)
+    startup = measure_startup(args.runs)
+    import_ms, create_app_ms, cold_start_ms = startup['import_ms'], startup['create_app_ms'], startup['cold_start_ms']
+
+    # Aggregate self time per top-level package
+    packages = {}
+    for module, self_us, _ in rows:
+        top_level = module.split('.')[0]
+        packages[top_level] = packages.get(top_level, 0) + self_us
+
+    results = {
+        'runs': args.runs,
+        'import_app_ms': round(import_ms, 2),
+        'create_app_ms': round(create_app_ms, 2),
+        'cold_start_ms': round(cold_start_ms, 2),
+        'budget_ms': args.budget_ms,
+        'within_budget': cold_start_ms <= args.budget_ms,
+        'modules_imported': len(rows),
+        'slowest_modules': [
+            {'module': module, 'self_ms': round(self_us / 1000, 2), 'cumulative_ms': round(cumulative_us / 1000, 2)}
+            for module, self_us, cumulative_us in sorted(rows, key=lambda row: -row[2])[:args.top]
+        ],
+        'self_ms_by_package': {
+            package: round(self_us / 1000, 2)
+            for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]
+        }
+    }
+    print(json.dumps(results, indent=2))
+
+    if not results['within_budget']:
+        print(f"Cold start {cold_start_ms:.1f} ms exceeds budget of {args.budget_ms:.1f} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
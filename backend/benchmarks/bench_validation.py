@@ -0,0 +1,87 @@
+"""Request Validation Microbenchmark
+
+Reports the per-record cost of the compiled validators in ``api.validation``
+for each endpoint schema and for batch payloads, next to the presence-only
+``required_fields`` loop they replaced.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_validation --records 200000
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import argparse
+import json
+import time
+
+from api.validation import (
+    validate_vehicle_registration,
+    validate_vehicle_update,
+    validate_vehicle_batch_update,
+    validate_safety_alert,
+    validate_v2v_message
+)
+
+SAMPLES = {
+    'vehicle_registration': (validate_vehicle_registration, {
+        'vehicle_id': 'veh-001', 'position': {'lat': 42.33, 'lon': -83.05},
+        'speed': 13.4, 'heading': 270.0, 'vehicle_type': 'sedan', 'capabilities': ['dsrc']
+    }),
+    'vehicle_update': (validate_vehicle_update, {
+        'position': {'lat': 42.33, 'lon': -83.05}, 'speed': 13.4, 'heading': 270.0
+    }),
+    'safety_alert': (validate_safety_alert, {
+        'alert_type': 'collision', 'severity': 'high', 'position': {'lat': 42.33, 'lon': -83.05},
+        'radius': 150.0, 'message': 'Stopped vehicle ahead', 'vehicle_id': 'veh-001'
+    }),
+    'v2v_message': (validate_v2v_message, {
+        'sender_id': 'veh-001', 'recipient_id': 'broadcast', 'message_type': 'bsm',
+        'payload': {'speed': 13.4}, 'priority': 'high'
+    })
+}
+
+
+def presence_only(data, required=('vehicle_id', 'position', 'speed', 'heading')):
+    """The pre-schema check: required keys only."""
+    for field in required:
+        if field not in data:
+            return False, f"Missing required field: {field}"
+    return True, None
+
+
+def time_per_call(fn, arg, repeat: int) -> float:
+    """Return nanoseconds per call of ``fn(arg)``."""
+    started = time.perf_counter_ns()
+    for _ in range(repeat):
+        fn(arg)
+    return (time.perf_counter_ns() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validation microbenchmark")
+    parser.add_argument('--records', type=int, default=200000)
+    parser.add_argument('--batch-size', type=int, default=500)
+    args = parser.parse_args()
+
+    results = {'ns_per_record': {}}
+    for name, (validator, sample) in SAMPLES.items():
+        assert validator(sample) == (True, None), name
+        results['ns_per_record'][name] = round(time_per_call(validator, sample, args.records))
+
+    registration = SAMPLES['vehicle_registration'][1]
+    results['ns_per_record']['presence_only_baseline'] = round(
+        time_per_call(presence_only, registration, args.records))
+
+    batch = [{'vehicle_id': f"veh-{i}", **SAMPLES['vehicle_update'][1]} for i in range(args.batch_size)]
+    repeat = max(1, args.records // args.batch_size)
+    per_batch = time_per_call(validate_vehicle_batch_update, batch, repeat)
+    results['ns_per_record']['vehicle_batch_update_item'] = round(per_batch / args.batch_size)
+    results['batch_size'] = args.batch_size
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -8,23 +8,26 @@ for the V2V Safety Ecosystem, including:
 - Policy optimization and decision making
 - Training and evaluation utilities
 
+Submodules (and NumPy with them) are imported on first attribute access,
+so importing the package itself stays cheap.
+
 Author: V2V Safety Ecosystem Team
 Created: September 2025
 """
 
-from .agent import RLAgent
-from .environment import V2VEnvironment
-from .trainer import RLTrainer
-from .utils import PolicyUtils, RewardUtils
+import importlib
 
 __version__ = "1.0.0"
-__all__ = [
-    "RLAgent",
-    "V2VEnvironment", 
-    "RLTrainer",
-    "PolicyUtils",
-    "RewardUtils"
-]
+
+# Public name -> submodule that defines it, imported on first access
+_LAZY_ATTRIBUTES = {
+    "V2VEnvironment": ".environment",
+    "DQNAgent": ".dqn_agent",
+    "QTableAgent": ".dqn_agent",
+    "RuleBasedAgent": ".dqn_agent"
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
 
 # Module-level configuration
 DEFAULT_CONFIG = {
@@ -42,3 +45,15 @@ def get_version():
 def get_default_config():
     """Return the default configuration for the RL engine."""
     return DEFAULT_CONFIG.copy()
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,391 @@
+"""Streaming FARS Crash Data Ingestion
+
+Converts NHTSA FARS crash records into the agent's 8-feature state layout and
+stores them as memory-mapped float32 arrays, so training and replay-buffer
+pre-filling can sample from extracts larger than RAM.
+
+The CSV is read in chunks of ``chunk_rows`` records. Each chunk is mapped with
+NumPy and appended to ``states.f32``, with a ``case_ids.i64`` provenance
+column and a ``metadata.json`` sidecar. Peak memory is one chunk, whatever the
+size of the file.
+
+Input is a FARS ``vehicle.csv`` (one row per vehicle, the vehicles of a
+case on consecutive rows). Accident-level columns (WEATHER, RUR_URB,
+FUNC_SYS, LGT_COND) are taken from the row if it has them (pre-joined
+extracts), or otherwise looked up by ST_CASE in the optional
+``accident.csv``. Chunks never split a case.
+
+FARS does not record everything the state needs. Features that cannot be
+derived for a record are stored as NaN rather than estimated, and
+``metadata.json`` counts the rows that have each feature. ``prefill_replay``
+only uses complete rows.
+
+Feature mapping (FARS columns -> state):
+    0 distance_to_vehicle  GAP_M (m), a reconstructed pre-crash gap that
+                           pre-joined extracts may carry; FARS itself records
+                           no headway, so NaN without it
+    1 relative_speed       Closing speed (m/s) from both vehicles' TRAV_SP in
+                           two-vehicle cases: difference for front-to-rear and
+                           same-direction sideswipes, sum for head-on and
+                           opposite-direction sideswipes, sqrt(a^2 + b^2) for
+                           angle crashes; NaN for other cases and manners of
+                           collision. TRAV_SP 997 (over 151 mph) clamps;
+                           998/999 (unknown) drop the vehicle's own record
+    2 vehicle_angle        MAN_COLL: rear-end 0, head-on 180, angle 90,
+                           sideswipes 10/170, others 45
+    3 road_type            FUNC_SYS 1-2 -> highway (3); local roads ->
+                           residential (0) if urban else rural (2); others
+                           by RUR_URB: urban (1) / rural (2)
+    4 weather_condition    WEATHER -> clear 0, rain 1, fog 2, snow 3, ice 4
+    5 time_of_day          HOUR; unknown (99) -> 12
+    6 driver_attention     1.0 reduced for DR_DRINK, SPEEDREL and darkness
+                           (LGT_COND)
+    7 collision_probability  collision_risk_batch of features 0-1, as in
+                           V2VEnvironment and the decision service; NaN
+                           unless both are available
+
+Usage (from the backend directory):
+    python -m rl_engine.crash_data vehicle.csv --accidents accident.csv --out data/fars2023
+    python -m rl_engine.crash_data rl_engine/data/fars_synthetic_sample.csv --out /tmp/fars_sample
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import time
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from .dqn_agent import collision_risk_batch
+
+logger = logging.getLogger(__name__)
+
+FEATURES = (
+    'distance_to_vehicle', 'relative_speed', 'vehicle_angle', 'road_type',
+    'weather_condition', 'time_of_day', 'driver_attention', 'collision_probability'
+)
+ACCIDENT_COLUMNS = ('WEATHER', 'RUR_URB', 'FUNC_SYS', 'LGT_COND')
+STATES_FILE = 'states.f32'
+CASE_IDS_FILE = 'case_ids.i64'
+METADATA_FILE = 'metadata.json'
+
+MPH_TO_MS = 0.44704
+MAX_REPORTED_SPEED_MPH = 151.0
+DEFAULT_CHUNK_ROWS = 50000
+
+# FARS code -> state value; codes not listed fall back to the default
+MAN_COLL_ANGLE = {0: 45.0, 1: 0.0, 2: 180.0, 6: 90.0, 7: 10.0, 8: 170.0, 9: 90.0, 10: 180.0}
+# MAN_COLL codes whose geometry gives the closing speed of the two vehicles
+SAME_DIRECTION_COLLISIONS = (1, 7)      # front-to-rear, sideswipe same direction
+OPPOSITE_DIRECTION_COLLISIONS = (2, 8)  # front-to-front, sideswipe opposite direction
+ANGLE_COLLISIONS = (6,)
+WEATHER_CONDITION = {1: 0, 10: 0, 2: 1, 5: 2, 7: 2, 4: 3, 11: 3, 3: 4, 12: 4}
+DARK_LIGHT_CONDITIONS = (2, 3, 6)
+
+
+def _lookup(values: np.ndarray, table: Dict[int, float], default: float) -> np.ndarray:
+    """Map integer codes (NaN for missing) through ``table``."""
+    out = np.full(len(values), default, dtype=np.float64)
+    for code, mapped in table.items():
+        out[values == code] = mapped
+    return out
+
+
+def _numeric(raw: List[str]) -> np.ndarray:
+    """Parse a column of CSV strings; blanks and junk become NaN."""
+    out = np.empty(len(raw), dtype=np.float64)
+    for i, value in enumerate(raw):
+        try:
+            out[i] = float(value)
+        except (TypeError, ValueError):
+            out[i] = np.nan
+    return out
+
+
+def _other_vehicle(values: np.ndarray, case_ids: np.ndarray) -> np.ndarray:
+    """Value of the other vehicle of each row's case; NaN unless the case has exactly two rows."""
+    other = np.full(len(values), np.nan)
+    order = np.argsort(case_ids, kind='stable')
+    _, starts, counts = np.unique(case_ids[order], return_index=True, return_counts=True)
+    pairs = starts[(counts == 2) & np.isfinite(case_ids[order][starts])]
+    first, second = order[pairs], order[pairs + 1]
+    other[first] = values[second]
+    other[second] = values[first]
+    return other
+
+
+def closing_speed(speed: np.ndarray, other_speed: np.ndarray, man_coll: np.ndarray) -> np.ndarray:
+    """Closing speed of two colliding vehicles from the manner of collision.
+
+    Args:
+        speed: Own travel speed (m/s)
+        other_speed: Other vehicle's travel speed (m/s), NaN if unknown
+        man_coll: FARS MAN_COLL codes
+
+    Returns:
+        Closing speed (m/s); NaN where the geometry or a speed is unknown
+    """
+    closing = np.full(len(speed), np.nan)
+    same = np.isin(man_coll, SAME_DIRECTION_COLLISIONS)
+    opposite = np.isin(man_coll, OPPOSITE_DIRECTION_COLLISIONS)
+    angle = np.isin(man_coll, ANGLE_COLLISIONS)
+    closing[same] = np.abs(speed[same] - other_speed[same])
+    closing[opposite] = speed[opposite] + other_speed[opposite]
+    closing[angle] = np.hypot(speed[angle], other_speed[angle])
+    return closing
+
+
+def map_records(rows: List[Dict[str, str]],
+                accidents: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, np.ndarray]:
+    """Map a chunk of FARS vehicle rows to states.
+
+    Args:
+        rows: CSV rows (column name -> string)
+        accidents: Accident-level rows keyed by ST_CASE, for columns missing
+            from ``rows``
+
+    Returns:
+        dict: ``states`` (kept rows, shape (n, 8), float32, NaN for
+        unavailable features), ``case_ids`` (int64) and ``dropped`` (number
+        of rows without a usable speed)
+    """
+    def column(name: str) -> np.ndarray:
+        if (rows and name in rows[0]) or not accidents or name not in ACCIDENT_COLUMNS:
+            return _numeric([row.get(name, '') for row in rows])
+        return _numeric([accidents.get(row.get('ST_CASE', ''), {}).get(name, '') for row in rows])
+
+    case_ids = column('ST_CASE')
+    speed_mph = column('TRAV_SP')
+    speed_mph = np.where(speed_mph == 997, MAX_REPORTED_SPEED_MPH, speed_mph)
+    speed_mph = np.where(speed_mph <= MAX_REPORTED_SPEED_MPH, speed_mph, np.nan)
+    keep = np.isfinite(speed_mph)
+    speed = speed_mph * MPH_TO_MS
+    man_coll = column('MAN_COLL')
+    gap = column('GAP_M')
+    gap = np.where(gap >= 0, gap, np.nan)
+
+    func_sys = column('FUNC_SYS')
+    urban = column('RUR_URB') == 2
+    road_type = np.where(np.isin(func_sys, (1, 2)), 3,
+                         np.where(func_sys == 7, np.where(urban, 0, 2), np.where(urban, 1, 2)))
+
+    hour = column('HOUR')
+    hour = np.where((hour >= 0) & (hour <= 23), hour, 12)
+
+    attention = (1.0
+                 - 0.4 * (column('DR_DRINK') == 1)
+                 - 0.2 * np.isin(column('SPEEDREL'), (2, 3, 4, 5))
+                 - 0.1 * np.isin(column('LGT_COND'), DARK_LIGHT_CONDITIONS))
+
+    states = np.empty((len(rows), len(FEATURES)), dtype=np.float64)
+    states[:, 0] = gap
+    states[:, 1] = closing_speed(speed, _other_vehicle(speed, case_ids), man_coll)
+    states[:, 2] = _lookup(man_coll, MAN_COLL_ANGLE, 45.0)
+    states[:, 3] = road_type
+    states[:, 4] = _lookup(column('WEATHER'), WEATHER_CONDITION, 0)
+    states[:, 5] = hour
+    states[:, 6] = np.clip(attention, 0.0, 1.0)
+    states = states[keep]
+    states[:, 7] = np.nan
+    known = np.isfinite(states[:, 0]) & np.isfinite(states[:, 1])
+    if known.any():
+        states[known, 7] = collision_risk_batch(states[known])
+
+    return {
+        'states': states.astype(np.float32),
+        'case_ids': np.nan_to_num(case_ids[keep], nan=-1).astype(np.int64),
+        'dropped': int((~keep).sum())
+    }
+
+
+def load_accidents(path: str) -> Dict[str, Dict[str, str]]:
+    """Read the accident-level columns of ``accident.csv`` keyed by ST_CASE."""
+    accidents = {}
+    with open(path, newline='', encoding='latin-1') as f:
+        for row in csv.DictReader(f):
+            accidents[row['ST_CASE']] = {name: row.get(name, '') for name in ACCIDENT_COLUMNS}
+    return accidents
+
+
+def iter_chunks(path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[List[Dict[str, str]]]:
+    """Stream a CSV file as lists of about ``chunk_rows`` rows.
+
+    A chunk is extended past ``chunk_rows`` until the ST_CASE changes, so the
+    vehicles of one case always land in the same chunk.
+    """
+    with open(path, newline='', encoding='latin-1') as f:
+        reader = csv.DictReader(f)
+        carry = []
+        while True:
+            chunk = carry + list(islice(reader, max(chunk_rows - len(carry), 1)))
+            carry = []
+            if not chunk:
+                return
+            last_case = chunk[-1].get('ST_CASE')
+            for row in reader:
+                if row.get('ST_CASE') != last_case:
+                    carry = [row]
+                    break
+                chunk.append(row)
+            yield chunk
+
+
+def ingest_fars(csv_path: str, out_dir: str, accidents_path: str = None,
+                chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Dict[str, Any]:
+    """Convert a FARS vehicle CSV into a memory-mapped state dataset.
+
+    Args:
+        csv_path: FARS vehicle.csv (or a pre-joined extract)
+        out_dir: Output directory; existing dataset files are replaced
+        accidents_path: Optional accident.csv for accident-level columns
+        chunk_rows: Records mapped per chunk
+
+    Returns:
+        dict: The dataset metadata (also written to metadata.json)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    accidents = load_accidents(accidents_path) if accidents_path else None
+    started = time.perf_counter()
+    rows = dropped = chunks = 0
+    available = np.zeros(len(FEATURES), dtype=np.int64)
+
+    states_path = os.path.join(out_dir, STATES_FILE)
+    case_ids_path = os.path.join(out_dir, CASE_IDS_FILE)
+    with open(states_path, 'wb') as states_file, open(case_ids_path, 'wb') as case_ids_file:
+        for chunk in iter_chunks(csv_path, chunk_rows):
+            mapped = map_records(chunk, accidents)
+            mapped['states'].tofile(states_file)
+            mapped['case_ids'].tofile(case_ids_file)
+            rows += len(mapped['states'])
+            dropped += mapped['dropped']
+            available += np.isfinite(mapped['states']).sum(axis=0)
+            chunks += 1
+
+    metadata = {
+        'source': os.path.abspath(csv_path),
+        'accidents': os.path.abspath(accidents_path) if accidents_path else None,
+        'rows': rows,
+        'dropped': dropped,
+        'features': list(FEATURES),
+        'available': dict(zip(FEATURES, available.tolist())),
+        'dtype': 'float32',
+        'chunks': chunks,
+        'chunk_rows': chunk_rows,
+        'elapsed_seconds': round(time.perf_counter() - started, 3)
+    }
+    with open(os.path.join(out_dir, METADATA_FILE), 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+    logger.info(f"Ingested {rows} crash records ({dropped} dropped) from {csv_path} into {out_dir}")
+    return metadata
+
+
+class CrashDataset:
+    """Read-only memory-mapped view of an ingested dataset.
+
+    Attributes:
+        states (np.memmap): States, shape (rows, 8), float32
+        case_ids (np.memmap): FARS ST_CASE per row
+        metadata (dict): Contents of metadata.json
+    """
+
+    def __init__(self, out_dir: str):
+        """Open a dataset written by ``ingest_fars``.
+
+        Args:
+            out_dir: Dataset directory
+        """
+        with open(os.path.join(out_dir, METADATA_FILE)) as f:
+            self.metadata = json.load(f)
+        rows = self.metadata['rows']
+        shape = (rows, len(FEATURES))
+        if rows:
+            self.states = np.memmap(os.path.join(out_dir, STATES_FILE), dtype=np.float32, mode='r', shape=shape)
+            self.case_ids = np.memmap(os.path.join(out_dir, CASE_IDS_FILE), dtype=np.int64, mode='r', shape=(rows,))
+        else:
+            self.states = np.empty(shape, dtype=np.float32)
+            self.case_ids = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def complete_indices(self, batch_size: int = DEFAULT_CHUNK_ROWS) -> np.ndarray:
+        """Indices of the rows that have every feature (no NaN)."""
+        indices = [start + np.flatnonzero(np.isfinite(batch).all(axis=1))
+                   for start, batch in zip(range(0, len(self.states), batch_size), self.iter_batches(batch_size))]
+        return np.concatenate(indices) if indices else np.empty(0, dtype=np.int64)
+
+    def sample(self, batch_size: int, rng: np.random.Generator = None) -> np.ndarray:
+        """Random rows, read in index order to keep page access sequential.
+
+        Args:
+            batch_size: Rows to draw (with replacement)
+            rng: Random generator
+
+        Returns:
+            States, shape (batch_size, 8), loaded into memory; unavailable
+            features are NaN
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        indices = np.sort(rng.integers(0, len(self.states), batch_size))
+        return np.asarray(self.states[indices])
+
+    def iter_batches(self, batch_size: int) -> Iterator[np.ndarray]:
+        """Sequential in-memory batches over the whole dataset."""
+        for start in range(0, len(self.states), batch_size):
+            yield np.asarray(self.states[start:start + batch_size])
+
+
+def prefill_replay(agent, dataset: CrashDataset, count: int, seed: int = None) -> int:
+    """Seed an agent's replay memory with crash outcomes.
+
+    Each complete record (see ``complete_indices``) becomes a terminal
+    transition: the pre-crash state, the "maintain speed" action the driver
+    effectively took, and the collision reward.
+
+    Args:
+        agent: DQNAgent (anything with ``remember``)
+        dataset: Ingested crash dataset
+        count: Transitions to add (capped by the memory size)
+        seed: Sampling seed
+
+    Returns:
+        int: Transitions added
+    """
+    from .environment import COLLISION_REWARD
+
+    complete = dataset.complete_indices()
+    if len(complete) == 0:
+        logger.warning("No crash records with every feature available; replay memory not prefilled")
+        return 0
+    maxlen = getattr(agent.memory, 'maxlen', None)
+    count = min(count, maxlen) if maxlen else count
+    indices = np.sort(np.random.default_rng(seed).choice(complete, count))
+    states = np.asarray(dataset.states[indices]).tolist()
+    for state in states:
+        agent.remember(state, 0, COLLISION_REWARD, state, True)
+    return len(states)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest FARS crash records into memory-mapped state arrays")
+    parser.add_argument('csv_path', help="FARS vehicle.csv or a pre-joined extract")
+    parser.add_argument('--accidents', help="FARS accident.csv for WEATHER/RUR_URB/FUNC_SYS/LGT_COND")
+    parser.add_argument('--out', required=True, help="Output dataset directory")
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    print(json.dumps(ingest_fars(args.csv_path, args.out, args.accidents, args.chunk_rows), indent=2))
+
+
+if __name__ == '__main__':
+    main()
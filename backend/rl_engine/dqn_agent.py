@@ -1,7 +1,8 @@
 """DQN Agent for V2V Collision Avoidance
 
 This module implements a Deep Q-Network (DQN) reinforcement learning agent
-for vehicle collision avoidance in the V2V Safety Ecosystem.
+for vehicle collision avoidance in the V2V Safety Ecosystem, together with the
+tabular Q-learning agent it replaced and a rule-based baseline.
 
 Author: V2V Safety Team
 Date: December 7, 2025
@@ -10,18 +11,264 @@ Version: 1.0.0
 
 import numpy as np
 import random
-from collections import deque
+from collections import OrderedDict, deque
 from typing import Dict, List, Tuple, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Fixed per-feature scales that bring each raw state feature to roughly [0, 1]
+STATE_SCALE = np.array([200.0, 30.0, 180.0, 3.0, 4.0, 23.0, 1.0, 1.0], dtype=np.float32)
+
+# Human-readable names of the action indices shared by all agents
+ACTION_NAMES = {
+    0: "Maintain Speed",
+    1: "Decelerate Gradually",
+    2: "Hard Brake",
+    3: "Change Lane Left",
+    4: "Change Lane Right"
+}
+
+
+def collision_risk_batch(states) -> np.ndarray:
+    """Vectorized DQNAgent.evaluate_collision_risk over a batch of states.
+    
+    Args:
+        states: Array-like of shape (batch, state_size)
+        
+    Returns:
+        Collision risk per state (0-1), shape (batch,)
+    """
+    states = np.asarray(states, dtype=np.float64)
+    states = states.reshape(-1, states.shape[-1])
+    distance = states[:, 0]
+    relative_speed = states[:, 1]
+    
+    # Distance-based risk
+    safe_distance = 30.0  # meters
+    risk = np.where(distance < safe_distance, 1.0 - distance / safe_distance, 0.0)
+    
+    # Time to collision overrides when under 2 seconds
+    closing = relative_speed > 0
+    ttc = np.divide(distance, relative_speed, out=np.full_like(distance, np.inf), where=closing)
+    risk = np.where(closing & (ttc < 2.0), 1.0 - ttc / 2.0, risk)
+    
+    risk = np.where(distance <= 0, 1.0, risk)
+    return np.clip(risk, 0.0, 1.0)
+
+
+class QNetwork:
+    """Small fully connected Q-network in plain NumPy.
+    
+    ReLU hidden layers and a linear output layer with one Q-value per action.
+    Forward and backward passes operate on whole minibatches.
+    
+    Attributes:
+        layer_sizes (tuple): Units per layer, input first, output last
+        weights (list): Weight matrices, shape (fan_in, fan_out)
+        biases (list): Bias vectors, shape (fan_out,)
+    """
+    
+    def __init__(self, layer_sizes: Tuple[int, ...], rng: np.random.Generator):
+        """Initialize the network with He-normal weights and zero biases.
+        
+        Args:
+            layer_sizes: Units per layer, e.g. (8, 64, 64, 5)
+            rng: Random generator used for initialization
+        """
+        self.layer_sizes = tuple(layer_sizes)
+        self.weights = [
+            (rng.standard_normal((fan_in, fan_out)) * np.sqrt(2.0 / fan_in)).astype(np.float32)
+            for fan_in, fan_out in zip(layer_sizes[:-1], layer_sizes[1:])
+        ]
+        self.biases = [np.zeros(fan_out, dtype=np.float32) for fan_out in layer_sizes[1:]]
+    
+    @property
+    def params(self) -> List[np.ndarray]:
+        """Parameter arrays in optimizer order (W0, b0, W1, b1, ...)."""
+        return [p for pair in zip(self.weights, self.biases) for p in pair]
+    
+    def num_parameters(self) -> int:
+        """Total number of trainable parameters."""
+        return sum(p.size for p in self.params)
+    
+    def forward(self, x: np.ndarray) -> np.ndarray:
+        """Compute Q-values for a batch of inputs.
+        
+        Args:
+            x: Inputs, shape (batch, layer_sizes[0])
+        
+        Returns:
+            Q-values, shape (batch, layer_sizes[-1])
+        """
+        last = len(self.weights) - 1
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            x = x @ w + b
+            if i < last:
+                np.maximum(x, 0.0, out=x)
+        return x
+    
+    def forward_train(self, x: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """Forward pass keeping each layer's input for backpropagation.
+        
+        Returns:
+            tuple: (Q-values, list of layer inputs)
+        """
+        activations = []
+        last = len(self.weights) - 1
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            activations.append(x)
+            x = x @ w + b
+            if i < last:
+                x = np.maximum(x, 0.0)
+        return x, activations
+    
+    def backward(self, activations: List[np.ndarray], grad_out: np.ndarray) -> List[np.ndarray]:
+        """Backpropagate output gradients through the network.
+        
+        Args:
+            activations: Layer inputs from forward_train
+            grad_out: dLoss/dQ, shape (batch, layer_sizes[-1])
+        
+        Returns:
+            Gradients in ``params`` order
+        """
+        grads = [None] * (2 * len(self.weights))
+        grad = grad_out
+        for i in range(len(self.weights) - 1, -1, -1):
+            layer_input = activations[i]
+            grads[2 * i] = layer_input.T @ grad
+            grads[2 * i + 1] = grad.sum(axis=0)
+            if i > 0:
+                grad = (grad @ self.weights[i].T) * (layer_input > 0.0)
+        return grads
+    
+    def copy_from(self, other: 'QNetwork'):
+        """Overwrite this network's parameters with another's."""
+        for dst, src in zip(self.params, other.params):
+            dst[...] = src
+
+
+class AdamOptimizer:
+    """Adam optimizer updating parameter arrays in place."""
+    
+    def __init__(self, params: List[np.ndarray], learning_rate: float = 0.001,
+                 beta1: float = 0.9, beta2: float = 0.999, epsilon: float = 1e-8):
+        """Initialize moment estimates for ``params``.
+        
+        Args:
+            params: Parameter arrays to optimize
+            learning_rate: Step size
+            beta1: First-moment decay
+            beta2: Second-moment decay
+            epsilon: Numerical stability term
+        """
+        self.learning_rate = learning_rate
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+        self.m = [np.zeros_like(p) for p in params]
+        self.v = [np.zeros_like(p) for p in params]
+        self.t = 0
+    
+    def step(self, params: List[np.ndarray], grads: List[np.ndarray]):
+        """Apply one update to ``params`` in place."""
+        self.t += 1
+        correction1 = 1.0 - self.beta1 ** self.t
+        correction2 = 1.0 - self.beta2 ** self.t
+        step_size = self.learning_rate * np.sqrt(correction2) / correction1
+        for p, g, m, v in zip(params, grads, self.m, self.v):
+            m *= self.beta1
+            m += (1.0 - self.beta1) * g
+            v *= self.beta2
+            v += (1.0 - self.beta2) * (g * g)
+            p -= step_size * m / (np.sqrt(v) + self.epsilon)
+
+
+class DecisionCache:
+    """Bounded LRU map from a state key to the greedy action.
+    
+    Entries are only valid for the network weights they were computed with;
+    the owner must ``clear`` the cache whenever those weights change.
+    
+    Attributes:
+        maxsize (int): Maximum number of cached states
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups that required a forward pass
+        invalidations (int): Number of times the cache was cleared
+    """
+    
+    def __init__(self, maxsize: int):
+        """Initialize an empty cache.
+        
+        Args:
+            maxsize: Maximum number of cached states (must be positive)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: bytes):
+        """Return the cached action for ``key`` (refreshing it), or None."""
+        action = self._entries.get(key)
+        if action is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return action
+    
+    def put(self, key: bytes, action: int):
+        """Cache ``action`` for ``key``, evicting the least recently used entry."""
+        self._entries[key] = action
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all entries after the underlying Q-values changed."""
+        if self._entries:
+            self._entries.clear()
+            self.invalidations += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'invalidations': self.invalidations
+        }
+
+
 class DQNAgent:
     """Deep Q-Network Agent for collision avoidance decisions.
     
     The agent learns optimal collision avoidance strategies through
     reinforcement learning, trained on NHTSA FARS 2023 crash data.
     
+    Q-values come from a small NumPy MLP over the full continuous state
+    (scaled by STATE_SCALE). Training samples minibatches from experience
+    replay, computes targets with a periodically synced target network and
+    updates the online network with Adam on the Huber loss. CPU only.
+    
+    With ``decision_cache_size`` set, greedy decisions are memoized per
+    ``_cache_keys`` key until the next ``replay`` or ``load_model``. By default
+    the key is the exact scaled state, so cached actions always equal the
+    network's. A positive ``decision_cache_resolution`` rounds each scaled
+    feature to that step (signs kept) so nearby states share an entry; a state
+    may then get the action computed for a neighbour in its bin.
+    
     Attributes:
         state_size (int): Dimension of state space
         action_size (int): Number of possible actions
@@ -29,11 +276,424 @@ class DQNAgent:
         gamma (float): Discount factor for future rewards
         epsilon (float): Exploration rate
         learning_rate (float): Learning rate for Q-network
+        q_network (QNetwork): Online network used for decisions
+        target_network (QNetwork): Lagged copy used for TD targets
+        decision_cache (DecisionCache): Greedy action cache, or None if disabled
     """
     
-    def __init__(self, state_size: int = 8, action_size: int = 5):
+    def __init__(self, state_size: int = 8, action_size: int = 5,
+                 hidden_sizes: Tuple[int, ...] = (64, 64), gamma: float = 0.95,
+                 epsilon_decay: float = 0.995, learning_rate: float = 0.001,
+                 memory_size: int = 2000, target_update_freq: int = 100,
+                 seed: int = None, decision_cache_size: int = 0,
+                 decision_cache_resolution: float = 0.0):
         """Initialize DQN Agent.
         
+        Args:
+            state_size: Size of state vector (default: 8)
+                - distance_to_vehicle (m)
+                - relative_speed (m/s)
+                - vehicle_angle (degrees)
+                - road_type (0-3)
+                - weather_condition (0-4)
+                - time_of_day (0-23)
+                - driver_attention (0-1)
+                - collision_probability (0-1)
+            action_size: Number of actions (default: 5)
+                - 0: Maintain speed
+                - 1: Decelerate gradually
+                - 2: Hard brake
+                - 3: Change lane left
+                - 4: Change lane right
+            hidden_sizes: Units per hidden layer (default: (64, 64))
+            gamma: Discount factor (default: 0.95)
+            epsilon_decay: Multiplicative exploration decay per replay (default: 0.995)
+            learning_rate: Adam step size (default: 0.001)
+            memory_size: Replay buffer capacity (default: 2000)
+            target_update_freq: Replay steps between target network syncs (default: 100)
+            seed: Random seed for initialization, exploration and sampling
+            decision_cache_size: States to memoize greedy actions for
+                (default: 0, disabled)
+            decision_cache_resolution: Bin width of the cache key in scaled
+                units (STATE_SCALE), e.g. 1e-3 = 0.2 m of distance
+                (default: 0, exact states)
+        """
+        self.state_size = state_size
+        self.action_size = action_size
+        self.memory = deque(maxlen=memory_size)
+        
+        # Hyperparameters
+        self.gamma = gamma    # Discount factor
+        self.epsilon = 1.0    # Exploration rate
+        self.epsilon_min = 0.01
+        self.epsilon_decay = epsilon_decay
+        self.learning_rate = learning_rate
+        self.target_update_freq = target_update_freq
+        
+        # Online and target Q-networks
+        self._rng = np.random.default_rng(seed)
+        self._random = random.Random(seed)
+        self.hidden_sizes = tuple(hidden_sizes)
+        layer_sizes = (state_size,) + self.hidden_sizes + (action_size,)
+        self.q_network = QNetwork(layer_sizes, self._rng)
+        self.target_network = QNetwork(layer_sizes, self._rng)
+        self.target_network.copy_from(self.q_network)
+        self.optimizer = AdamOptimizer(self.q_network.params, learning_rate)
+        self.state_scale = STATE_SCALE[:state_size] if state_size <= len(STATE_SCALE) \
+            else np.ones(state_size, dtype=np.float32)
+        self.train_steps = 0
+        self.decision_cache = DecisionCache(decision_cache_size) if decision_cache_size > 0 else None
+        if decision_cache_resolution < 0:
+            raise ValueError("decision_cache_resolution must not be negative")
+        self.decision_cache_resolution = decision_cache_resolution
+        
+        # Performance metrics
+        self.collisions_avoided = 0
+        self.total_actions = 0
+        self.success_rate = 0.0
+        
+        logger.info(f"DQN Agent initialized: state_size={state_size}, action_size={action_size}, "
+                    f"hidden={self.hidden_sizes}")
+    
+    def _discretize_state(self, state: List[float]) -> str:
+        """Convert continuous state to discrete for Q-table lookup.
+        
+        Args:
+            state: Continuous state vector
+        
+        Returns:
+            String representation of discretized state
+        """
+        discretized = []
+        for i, val in enumerate(state):
+            if i == 0:  # Distance
+                bin_val = int(min(val // 10, 20))  # 10m bins, max 200m
+            elif i == 1:  # Speed
+                bin_val = int(min(abs(val) // 5, 10))  # 5 m/s bins
+            else:
+                bin_val = int(val)
+            discretized.append(str(bin_val))
+        return '-'.join(discretized)
+    
+    def _prepare(self, states) -> np.ndarray:
+        """Convert raw states to a scaled float32 batch."""
+        batch = np.asarray(states, dtype=np.float32).reshape(-1, self.state_size)
+        return batch / self.state_scale
+    
+    def _cache_keys(self, scaled: np.ndarray) -> List[bytes]:
+        """Decision cache keys for a batch of scaled states.
+        
+        Unlike ``_discretize_state`` (the coarse Q-table bins), keys keep the
+        sign of every feature and the fractional features' precision.
+        
+        Args:
+            scaled: Output of ``_prepare``, shape (batch, state_size)
+        
+        Returns:
+            One bytes key per row
+        """
+        if self.decision_cache_resolution > 0:
+            scaled = np.rint(scaled / self.decision_cache_resolution).astype(np.int32)
+        return [row.tobytes() for row in scaled]
+    
+    def predict(self, states) -> np.ndarray:
+        """Compute Q-values for a batch of raw states.
+        
+        Args:
+            states: Array-like of shape (batch, state_size) or (state_size,)
+        
+        Returns:
+            Q-values, shape (batch, action_size)
+        """
+        return self.q_network.forward(self._prepare(states))
+    
+    def remember(self, state: List[float], action: int, reward: float,
+                 next_state: List[float], done: bool):
+        """Store experience in replay memory.
+        
+        Args:
+            state: Current state
+            action: Action taken
+            reward: Reward received
+            next_state: Resulting state
+            done: Whether episode ended
+        """
+        self.memory.append((state, action, reward, next_state, done))
+    
+    def act(self, state: List[float]) -> int:
+        """Choose action using epsilon-greedy policy.
+        
+        Args:
+            state: Current state vector
+        
+        Returns:
+            Selected action index
+        """
+        # Epsilon-greedy action selection
+        if self._rng.random() <= self.epsilon:
+            action = self._random.randrange(self.action_size)
+            logger.debug(f"Exploration: random action {action}")
+            return action
+        
+        self.total_actions += 1
+        
+        # Exploit: reuse the cached greedy action of this state
+        scaled = self._prepare(state)
+        cache = self.decision_cache
+        if cache is not None:
+            key = self._cache_keys(scaled)[0]
+            action = cache.get(key)
+            if action is not None:
+                return action
+        
+        # Exploit: choose best known action
+        q_values = self.q_network.forward(scaled)[0]
+        action = int(np.argmax(q_values))
+        if cache is not None:
+            cache.put(key, action)
+        
+        logger.debug(f"Exploitation: action {action} from Q-values {q_values}")
+        return action
+    
+    def act_batch(self, states, explore: bool = False) -> np.ndarray:
+        """Choose actions for a batch of states with one forward pass.
+        
+        Args:
+            states: Array-like of shape (batch, state_size)
+            explore: Apply epsilon-greedy exploration per state (default: greedy)
+            
+        Returns:
+            Selected action indices, shape (batch,)
+        """
+        actions = self._greedy_batch(states)
+        if explore:
+            random_mask = self._rng.random(len(actions)) <= self.epsilon
+            actions[random_mask] = self._rng.integers(0, self.action_size, int(random_mask.sum()))
+            self.total_actions += int(len(actions) - random_mask.sum())
+        else:
+            self.total_actions += len(actions)
+        return actions
+    
+    def _greedy_batch(self, states) -> np.ndarray:
+        """Greedy actions for a batch, predicting only the cache misses."""
+        cache = self.decision_cache
+        if cache is None:
+            return self.predict(states).argmax(axis=1)
+        
+        scaled = self._prepare(states)
+        keys = self._cache_keys(scaled)
+        actions = np.empty(len(keys), dtype=np.int64)
+        missing = []
+        for i, key in enumerate(keys):
+            action = cache.get(key)
+            if action is None:
+                missing.append(i)
+            else:
+                actions[i] = action
+        if missing:
+            actions[missing] = self.q_network.forward(scaled[missing]).argmax(axis=1)
+            for i in missing:
+                cache.put(keys[i], int(actions[i]))
+        return actions
+    
+    def replay(self, batch_size: int = 32):
+        """Train agent on batch of experiences.
+        
+        One batched forward/backward pass over the minibatch; the target network
+        is re-synced every ``target_update_freq`` calls.
+        
+        Args:
+            batch_size: Number of experiences to sample
+        """
+        if len(self.memory) < batch_size:
+            return
+        
+        minibatch = self._random.sample(self.memory, batch_size)
+        states, actions, rewards, next_states, dones = zip(*minibatch)
+        states = self._prepare(states)
+        next_states = self._prepare(next_states)
+        actions = np.asarray(actions, dtype=np.int64)
+        rewards = np.asarray(rewards, dtype=np.float32)
+        not_done = 1.0 - np.asarray(dones, dtype=np.float32)
+        
+        # TD targets from the target network
+        targets = rewards + self.gamma * not_done * self.target_network.forward(next_states).max(axis=1)
+        
+        q_values, activations = self.q_network.forward_train(states)
+        rows = np.arange(batch_size)
+        td_error = q_values[rows, actions] - targets
+        
+        # Huber loss gradient, only through the taken actions
+        grad_q = np.zeros_like(q_values)
+        grad_q[rows, actions] = np.clip(td_error, -1.0, 1.0) / batch_size
+        grads = self.q_network.backward(activations, grad_q)
+        self.optimizer.step(self.q_network.params, grads)
+        if self.decision_cache is not None:
+            self.decision_cache.clear()
+        
+        self.train_steps += 1
+        if self.train_steps % self.target_update_freq == 0:
+            self.target_network.copy_from(self.q_network)
+        
+        # Decay exploration rate
+        if self.epsilon > self.epsilon_min:
+            self.epsilon *= self.epsilon_decay
+    
+    def evaluate_collision_risk(self, state: List[float]) -> float:
+        """Evaluate collision risk for current state.
+        
+        Args:
+            state: Current state vector
+        
+        Returns:
+            Collision risk probability (0-1)
+        """
+        distance = state[0]
+        relative_speed = state[1]
+        
+        # Simple risk calculation based on stopping distance
+        if distance <= 0:
+            return 1.0
+        
+        # Time to collision
+        if relative_speed > 0:
+            ttc = distance / relative_speed
+            if ttc < 2.0:  # Less than 2 seconds
+                risk = 1.0 - (ttc / 2.0)
+                return min(max(risk, 0.0), 1.0)
+        
+        # Distance-based risk
+        safe_distance = 30.0  # meters
+        if distance < safe_distance:
+            risk = 1.0 - (distance / safe_distance)
+            return min(max(risk, 0.0), 1.0)
+        
+        return 0.0
+    
+    def evaluate_collision_risk_batch(self, states) -> np.ndarray:
+        """Evaluate collision risk for a batch of states.
+        
+        Args:
+            states: Array-like of shape (batch, state_size)
+            
+        Returns:
+            Collision risk per state (0-1), shape (batch,)
+        """
+        return collision_risk_batch(states)
+    
+    def get_action_name(self, action: int) -> str:
+        """Get human-readable action name.
+        
+        Args:
+            action: Action index
+        
+        Returns:
+            Action name string
+        """
+        return ACTION_NAMES.get(action, "Unknown")
+    
+    def record_outcomes(self, avoided: int):
+        """Credit collisions avoided by this agent's decisions.
+        
+        Args:
+            avoided: Scenarios where the agent avoided a collision that the
+                maintain-speed policy did not (see ``rl_engine.evaluation``)
+        """
+        self.collisions_avoided += int(avoided)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get agent performance statistics.
+        
+        Returns:
+            Dictionary of performance metrics
+        """
+        if self.total_actions > 0:
+            self.success_rate = self.collisions_avoided / self.total_actions
+        
+        return {
+            'total_actions': self.total_actions,
+            'collisions_avoided': self.collisions_avoided,
+            'success_rate': self.success_rate,
+            'epsilon': self.epsilon,
+            'memory_size': len(self.memory),
+            'train_steps': self.train_steps,
+            'network_parameters': self.q_network.num_parameters(),
+            'decision_cache': self.decision_cache.get_stats() if self.decision_cache is not None else None
+        }
+    
+    def save_model(self, filepath: str):
+        """Save network weights to file.
+        
+        Args:
+            filepath: Path to save file
+        """
+        import json
+        
+        model_data = {
+            'architecture': list(self.q_network.layer_sizes),
+            'weights': [w.tolist() for w in self.q_network.weights],
+            'biases': [b.tolist() for b in self.q_network.biases],
+            'epsilon': self.epsilon,
+            'train_steps': self.train_steps,
+            'stats': self.get_stats()
+        }
+        
+        with open(filepath, 'w') as f:
+            json.dump(model_data, f)
+        
+        logger.info(f"Model saved to {filepath}")
+    
+    def load_model(self, filepath: str):
+        """Load network weights from file.
+        
+        Args:
+            filepath: Path to load file
+        
+        Raises:
+            ValueError: If the file holds a Q-table or a different architecture
+        """
+        import json
+        
+        with open(filepath, 'r') as f:
+            model_data = json.load(f)
+        
+        if 'weights' not in model_data:
+            raise ValueError(f"{filepath} is not a DQN network model (Q-table models load into QTableAgent)")
+        if tuple(model_data['architecture']) != self.q_network.layer_sizes:
+            raise ValueError(f"Model architecture {model_data['architecture']} does not match "
+                             f"{list(self.q_network.layer_sizes)}")
+        
+        for dst, src in zip(self.q_network.weights, model_data['weights']):
+            dst[...] = np.asarray(src, dtype=np.float32)
+        for dst, src in zip(self.q_network.biases, model_data['biases']):
+            dst[...] = np.asarray(src, dtype=np.float32)
+        self.target_network.copy_from(self.q_network)
+        if self.decision_cache is not None:
+            self.decision_cache.clear()
+        self.epsilon = model_data['epsilon']
+        self.train_steps = model_data.get('train_steps', 0)
+        
+        logger.info(f"Model loaded from {filepath}")
+
+
+class QTableAgent:
+    """Tabular Q-learning agent for collision avoidance decisions.
+    
+    The original dict-backed Q-table implementation, kept as the training
+    throughput and decision-quality reference for the network-based DQNAgent.
+    
+    Attributes:
+        state_size (int): Dimension of state space
+        action_size (int): Number of possible actions
+        memory (deque): Experience replay buffer
+        gamma (float): Discount factor for future rewards
+        epsilon (float): Exploration rate
+        learning_rate (float): Learning rate for Q-network
+    """
+    
+    def __init__(self, state_size: int = 8, action_size: int = 5):
+        """Initialize Q-table Agent.
+        
         Args:
             state_size: Size of state vector (default: 8)
                 - distance_to_vehicle (m)
@@ -62,7 +722,7 @@ class DQNAgent:
         self.epsilon_decay = 0.995
         self.learning_rate = 0.001
         
-        # Simple Q-table for demonstration (in production, use neural network)
+        # Q-table keyed by discretized state
         self.q_table = {}
         
         # Performance metrics
@@ -70,7 +730,7 @@ class DQNAgent:
         self.total_actions = 0
         self.success_rate = 0.0
         
-        logger.info(f"DQN Agent initialized: state_size={state_size}, action_size={action_size}")
+        logger.info(f"Q-table Agent initialized: state_size={state_size}, action_size={action_size}")
     
     def _discretize_state(self, state: List[float]) -> str:
         """Convert continuous state to discrete for Q-table lookup.
@@ -205,14 +865,7 @@ class DQNAgent:
         Returns:
             Action name string
         """
-        action_names = {
-            0: "Maintain Speed",
-            1: "Decelerate Gradually",
-            2: "Hard Brake",
-            3: "Change Lane Left",
-            4: "Change Lane Right"
-        }
-        return action_names.get(action, "Unknown")
+        return ACTION_NAMES.get(action, "Unknown")
     
     def get_stats(self) -> Dict[str, Any]:
         """Get agent performance statistics.
@@ -275,10 +928,15 @@ class RuleBasedAgent:
     Serves as a baseline for DQN agent performance.
     """
     
-    def __init__(self):
-        """Initialize rule-based agent."""
+    def __init__(self, seed: int = None):
+        """Initialize rule-based agent.
+        
+        Args:
+            seed: Random seed for the batch path's lane-change choice
+        """
         self.total_actions = 0
         self.collisions_avoided = 0
+        self._rng = np.random.default_rng(seed)
         logger.info("Rule-based agent initialized")
     
     def act(self, state: List[float]) -> int:
@@ -310,6 +968,39 @@ class RuleBasedAgent:
         # Maintain speed
         return 0
     
+    def act_batch(self, states) -> np.ndarray:
+        """Apply the rules to a batch of states at once.
+        
+        Args:
+            states: Array-like of shape (batch, state_size)
+            
+        Returns:
+            Selected action indices, shape (batch,)
+        """
+        states = np.asarray(states, dtype=np.float64)
+        states = states.reshape(-1, states.shape[-1])
+        distance = states[:, 0]
+        relative_speed = states[:, 1]
+        actions = np.zeros(len(states), dtype=np.int64)
+        
+        # Assigned from lowest to highest precedence
+        lane_change = (distance < 50) & (relative_speed > 10)
+        actions[lane_change] = np.where(self._rng.random(int(lane_change.sum())) > 0.5, 3, 4)
+        actions[(distance < 30) & (relative_speed > 0)] = 1  # Decelerate gradually
+        actions[(distance < 10) & (relative_speed > 0)] = 2  # Hard brake
+        
+        self.total_actions += len(actions)
+        return actions
+    
+    def record_outcomes(self, avoided: int):
+        """Credit collisions avoided by this agent's decisions.
+        
+        Args:
+            avoided: Scenarios where the agent avoided a collision that the
+                maintain-speed policy did not (see ``rl_engine.evaluation``)
+        """
+        self.collisions_avoided += int(avoided)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get agent statistics.
         
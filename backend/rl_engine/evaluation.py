@@ -0,0 +1,333 @@
+"""Large-Scale Agent Evaluation: DQNAgent vs RuleBasedAgent
+
+Scores ``DQNAgent`` and its ``RuleBasedAgent`` baseline on the same seeded
+scenarios from ``V2VEnvironment``. A share of the scenarios start with the
+lead vehicle braking. Each scenario is rolled out for a short horizon three
+times: once with each agent and once with a maintain-speed reference policy.
+Decisions go through the agents' vectorized ``act_batch`` paths.
+
+The comparison is paired. Each rollout of a scenario starts from the same
+initial conditions and sees the same later events: lead braking, speed noise
+and lane-change outcomes. The environment draws these from a stream that
+does not depend on the actions taken, so outcome differences come from the
+policies alone.
+
+Reported per agent:
+    - collision_rate: share of scenarios that ended in a collision
+    - collisions_avoided: scenarios where the reference collided but the agent
+      did not (also credited to the agent via ``record_outcomes``)
+    - collisions_induced: scenarios where the agent collided but the reference
+      did not
+    - avg_risk_reduction: mean over scenarios of the reference's peak collision
+      risk minus the agent's peak risk
+    - decisions_per_second: decisions divided by the time spent in ``act_batch``
+      (summed over workers, so this is the per-process rate)
+
+Scenarios are generated in fixed-size chunks. Each chunk is seeded from
+``--seed`` and its chunk index. Chunks are split across worker processes for
+large runs, so the same seed and chunk size give the same scenarios for any
+number of processes.
+
+Usage (from the backend directory):
+    python -m rl_engine.evaluation --scenarios 1000000 --model models/dqn.json
+    python -m rl_engine.evaluation --scenarios 100000 --processes 1 -o eval.json
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+AGENTS = ('dqn', 'rule_based')
+REFERENCE = 'maintain'
+DEFAULT_CHUNK_SIZE = 65536
+SEED_STRIDE = 1_000_003
+
+# Counters summed across chunks and processes
+COUNTERS = ('scenarios', 'collisions', 'avoided', 'induced', 'peak_risk_sum',
+            'risk_reduction_sum', 'decisions', 'decision_seconds')
+
+
+def make_scenarios(num_scenarios: int, seed: int, horizon: int, dt: float, hazard_share: float):
+    """Create a seeded batch of scenarios.
+
+    Args:
+        num_scenarios: Scenarios in the batch
+        seed: Seed for the environment (initial conditions and event stream)
+        horizon: Steps per rollout
+        dt: Step length in seconds
+        hazard_share: Share of scenarios where the lead vehicle starts braking
+
+    Returns:
+        tuple: (environment, initial states)
+    """
+    from .environment import DRY_MAX_DECELERATION, FRICTION, V2VEnvironment
+
+    env = V2VEnvironment(num_envs=num_scenarios, dt=dt, max_steps=horizon, seed=seed)
+    states = env.reset()
+    rng = env.rng
+    hazard = rng.random(num_scenarios) < hazard_share
+    strength = rng.uniform(0.3, 1.0, num_scenarios) * DRY_MAX_DECELERATION * FRICTION[env.weather]
+    env.brake_time = np.where(hazard, rng.uniform(1.0, 3.0, num_scenarios), 0.0)
+    env.lead_acceleration = np.where(hazard, -strength, 0.0)
+    return env, states
+
+
+def rollout(policy: Callable[[np.ndarray], np.ndarray], num_scenarios: int, seed: int,
+            settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Roll a policy out on one seeded scenario batch.
+
+    Only the first episode of each scenario counts. Rows that finished early
+    stop asking the policy for decisions.
+
+    Args:
+        policy: Maps a (batch, 8) state array to action indices
+        num_scenarios: Scenarios in the batch
+        seed: Scenario seed
+        settings: ``horizon``, ``dt`` and ``hazard_share``
+
+    Returns:
+        dict: ``collided`` and ``peak_risk`` per scenario, plus ``decisions``
+        and ``decision_seconds``
+    """
+    env, states = make_scenarios(num_scenarios, seed, settings['horizon'], settings['dt'],
+                                 settings['hazard_share'])
+    active = np.ones(num_scenarios, dtype=bool)
+    collided = np.zeros(num_scenarios, dtype=bool)
+    peak_risk = np.zeros(num_scenarios)
+    actions = np.zeros(num_scenarios, dtype=np.int64)
+    decisions = 0
+    decision_seconds = 0.0
+
+    for _ in range(settings['horizon']):
+        rows = np.flatnonzero(active)
+        if len(rows) == 0:
+            break
+        actions[:] = 0
+        started = time.perf_counter()
+        actions[rows] = policy(states[rows])
+        decision_seconds += time.perf_counter() - started
+        decisions += len(rows)
+
+        states, _, dones, info = env.step(actions)
+        peak_risk = np.where(active, np.maximum(peak_risk, info['final_states'][:, 7]), peak_risk)
+        collided |= active & info['collisions']
+        active &= ~dones
+
+    return {
+        'collided': collided,
+        'peak_risk': peak_risk,
+        'decisions': decisions,
+        'decision_seconds': decision_seconds
+    }
+
+
+def _empty_counters() -> Dict[str, float]:
+    return {name: 0 for name in COUNTERS}
+
+
+def evaluate_agents(agents: Dict[str, Any], chunks: List[int], settings: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Evaluate agents against the reference policy on the given chunks.
+
+    Each agent is credited with its avoided collisions via ``record_outcomes``.
+
+    Args:
+        agents: Agent name -> agent with ``act_batch``
+        chunks: Chunk indices to evaluate
+        settings: ``num_scenarios``, ``chunk_size``, ``seed``, ``horizon``,
+            ``dt`` and ``hazard_share``
+
+    Returns:
+        dict: Counters per agent name and for ``REFERENCE``
+    """
+    totals = {name: _empty_counters() for name in list(agents) + [REFERENCE]}
+    policies = {name: agent.act_batch for name, agent in agents.items()}
+    policies[REFERENCE] = lambda states: np.zeros(len(states), dtype=np.int64)
+
+    for chunk in chunks:
+        start = chunk * settings['chunk_size']
+        size = min(settings['chunk_size'], settings['num_scenarios'] - start)
+        if size <= 0:
+            continue
+        seed = settings['seed'] * SEED_STRIDE + chunk
+        reference = rollout(policies[REFERENCE], size, seed, settings)
+
+        for name, policy in policies.items():
+            result = reference if name == REFERENCE else rollout(policy, size, seed, settings)
+            counters = totals[name]
+            counters['scenarios'] += size
+            counters['collisions'] += int(result['collided'].sum())
+            counters['peak_risk_sum'] += float(result['peak_risk'].sum())
+            counters['decisions'] += result['decisions']
+            counters['decision_seconds'] += result['decision_seconds']
+            if name == REFERENCE:
+                continue
+            avoided = int((reference['collided'] & ~result['collided']).sum())
+            counters['avoided'] += avoided
+            counters['induced'] += int((result['collided'] & ~reference['collided']).sum())
+            counters['risk_reduction_sum'] += float((reference['peak_risk'] - result['peak_risk']).sum())
+            agents[name].record_outcomes(avoided)
+
+    return totals
+
+
+def build_agents(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Create the DQN agent (loading ``model_path`` if given) and the baseline."""
+    from .dqn_agent import DQNAgent, RuleBasedAgent
+
+    dqn = DQNAgent(seed=settings['seed'])
+    if settings.get('model_path'):
+        dqn.load_model(settings['model_path'])
+    return {'dqn': dqn, 'rule_based': RuleBasedAgent(seed=settings['seed'])}
+
+
+def run_shard(chunks: List[int], settings: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Worker entry point: evaluate fresh agents on a list of chunks."""
+    return evaluate_agents(build_agents(settings), chunks, settings)
+
+
+def merge_counters(results: List[Dict[str, Dict[str, float]]]) -> Dict[str, Dict[str, float]]:
+    """Sum per-policy counters from several shards."""
+    merged: Dict[str, Dict[str, float]] = {}
+    for result in results:
+        for name, counters in result.items():
+            total = merged.setdefault(name, _empty_counters())
+            for key in COUNTERS:
+                total[key] += counters[key]
+    return merged
+
+
+def summarize(totals: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Turn summed counters into the reported metrics per policy."""
+    summary = {}
+    for name, counters in totals.items():
+        scenarios = counters['scenarios'] or 1
+        summary[name] = {
+            'scenarios': counters['scenarios'],
+            'collisions': counters['collisions'],
+            'collision_rate': counters['collisions'] / scenarios,
+            'avg_peak_risk': counters['peak_risk_sum'] / scenarios,
+            'decisions': counters['decisions'],
+            'decisions_per_second': (counters['decisions'] / counters['decision_seconds']
+                                     if counters['decision_seconds'] > 0 else 0.0)
+        }
+        if name != REFERENCE:
+            summary[name].update({
+                'collisions_avoided': counters['avoided'],
+                'collisions_induced': counters['induced'],
+                'avg_risk_reduction': counters['risk_reduction_sum'] / scenarios
+            })
+    return summary
+
+
+def run_evaluation(settings: Dict[str, Any], processes: Optional[int] = None,
+                   agents: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Evaluate both agents on ``settings['num_scenarios']`` scenarios.
+
+    Args:
+        settings: See ``evaluate_agents``; ``model_path`` is used by workers
+        processes: Worker processes (default: all cores, capped by the chunk
+            count). With one process the run is in-process.
+        agents: In-process agents to evaluate (and credit) instead of fresh
+            ones; forces a single process
+
+    Returns:
+        dict: ``settings``, ``processes``, ``wall_seconds``,
+        ``scenarios_per_second`` and the ``results`` per policy
+    """
+    num_chunks = -(-settings['num_scenarios'] // settings['chunk_size'])
+    processes = 1 if agents is not None else min(processes or os.cpu_count() or 1, num_chunks)
+    started = time.perf_counter()
+
+    if processes <= 1:
+        totals = evaluate_agents(agents or build_agents(settings), list(range(num_chunks)), settings)
+    else:
+        # Single-threaded BLAS per worker; parallelism comes from the processes
+        for variable in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+            os.environ.setdefault(variable, '1')
+        shards = [list(range(num_chunks))[i::processes] for i in range(processes)]
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+            totals = merge_counters(list(pool.map(run_shard, shards, [settings] * processes)))
+
+    wall_seconds = time.perf_counter() - started
+    logger.info(f"Evaluated {settings['num_scenarios']} scenarios in {wall_seconds:.1f}s "
+                f"on {processes} process(es)")
+    return {
+        'settings': settings,
+        'processes': processes,
+        'wall_seconds': wall_seconds,
+        'scenarios_per_second': settings['num_scenarios'] / wall_seconds if wall_seconds > 0 else 0.0,
+        'results': summarize(totals)
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render the evaluation report as a markdown table."""
+    lines = [
+        "| policy | collision rate | avoided | induced | avg risk reduction | decisions/s |",
+        "|---|---|---|---|---|---|"
+    ]
+    for name in AGENTS + (REFERENCE,):
+        result = report['results'][name]
+        lines.append(
+            f"| {name} | {result['collision_rate']:.4%} | {result.get('collisions_avoided', '-')} | "
+            f"{result.get('collisions_induced', '-')} | "
+            + (f"{result['avg_risk_reduction']:.4f}" if 'avg_risk_reduction' in result else '-')
+            + f" | {result['decisions_per_second']:,.0f} |")
+    lines.append("")
+    lines.append(f"{report['settings']['num_scenarios']:,} scenarios x {report['settings']['horizon']} steps, "
+                 f"{report['processes']} process(es), {report['wall_seconds']:.1f}s "
+                 f"({report['scenarios_per_second']:,.0f} scenarios/s)")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate DQNAgent against RuleBasedAgent on seeded scenarios")
+    parser.add_argument('--scenarios', type=int, default=1_000_000)
+    parser.add_argument('--horizon', type=int, default=16, help="Steps per scenario")
+    parser.add_argument('--dt', type=float, default=0.5, help="Step length in seconds")
+    parser.add_argument('--hazard-share', type=float, default=0.5,
+                        help="Share of scenarios that start with the lead vehicle braking")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Scenarios per vectorized batch")
+    parser.add_argument('--model', default=os.environ.get('V2V_DQN_MODEL_PATH'),
+                        help="DQN weights to load (default: V2V_DQN_MODEL_PATH, else untrained)")
+    parser.add_argument('--processes', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    if not args.model:
+        logger.warning("No DQN model given; evaluating untrained weights")
+
+    settings = {
+        'num_scenarios': args.scenarios,
+        'chunk_size': args.chunk_size,
+        'horizon': args.horizon,
+        'dt': args.dt,
+        'hazard_share': args.hazard_share,
+        'model_path': args.model,
+        'seed': args.seed
+    }
+    report = run_evaluation(settings, args.processes)
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
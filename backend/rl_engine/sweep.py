@@ -0,0 +1,354 @@
+"""Hyperparameter Sweep Runner for the DQN Agent
+
+Trains ``DQNAgent`` configurations on the local ``V2VEnvironment`` in a process
+pool (one trial per core) and ranks them by greedy evaluation score.
+
+- ``--mode grid`` enumerates every combination of the search space;
+  ``--mode random`` samples ``--trials`` configurations (log-uniform where
+  marked) with a fixed seed, so trial ids are stable across runs.
+- Each trial is evaluated at ``--rungs`` checkpoints spread evenly over its
+  steps. A trial is stopped early if its score diverges or falls (by more
+  than ``--prune-margin``) below the ``--prune-percentile`` score of the
+  finished trials at the same rung. The default 25th percentile prunes only
+  clearly weak trials; 50 gives the classic median rule, which stops about
+  half of all trials.
+- Every finished trial is appended to ``<out>/trials.jsonl`` as it completes.
+  Trial ids hash the configuration together with the run settings (steps,
+  environments, rungs, evaluation and seed), so re-running with the same
+  arguments skips trials already recorded there, while changed settings run
+  fresh trials. Failed trials are retried unless ``--skip-failed`` is given.
+- ``<out>/results.md`` holds the ranked table, including wall-clock
+  seconds per trial.
+
+Usage (from the backend directory):
+    python -m rl_engine.sweep --mode grid --out sweeps/grid1
+    python -m rl_engine.sweep --mode random --trials 40 --steps 4000 --out sweeps/rand1
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import logging
+import math
+import multiprocessing
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from . import DEFAULT_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Grid mode uses the lists; random mode samples each list uniformly, or the
+# {'low', 'high', 'log'} ranges where given
+DEFAULT_SPACE = {
+    'gamma': [0.9, 0.95, 0.99],
+    'epsilon_decay': [0.99, 0.995, 0.999],
+    'learning_rate': [3e-4, 1e-3, 3e-3],
+    'memory_size': [2000, 10000],
+    'batch_size': [32, 64]
+}
+RANDOM_RANGES = {
+    'gamma': {'low': 0.85, 'high': 0.995},
+    'learning_rate': {'low': 1e-4, 'high': 1e-2, 'log': True},
+    'epsilon_decay': {'low': 0.98, 'high': 0.9995}
+}
+AGENT_PARAMS = ('gamma', 'epsilon_decay', 'learning_rate', 'memory_size', 'target_update_freq', 'hidden_sizes')
+
+
+def grid_configs(space: Dict[str, list]) -> List[Dict[str, Any]]:
+    """Every combination of the space's value lists."""
+    names = sorted(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def random_configs(space: Dict[str, list], ranges: Dict[str, dict], trials: int, seed: int) -> List[Dict[str, Any]]:
+    """``trials`` seeded samples; ranged parameters are drawn continuously."""
+    rng = random.Random(seed)
+    configs = []
+    for _ in range(trials):
+        config = {}
+        for name in sorted(set(space) | set(ranges)):
+            spec = ranges.get(name)
+            if spec is None:
+                config[name] = rng.choice(space[name])
+            elif spec.get('log'):
+                config[name] = math.exp(rng.uniform(math.log(spec['low']), math.log(spec['high'])))
+            else:
+                config[name] = rng.uniform(spec['low'], spec['high'])
+        configs.append(config)
+    return configs
+
+
+def trial_id(config: Dict[str, Any], settings: Dict[str, Any]) -> str:
+    """Stable short id of a configuration trained under ``settings``."""
+    key = json.dumps({'config': config, 'settings': settings}, sort_keys=True)
+    return hashlib.sha1(key.encode()).hexdigest()[:10]
+
+
+def evaluate(agent, num_envs: int, steps: int, seed: int) -> Dict[str, float]:
+    """Greedy rollout on a fixed-seed environment batch.
+
+    Returns:
+        dict: ``score`` (mean reward per step) and ``collision_rate`` (share of
+        the episodes started during the rollout that ended in a collision)
+    """
+    from .environment import V2VEnvironment
+
+    env = V2VEnvironment(num_envs=num_envs, seed=seed)
+    states = env.reset()
+    total_reward = 0.0
+    for _ in range(steps):
+        states, rewards, _, _ = env.step(agent.act_batch(states))
+        total_reward += float(rewards.sum())
+    return {
+        'score': total_reward / (steps * num_envs),
+        'collision_rate': env.collisions / (num_envs + env.episodes)
+    }
+
+
+def run_trial(config: Dict[str, Any], settings: Dict[str, Any],
+              cutoffs: Dict[int, float]) -> Dict[str, Any]:
+    """Train and evaluate one configuration; runs in a worker process.
+
+    Args:
+        config: Hyperparameters (AGENT_PARAMS plus batch_size)
+        settings: Sweep-wide budget and environment settings
+        cutoffs: Pruning score per rung from the trials finished so far
+
+    Returns:
+        dict: Trial record (also the checkpoint line)
+    """
+    import numpy as np
+    from .dqn_agent import DQNAgent
+    from .environment import V2VEnvironment
+
+    logging.getLogger('rl_engine').setLevel(logging.WARNING)
+    started = time.perf_counter()
+    agent_kwargs = {name: config[name] for name in AGENT_PARAMS if name in config}
+    if 'hidden_sizes' in agent_kwargs:
+        agent_kwargs['hidden_sizes'] = tuple(agent_kwargs['hidden_sizes'])
+    if 'memory_size' in agent_kwargs:
+        agent_kwargs['memory_size'] = int(agent_kwargs['memory_size'])
+    batch_size = int(config.get('batch_size', DEFAULT_CONFIG['batch_size']))
+    agent = DQNAgent(seed=settings['seed'], **agent_kwargs)
+    env = V2VEnvironment(num_envs=settings['num_envs'], seed=settings['seed'])
+
+    steps, rungs = settings['steps'], settings['rungs']
+    # Exactly ``rungs`` evenly spaced checkpoints, the last one at ``steps``
+    rung_steps = {max(1, steps * (r + 1) // rungs) for r in range(rungs)}
+    history, status = [], 'completed'
+    states = env.reset()
+    for step in range(1, steps + 1):
+        actions = agent.act_batch(states, explore=True)
+        next_states, rewards, dones, info = env.step(actions)
+        final_states = info['final_states']
+        for i in range(env.num_envs):
+            agent.remember(states[i].tolist(), int(actions[i]), float(rewards[i]),
+                           final_states[i].tolist(), bool(dones[i]))
+        states = next_states
+        agent.replay(batch_size)
+
+        if step in rung_steps:
+            rung = len(history)
+            result = evaluate(agent, settings['eval_envs'], settings['eval_steps'], settings['eval_seed'])
+            history.append(result)
+            if not all(np.isfinite(p).all() for p in agent.q_network.params):
+                status = 'diverged'
+                break
+            cutoff = cutoffs.get(rung)
+            if cutoff is not None and step < steps and result['score'] < cutoff - settings['prune_margin']:
+                status = 'pruned'
+                break
+
+    final = history[-1] if history else {'score': float('-inf'), 'collision_rate': 1.0}
+    return {
+        'trial_id': trial_id(config, settings),
+        'config': config,
+        'settings': settings,
+        'status': status,
+        'score': final['score'],
+        'collision_rate': final['collision_rate'],
+        'rung_scores': [round(h['score'], 5) for h in history],
+        'train_steps': agent.train_steps,
+        'wall_seconds': round(time.perf_counter() - started, 3)
+    }
+
+
+def load_checkpoint(path: str) -> Dict[str, Dict[str, Any]]:
+    """Trial records already written to ``trials.jsonl``, keyed by id."""
+    records = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    record = json.loads(line)
+                    records[record['trial_id']] = record
+    return records
+
+
+def rung_cutoffs(records, percentile: int = 25) -> Dict[int, float]:
+    """``percentile``-th score per rung over the recorded trials.
+
+    Rungs reached by fewer than three trials get no cutoff.
+    """
+    per_rung: Dict[int, List[float]] = {}
+    for record in records:
+        for rung, score in enumerate(record['rung_scores']):
+            per_rung.setdefault(rung, []).append(score)
+    return {rung: statistics.quantiles(scores, n=100, method='inclusive')[percentile - 1]
+            for rung, scores in per_rung.items() if len(scores) >= 3}
+
+
+def results_table(records: List[Dict[str, Any]], param_names: List[str]) -> str:
+    """Markdown table ranked by status (finished first) then score."""
+    ranked = sorted(records, key=lambda r: (r['status'] != 'completed', -r['score']))
+    header = ['rank', 'trial', 'status', 'score', 'collision_rate'] + param_names + ['rungs', 'wall_s']
+    lines = ['| ' + ' | '.join(header) + ' |', '|' + '---|' * len(header)]
+    for rank, record in enumerate(ranked, 1):
+        config = record['config']
+        row = [str(rank), record['trial_id'], record['status'], f"{record['score']:.4f}",
+               f"{record['collision_rate']:.3f}"]
+        row += [f"{config[name]:.4g}" if isinstance(config.get(name), float) else str(config.get(name, ''))
+                for name in param_names]
+        row += [str(len(record['rung_scores'])), f"{record['wall_seconds']:.1f}"]
+        lines.append('| ' + ' | '.join(row) + ' |')
+    return '\n'.join(lines) + '\n'
+
+
+def run_sweep(configs: List[Dict[str, Any]], settings: Dict[str, Any], out_dir: str,
+              workers: Optional[int] = None, skip_failed: bool = False) -> List[Dict[str, Any]]:
+    """Run the configurations not yet in the checkpoint and write the results.
+
+    Args:
+        configs: Configurations to evaluate
+        settings: Budget/environment settings passed to every trial
+        out_dir: Directory for trials.jsonl and results.md
+        workers: Worker processes (default: all cores)
+        skip_failed: Keep recorded failures instead of retrying them
+
+    Returns:
+        list: All trial records for ``configs``, ranked
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    checkpoint = os.path.join(out_dir, 'trials.jsonl')
+    ids = {trial_id(config, settings) for config in configs}
+    # Records of other settings stay in the file but are neither reused nor
+    # counted in the pruning cutoffs
+    done = {tid: record for tid, record in load_checkpoint(checkpoint).items()
+            if tid in ids and (skip_failed or record['status'] != 'failed')}
+    pending = [config for config in configs if trial_id(config, settings) not in done]
+    logger.info(f"Sweep: {len(configs)} trials, {len(configs) - len(pending)} already done, {len(pending)} to run")
+
+    # Single-threaded BLAS per worker; parallelism comes from the processes
+    for variable in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+        os.environ.setdefault(variable, '1')
+    workers = workers or os.cpu_count() or 1
+    context = multiprocessing.get_context('spawn')
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool, open(checkpoint, 'a') as log:
+        queue = list(pending)
+        running = {}
+        while queue or running:
+            # Submit with the freshest cutoffs so later trials prune against more data
+            while queue and len(running) < workers:
+                config = queue.pop(0)
+                cutoffs = rung_cutoffs(done.values(), settings['prune_percentile'])
+                running[pool.submit(run_trial, config, settings, cutoffs)] = config
+            future = next(as_completed(running))
+            config = running.pop(future)
+            try:
+                record = future.result()
+            except Exception as e:
+                logger.error(f"Trial {trial_id(config, settings)} failed: {e}")
+                record = {'trial_id': trial_id(config, settings), 'config': config,
+                          'settings': settings, 'status': 'failed',
+                          'score': float('-inf'), 'collision_rate': 1.0, 'rung_scores': [],
+                          'train_steps': 0, 'wall_seconds': 0.0}
+            done[record['trial_id']] = record
+            log.write(json.dumps(record) + '\n')
+            log.flush()
+            logger.info(f"Trial {record['trial_id']} {record['status']}: score={record['score']:.4f} "
+                        f"({record['wall_seconds']:.1f}s, {len(done)}/{len(configs)})")
+
+    records = [done[trial_id(config, settings)] for config in configs]
+    param_names = sorted({name for config in configs for name in config})
+    table = results_table(records, param_names)
+    with open(os.path.join(out_dir, 'results.md'), 'w') as f:
+        f.write(table)
+    return sorted(records, key=lambda r: (r['status'] != 'completed', -r['score']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel DQN hyperparameter sweep")
+    parser.add_argument('--mode', choices=('grid', 'random'), default='grid')
+    parser.add_argument('--trials', type=int, default=32, help="Random mode: number of samples")
+    parser.add_argument('--space', help="JSON file overriding the search space (name -> list or range)")
+    parser.add_argument('--steps', type=int, default=3000, help="Environment steps per trial")
+    parser.add_argument('--num-envs', type=int, default=8, help="Parallel environments per trial")
+    parser.add_argument('--rungs', type=int, default=4, help="Evaluation checkpoints per trial")
+    parser.add_argument('--eval-envs', type=int, default=64)
+    parser.add_argument('--eval-steps', type=int, default=200)
+    parser.add_argument('--prune-percentile', type=int, default=25,
+                        help="Prune trials scoring below this percentile of their rung (50: median rule)")
+    parser.add_argument('--prune-margin', type=float, default=0.0,
+                        help="Score slack below the rung cutoff before pruning")
+    parser.add_argument('--workers', type=int, default=None, help="Processes (default: all cores)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default='sweeps/latest', help="Output/checkpoint directory")
+    parser.add_argument('--skip-failed', action='store_true',
+                        help="Do not retry trials recorded as failed in the checkpoint")
+    args = parser.parse_args()
+    if not 1 <= args.prune_percentile <= 99:
+        parser.error("--prune-percentile must be between 1 and 99")
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    space, ranges, custom_ranges = dict(DEFAULT_SPACE), dict(RANDOM_RANGES), False
+    if args.space:
+        with open(args.space) as f:
+            for name, spec in json.load(f).items():
+                if isinstance(spec, dict):
+                    ranges[name] = spec
+                    space.pop(name, None)
+                    custom_ranges = True
+                else:
+                    space[name] = spec
+                    ranges.pop(name, None)
+
+    if args.mode == 'grid':
+        if custom_ranges:
+            parser.error("grid mode needs value lists, not ranges")
+        configs = grid_configs(space)
+    else:
+        configs = random_configs(space, ranges, args.trials, args.seed)
+
+    settings = {
+        'steps': args.steps,
+        'num_envs': args.num_envs,
+        'rungs': args.rungs,
+        'eval_envs': args.eval_envs,
+        'eval_steps': args.eval_steps,
+        'eval_seed': args.seed + 1,
+        'prune_percentile': args.prune_percentile,
+        'prune_margin': args.prune_margin,
+        'seed': args.seed
+    }
+    started = time.perf_counter()
+    records = run_sweep(configs, settings, args.out, args.workers, args.skip_failed)
+    print(results_table(records[:20], sorted({name for config in configs for name in config})))
+    print(f"{len(records)} trials, {time.perf_counter() - started:.1f}s wall clock; full table in "
+          f"{os.path.join(args.out, 'results.md')}")
+
+
+if __name__ == '__main__':
+    main()
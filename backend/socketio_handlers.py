@@ -0,0 +1,41 @@
+"""Socket.IO Handler Registration for V2V Safety Ecosystem
+
+This module wires the Socket.IO namespaces declared in ``sockets.NAMESPACES``
+to their handlers. It is imported by ``app.create_socketio_app`` only, so the
+plain WSGI app never loads Socket.IO.
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import logging
+
+from flask import request
+
+from sockets import NAMESPACES
+from sockets.admin import register_admin_handlers
+
+logger = logging.getLogger(__name__)
+
+
+def init_socketio(socketio) -> None:
+    """Register all namespace handlers on a SocketIO instance.
+
+    Args:
+        socketio: Flask-SocketIO server instance
+    """
+    for name in ('v2v', 'safety'):
+        namespace = NAMESPACES[name]
+
+        def on_connect(auth=None, namespace=namespace):
+            logger.info(f"Client {request.sid} connected to {namespace}")
+
+        def on_disconnect(*args, namespace=namespace):
+            logger.info(f"Client {request.sid} disconnected from {namespace}")
+
+        socketio.on_event('connect', on_connect, namespace=namespace)
+        socketio.on_event('disconnect', on_disconnect, namespace=namespace)
+
+    register_admin_handlers(socketio)
+    logger.info(f"Socket.IO handlers registered for namespaces: {', '.join(NAMESPACES.values())}")
@@ -9,24 +9,24 @@ using Flask-SocketIO, including:
 - Room-based messaging for vehicle clusters
 - Broadcasting safety alerts and updates
 
+Submodules are imported on first attribute access, so importing the package
+for its configuration does not pull in the handlers.
+
 Author: V2V Safety Ecosystem Team
 Created: September 2025
 """
 
-from .handlers import SocketHandlers
-from .events import V2VEvents
-from .rooms import RoomManager
-from .auth import SocketAuth
-from .utils import SocketUtils
+import importlib
+import os
 
 __version__ = "1.0.0"
-__all__ = [
-    "SocketHandlers",
-    "V2VEvents",
-    "RoomManager",
-    "SocketAuth",
-    "SocketUtils"
-]
+
+# Public name -> submodule that defines it, imported on first access
+_LAZY_ATTRIBUTES = {
+    "register_admin_handlers": ".admin"
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
 
 # Socket.IO configuration
 SOCKET_CONFIG = {
@@ -34,8 +34,9 @@ SOCKET_CONFIG = {
     "async_mode": "threading",
     "ping_timeout": 60,
     "ping_interval": 25,
-    "logger": True,
-    "engineio_logger": True
+    # Per-packet logging is off by default; V2V_SOCKETIO_LOGGING=true enables it
+    "logger": os.environ.get('V2V_SOCKETIO_LOGGING', 'false').lower() == 'true',
+    "engineio_logger": os.environ.get('V2V_SOCKETIO_LOGGING', 'false').lower() == 'true'
 }
 
 # Event namespaces
@@ -57,3 +58,15 @@ def get_socket_config():
 def get_namespaces():
     """Return the available Socket.IO namespaces."""
     return NAMESPACES.copy()
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
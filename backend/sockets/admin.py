@@ -0,0 +1,97 @@
+"""Admin and Monitor Socket.IO Namespaces
+
+Handlers for the ``admin`` and ``monitor`` namespaces declared in
+``sockets.NAMESPACES``. Admin clients authenticate with the ``V2V_ADMIN_TOKEN``
+(``auth={'token': ...}`` on connect) and control the sampling profiler; monitor
+clients (same token) receive each finished profiling session's summary.
+
+Events on /admin:
+    profiler_start {duration_seconds, sample_rate, interval_ms} -> profiler_status
+    profiler_stop                                                -> profiler_status
+    profiler_status                                              -> profiler_status
+    profiler_collapsed {endpoint}                                -> profiler_collapsed
+
+Events emitted on /monitor:
+    profile_complete: summary of a finished session
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import logging
+
+from flask_socketio import emit
+
+from api.admin import check_admin_token
+from api.profiling import profiler
+from sockets import NAMESPACES
+
+logger = logging.getLogger(__name__)
+
+
+def _authorized(auth) -> bool:
+    token = auth.get('token') if isinstance(auth, dict) else None
+    return check_admin_token(token)
+
+
+def register_admin_handlers(socketio) -> None:
+    """Register the admin and monitor namespace handlers.
+
+    Args:
+        socketio: Flask-SocketIO server instance
+    """
+    admin_ns = NAMESPACES['admin']
+    monitor_ns = NAMESPACES['monitor']
+
+    @socketio.on('connect', namespace=admin_ns)
+    def admin_connect(auth=None):
+        if not _authorized(auth):
+            logger.warning("Rejected admin socket connection")
+            return False
+        logger.info("Admin socket connected")
+
+    @socketio.on('connect', namespace=monitor_ns)
+    def monitor_connect(auth=None):
+        if not _authorized(auth):
+            logger.warning("Rejected monitor socket connection")
+            return False
+
+    def status_payload() -> dict:
+        session = profiler.session
+        return {'success': True, 'data': session.summary() if session else None}
+
+    @socketio.on('profiler_start', namespace=admin_ns)
+    def admin_profiler_start(data=None):
+        data = data if isinstance(data, dict) else {}
+        try:
+            profiler.start(
+                duration=data.get('duration_seconds'),
+                sample_rate=float(data.get('sample_rate', 1.0)),
+                interval_ms=float(data.get('interval_ms', 5.0))
+            )
+        except (TypeError, ValueError, RuntimeError) as e:
+            emit('profiler_status', {'success': False, 'message': str(e)})
+            return
+        emit('profiler_status', status_payload())
+
+    @socketio.on('profiler_stop', namespace=admin_ns)
+    def admin_profiler_stop(data=None):
+        profiler.stop()
+        emit('profiler_status', status_payload())
+
+    @socketio.on('profiler_status', namespace=admin_ns)
+    def admin_profiler_status(data=None):
+        emit('profiler_status', status_payload())
+
+    @socketio.on('profiler_collapsed', namespace=admin_ns)
+    def admin_profiler_collapsed(data=None):
+        session = profiler.session
+        endpoint = data.get('endpoint') if isinstance(data, dict) else None
+        emit('profiler_collapsed', {'stacks': session.collapsed(endpoint) if session else ''})
+
+    def broadcast_profile(session) -> None:
+        socketio.emit('profile_complete', session.summary(), namespace=monitor_ns)
+
+    profiler.add_listener(broadcast_profile)
+    logger.info(f"Admin handlers registered on {admin_ns} and {monitor_ns}")
@@ -0,0 +1,36 @@
+"""Shared Test Fixtures
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import importlib.util
+import os
+import threading
+
+import pytest
+from werkzeug.serving import make_server
+
+SIMULATION_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'simulation')
+
+
+def load_simulation_module(name: str):
+    """Import ``simulation/<name>.py``, which is not on the backend path."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(SIMULATION_DIR, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def live_server():
+    """Serve the app on a free local port; yields its root URL."""
+    from app import create_app
+
+    server = make_server('127.0.0.1', 0, create_app('testing'), threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    thread.join()
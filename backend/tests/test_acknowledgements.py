@@ -0,0 +1,120 @@
+"""Alert Acknowledgement Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+from api.acknowledgements import AcknowledgementTracker
+
+
+def test_acknowledge_is_idempotent():
+    tracker = AcknowledgementTracker()
+
+    assert tracker.acknowledge('a', 'veh-1') is True
+    assert tracker.acknowledge('a', 'veh-1') is False
+    assert tracker.acknowledge_many([('a', 'veh-2'), ('b', 'veh-1'), ('a', 'veh-2')]) == [True, True, False]
+
+    assert tracker.count('a') == 2 and tracker.count('b') == 1 and tracker.count('c') == 0
+    assert tracker.acknowledged_by('a') == ['veh-1', 'veh-2']
+    assert tracker.is_acknowledged('b', 'veh-1') and not tracker.is_acknowledged('b', 'veh-2')
+    assert tracker.stats == {'acknowledged': 3, 'duplicates': 2}
+
+
+def test_bitmaps_hold_one_bit_per_vehicle_row():
+    tracker = AcknowledgementTracker()
+    vehicle_ids = [f"veh-{i}" for i in range(10)]
+    for vehicle_id in vehicle_ids:
+        tracker.acknowledge('a', vehicle_id)   # rows 0-9
+    tracker.acknowledge('b', vehicle_ids[0])   # row 0
+
+    assert tracker.count('a') == 10
+    assert tracker.acknowledged_by('a') == vehicle_ids
+    assert tracker.get_stats() == {'acknowledged': 11, 'duplicates': 0, 'alerts': 2, 'vehicle_rows': 10,
+                                   'bitmap_bytes': 2 + 1}
+
+
+def test_unacknowledged_keeps_input_order():
+    tracker = AcknowledgementTracker()
+    vehicles = [{'vehicle_id': f"veh-{i}"} for i in range(4)]
+    tracker.acknowledge('a', 'veh-2')
+    tracker.acknowledge('a', 'veh-0')
+
+    assert tracker.unacknowledged('a', vehicles) == [vehicles[1], vehicles[3]]
+    assert tracker.unacknowledged('other', vehicles) == vehicles
+
+
+def test_forget_vehicle_clears_bits_and_reuses_the_row():
+    tracker = AcknowledgementTracker()
+    tracker.acknowledge('a', 'veh-1')
+    tracker.acknowledge('a', 'veh-2')
+    tracker.acknowledge('b', 'veh-1')
+
+    tracker.forget_vehicle('veh-1')
+    tracker.forget_vehicle('unknown')
+
+    assert tracker.count('a') == 1 and tracker.count('b') == 0
+    assert not tracker.is_acknowledged('a', 'veh-1')
+    # The freed row goes to the next new vehicle without inheriting acknowledgements
+    tracker.acknowledge('c', 'veh-3')
+    assert tracker.get_stats()['vehicle_rows'] == 2
+    assert not tracker.is_acknowledged('a', 'veh-3')
+    assert tracker.acknowledged_by('a') == ['veh-2']
+
+
+def test_forget_alert_drops_its_bitmap():
+    tracker = AcknowledgementTracker()
+    tracker.acknowledge('a', 'veh-1')
+
+    assert tracker.forget_alert('a') is True
+    assert tracker.forget_alert('a') is False
+    assert tracker.count('a') == 0
+    assert tracker.get_stats()['alerts'] == 0
+
+
+def test_acknowledgement_endpoints():
+    from app import create_app
+    from api.routes import acknowledgements, expiry_manager, safety_alerts
+
+    client = create_app('testing').test_client()
+
+    def register(vehicle_id):
+        assert client.post('/api/vehicles/register', json={
+            'vehicle_id': vehicle_id, 'position': {'lat': -41.3, 'lon': 174.8}, 'speed': 0.0,
+            'heading': 0.0}).status_code == 200
+
+    for i in range(3):
+        register(f"ack-{i}")
+    alert = client.post('/api/safety/alerts', json={
+        'alert_type': 'ack-test', 'severity': 'high', 'position': {'lat': -41.3, 'lon': 174.8},
+        'message': 'm', 'vehicle_id': 'ack-0', 'radius': 500}).get_json()['data']
+    alert_id = alert['alert_id']
+    url = f"/api/safety/alerts/{alert_id}"
+
+    first = client.post(url + '/acknowledge', json={'vehicle_id': 'ack-1'}).get_json()['data']
+    again = client.post(url + '/acknowledge', json={'vehicle_id': 'ack-1'}).get_json()['data']
+    assert first['newly_acknowledged'] is True and again['newly_acknowledged'] is False
+    assert first['acknowledged_count'] == 2  # the reporter counts as acknowledged
+    assert client.post(url + '/acknowledge', json={'vehicle_id': 'nobody'}).status_code == 404
+    assert client.post('/api/safety/alerts/missing/acknowledge', json={'vehicle_id': 'ack-1'}).status_code == 404
+
+    bulk = client.post('/api/safety/alerts/acknowledgements', json={'acknowledgements': [
+        {'alert_id': alert_id, 'vehicle_id': 'ack-2'}, {'alert_id': 'missing', 'vehicle_id': 'ack-2'}]})
+    assert bulk.status_code == 200
+    assert bulk.get_json()['data']['newly_acknowledged'] == 1
+    assert bulk.get_json()['data']['errors'] == [{'index': 1, 'error': "Alert not found"}]
+
+    register('ack-3')
+    pending = client.get(url + '/unacknowledged').get_json()['data']
+    assert [vehicle['vehicle_id'] for vehicle in pending['vehicles']] == ['ack-3']
+
+    # What an expiry sweep does: mark the alert expired, then call the wired callback
+    assert expiry_manager.on_alert_expired == acknowledgements.forget_alert
+    safety_alerts.update(alert_id, {'status': 'expired'})
+    acknowledgements.forget_alert(alert_id)
+    assert client.post(url + '/acknowledge', json={'vehicle_id': 'ack-3'}).status_code == 410
+    assert client.get(url + '/unacknowledged').status_code == 410
+    assert acknowledgements.count(alert_id) == 0
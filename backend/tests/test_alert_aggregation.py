@@ -0,0 +1,126 @@
+"""AlertAggregator Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+from api.alert_aggregation import AlertAggregator
+from api.stores import RecordLog
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def report(alert_id, vehicle_id='veh-1', alert_type='ice', severity='low', lat=52.5, lon=13.4, radius=100):
+    return {'alert_id': alert_id, 'alert_type': alert_type, 'severity': severity,
+            'position': {'lat': lat, 'lon': lon}, 'radius': radius, 'message': 'm',
+            'source_vehicle_id': vehicle_id, 'status': 'active'}
+
+
+def make_aggregator(clock):
+    alerts = RecordLog('alert_id')
+    return AlertAggregator(alerts, merge_distance_m=150.0, window_seconds=60.0, clock=clock), alerts
+
+
+def test_first_report_creates_canonical_alert():
+    aggregator, alerts = make_aggregator(FakeClock())
+    alert, merged = aggregator.ingest(report('a'))
+
+    assert merged is False
+    assert alert['reporter_count'] == 1
+    assert alerts.get('a') == alert
+    assert len(aggregator) == 1
+
+
+def test_nearby_report_merges_and_escalates():
+    aggregator, alerts = make_aggregator(FakeClock())
+    aggregator.ingest(report('a'))
+    # About 55 m north of the first report
+    alert, merged = aggregator.ingest(report('b', vehicle_id='veh-2', severity='high', lat=52.5005))
+
+    assert merged is True
+    assert alert['alert_id'] == 'a'
+    assert alert['reporter_count'] == 2
+    assert alert['severity'] == 'high'
+    assert 150 < alert['radius'] < 160
+    assert alerts.get('b') is None
+    assert len(alerts) == 1
+    assert aggregator.stats == {'created': 1, 'merged': 1}
+
+
+def test_repeated_reporter_is_counted_once_and_severity_never_drops():
+    aggregator, _ = make_aggregator(FakeClock())
+    aggregator.ingest(report('a', severity='critical'))
+    alert, merged = aggregator.ingest(report('b', severity='low'))
+
+    assert merged is True
+    assert alert['reporter_count'] == 1
+    assert alert['severity'] == 'critical'
+
+
+def test_distance_and_type_keep_alerts_apart():
+    aggregator, alerts = make_aggregator(FakeClock())
+    aggregator.ingest(report('a'))
+
+    _, merged_far = aggregator.ingest(report('b', lat=52.51))  # about 1.1 km away
+    _, merged_other_type = aggregator.ingest(report('c', alert_type='accident'))
+
+    assert merged_far is False and merged_other_type is False
+    assert len(alerts) == 3
+
+
+def test_merge_window_closes_after_last_report():
+    clock = FakeClock()
+    aggregator, alerts = make_aggregator(clock)
+    aggregator.ingest(report('a'))
+    clock.now += 50
+    aggregator.ingest(report('b', vehicle_id='veh-2'))  # extends the window
+    clock.now += 50
+
+    _, merged = aggregator.ingest(report('c', vehicle_id='veh-3'))
+    assert merged is True
+
+    clock.now += 61
+    _, merged = aggregator.ingest(report('d', vehicle_id='veh-4'))
+    assert merged is False
+    assert [record['alert_id'] for record in alerts] == ['a', 'd']
+
+
+def test_inactive_canonical_alert_is_not_merged_into():
+    aggregator, alerts = make_aggregator(FakeClock())
+    aggregator.ingest(report('a'))
+    alerts.update('a', {'status': 'expired'})
+
+    alert, merged = aggregator.ingest(report('b', vehicle_id='veh-2'))
+
+    assert merged is False
+    assert alert['alert_id'] == 'b'
+
+
+def test_merged_report_does_not_extend_alert_ttl(monkeypatch):
+    from app import create_app
+    from api.routes import expiry_manager
+
+    tracked = []
+    monkeypatch.setattr(expiry_manager, 'track_alert', lambda alert_id, ttl=None: tracked.append(alert_id))
+    client = create_app('testing').test_client()
+    payload = {'alert_type': 'ttl-test', 'severity': 'low', 'position': {'lat': -33.9, 'lon': 151.2},
+               'message': 'm', 'vehicle_id': 'ttl-reporter-1'}
+
+    created = client.post('/api/safety/alerts', json=payload).get_json()['data']
+    merged = client.post('/api/safety/alerts', json={**payload, 'vehicle_id': 'ttl-reporter-2'}).get_json()['data']
+
+    assert created['status'] == 'created'
+    assert merged['status'] == 'merged' and merged['alert_id'] == created['alert_id']
+    assert tracked == [created['alert_id']]
@@ -0,0 +1,118 @@
+"""FARS Crash Data Ingestion Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from rl_engine.crash_data import FEATURES, MPH_TO_MS, CrashDataset, closing_speed, ingest_fars, iter_chunks, \
+    map_records, prefill_replay
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '..', 'rl_engine', 'data', 'fars_synthetic_sample.csv')
+
+
+def vehicle(case, speed, man_coll=1, gap='', **extra):
+    row = {'ST_CASE': str(case), 'HOUR': '14', 'WEATHER': '1', 'RUR_URB': '2', 'FUNC_SYS': '3', 'LGT_COND': '1',
+           'MAN_COLL': str(man_coll), 'TRAV_SP': str(speed), 'DR_DRINK': '0', 'SPEEDREL': '0', 'GAP_M': gap}
+    row.update(extra)
+    return row
+
+
+def test_closing_speed_follows_the_manner_of_collision():
+    speed = np.array([20.0, 20.0, 3.0, 20.0])
+    other = np.array([15.0, 15.0, 4.0, 15.0])
+    closing = closing_speed(speed, other, np.array([1, 2, 6, 11]))
+
+    np.testing.assert_allclose(closing[:3], [5.0, 35.0, 5.0])
+    assert np.isnan(closing[3])
+
+
+def test_map_records_pairs_vehicles_of_a_case():
+    mapped = map_records([vehicle(1, 60, gap='20'), vehicle(1, 40, gap='20'), vehicle(2, 50)])
+    states = mapped['states']
+
+    assert states.shape == (3, len(FEATURES)) and states.dtype == np.float32
+    assert states[0, 1] == pytest.approx(20 * MPH_TO_MS, rel=1e-5)
+    assert states[0, 0] == 20.0 and np.isfinite(states[0, 7])
+    # A single-vehicle case has no closing speed and so no collision probability
+    assert np.isnan(states[2, 1]) and np.isnan(states[2, 7])
+    assert mapped['case_ids'].tolist() == [1, 1, 2]
+
+
+def test_map_records_drops_unknown_speeds_and_clamps_997():
+    mapped = map_records([vehicle(1, 999), vehicle(2, 997, man_coll=0), vehicle(3, '')])
+    assert mapped['dropped'] == 2
+    assert mapped['case_ids'].tolist() == [2]
+
+
+def test_map_records_reads_accident_columns_from_lookup():
+    row = vehicle(7, 50)
+    del row['WEATHER']
+    mapped = map_records([row], accidents={'7': {'WEATHER': '4'}})
+    assert mapped['states'][0, 4] == 3  # snow
+
+
+def test_iter_chunks_never_split_a_case():
+    chunks = list(iter_chunks(SAMPLE, chunk_rows=3))
+    cases = [{row['ST_CASE'] for row in chunk} for chunk in chunks]
+
+    assert len(chunks) > 1
+    for first, second in zip(cases, cases[1:]):
+        assert not first & second
+    assert sum(len(chunk) for chunk in chunks) == 40
+
+
+def test_ingest_writes_metadata_and_memmaps(tmp_path):
+    metadata = ingest_fars(SAMPLE, str(tmp_path), chunk_rows=5)
+    dataset = CrashDataset(str(tmp_path))
+
+    assert metadata['rows'] + metadata['dropped'] == 40
+    assert metadata == dict(dataset.metadata)
+    assert len(dataset) == metadata['rows']
+    assert isinstance(dataset.states, np.memmap)
+    assert metadata['available']['vehicle_angle'] == metadata['rows']
+    assert metadata['available']['collision_probability'] == metadata['available']['relative_speed']
+    assert ingest_fars(SAMPLE, str(tmp_path / 'whole'))['rows'] == metadata['rows']
+
+
+def test_complete_indices_select_rows_without_nan(tmp_path):
+    ingest_fars(SAMPLE, str(tmp_path))
+    dataset = CrashDataset(str(tmp_path))
+    complete = dataset.complete_indices(batch_size=4)
+
+    expected = np.flatnonzero(np.isfinite(np.asarray(dataset.states)).all(axis=1))
+    np.testing.assert_array_equal(complete, expected)
+    assert 0 < len(complete) < len(dataset)
+
+
+def test_prefill_replay_adds_terminal_collisions(tmp_path):
+    from rl_engine.dqn_agent import DQNAgent
+    from rl_engine.environment import COLLISION_REWARD
+
+    ingest_fars(SAMPLE, str(tmp_path))
+    dataset = CrashDataset(str(tmp_path))
+    agent = DQNAgent(seed=0, memory_size=4)
+
+    assert prefill_replay(agent, dataset, count=10, seed=0) == 4
+    assert len(agent.memory) == 4
+    for state, action, reward, next_state, done in agent.memory:
+        assert np.isfinite(state).all()
+        assert (action, reward, done) == (0, COLLISION_REWARD, True)
+
+
+def test_prefill_replay_without_complete_rows(tmp_path):
+    from rl_engine.dqn_agent import DQNAgent
+
+    path = tmp_path / 'single.csv'
+    path.write_text('ST_CASE,TRAV_SP,MAN_COLL\n1,50,0\n')
+    ingest_fars(str(path), str(tmp_path / 'out'))
+
+    assert prefill_replay(DQNAgent(seed=0), CrashDataset(str(tmp_path / 'out')), count=5) == 0
@@ -0,0 +1,95 @@
+"""Dead Reckoning Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import pytest
+
+from api.dead_reckoning import (
+    MAX_ACCELERATION, MAX_TURN_RATE, AdaptiveReporter, estimate_rates, predict_from_history, predict_state
+)
+from api.geo import distance_m, offset_position
+
+
+def test_constant_velocity_travels_speed_times_time():
+    predicted = predict_state(50.0, 8.0, speed=20.0, heading=90.0, elapsed=2.0)
+
+    assert distance_m(50.0, 8.0, predicted['lat'], predicted['lon']) == pytest.approx(40.0, rel=1e-3)
+    assert predicted['lon'] > 8.0
+    assert predicted['speed'] == 20.0 and predicted['heading'] == 90.0
+
+
+def test_extrapolation_is_capped_at_max_horizon():
+    capped = predict_state(50.0, 8.0, 20.0, 0.0, elapsed=60.0, max_horizon=5.0)
+    assert distance_m(50.0, 8.0, capped['lat'], capped['lon']) == pytest.approx(100.0, rel=1e-3)
+    assert predict_state(50.0, 8.0, 20.0, 0.0, elapsed=-3.0)['lat'] == 50.0
+
+
+def test_rates_are_estimated_and_clamped():
+    assert estimate_rates([(0.0, 0, 0, 10.0, 0.0)]) == (0.0, 0.0)
+    acceleration, turn_rate = estimate_rates([(0.0, 0, 0, 10.0, 350.0), (2.0, 0, 0, 14.0, 10.0)])
+    assert acceleration == pytest.approx(2.0)
+    assert turn_rate == pytest.approx(10.0)  # wraps through north
+    acceleration, turn_rate = estimate_rates([(0.0, 0, 0, 0.0, 0.0), (1.0, 0, 0, 30.0, 90.0)])
+    assert (acceleration, turn_rate) == (MAX_ACCELERATION, MAX_TURN_RATE)
+
+
+def test_deceleration_stops_at_zero_speed():
+    history = [(0.0, 50.0, 8.0, 10.0, 0.0), (1.0, 50.0, 8.0, 5.0, 0.0)]
+    predicted = predict_state(50.0, 8.0, 5.0, 0.0, elapsed=5.0, history=history)
+
+    assert predicted['speed'] == 0.0
+    # Stops after 1 s having travelled 2.5 m
+    assert distance_m(50.0, 8.0, predicted['lat'], predicted['lon']) == pytest.approx(2.5, rel=0.05)
+
+
+def test_predict_from_history_reports_age():
+    assert predict_from_history([], now=10.0) is None
+    predicted = predict_from_history([(100.0, 50.0, 8.0, 0.0, 0.0)], now=103.0)
+    assert predicted['age_seconds'] == 3.0
+    assert (predicted['lat'], predicted['lon']) == (50.0, 8.0)
+
+
+def test_adaptive_reporter_suppresses_predictable_motion():
+    reporter = AdaptiveReporter(threshold_m=5.0, max_interval=10.0)
+    lat, lon = 50.0, 8.0
+    decisions = []
+    for t in range(6):  # stays within the 5 s prediction horizon
+        position = offset_position(lat, lon, 20.0 * t, 90.0)
+        decisions.append(reporter.should_report(float(t), *position, 20.0, 90.0))
+
+    assert decisions[0] is True
+    assert not any(decisions[1:])
+    assert (reporter.reports, reporter.suppressed) == (1, 5)
+
+
+def test_adaptive_reporter_reports_on_deviation_and_heartbeat():
+    reporter = AdaptiveReporter(threshold_m=5.0, max_interval=4.0)
+    assert reporter.should_report(0.0, 50.0, 8.0, 0.0, 0.0) is True
+    assert reporter.should_report(1.0, 50.0, 8.0, 0.0, 0.0) is False
+    assert reporter.should_report(2.0, *offset_position(50.0, 8.0, 10.0, 0.0), 0.0, 0.0) is True
+    assert reporter.should_report(6.0, *offset_position(50.0, 8.0, 10.0, 0.0), 0.0, 0.0) is True
+
+
+def test_kinematics_only_update_adds_dead_reckoned_sample():
+    from app import create_app
+    from api.routes import trajectory_store, vehicle_registry
+
+    client = create_app('testing').test_client()
+    client.post('/api/vehicles/register', json={
+        'vehicle_id': 'dr-test', 'position': {'lat': 10.0, 'lon': 20.0}, 'speed': 15.0, 'heading': 0.0})
+
+    assert client.put('/api/vehicles/dr-test/update', json={'heading': 90.0}).status_code == 200
+    assert client.put('/api/vehicles/dr-test/update', json={'status': 'active'}).status_code == 200
+
+    first, second = trajectory_store.track('dr-test')
+    assert second[3:] == (15.0, 90.0)
+    assert second[0] >= first[0]
+    # Carried forward from the registered position, never behind it
+    assert second[1] >= first[1] and second[2] == first[2]
+    assert vehicle_registry.get('dr-test')['position'] == {'lat': 10.0, 'lon': 20.0}
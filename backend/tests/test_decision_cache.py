@@ -0,0 +1,113 @@
+"""Decision Cache Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import numpy as np
+import pytest
+
+from rl_engine.dqn_agent import DecisionCache, DQNAgent
+
+STATE = [25.0, 5.0, 10.0, 1.0, 0.0, 12.0, 0.9, 0.2]
+
+
+def test_cache_rejects_zero_size():
+    with pytest.raises(ValueError):
+        DecisionCache(0)
+
+
+def test_lru_eviction_and_counters():
+    cache = DecisionCache(2)
+    cache.put(b'a', 1)
+    cache.put(b'b', 2)
+    assert cache.get(b'a') == 1  # refreshes 'a'
+    cache.put(b'c', 3)           # evicts 'b'
+
+    assert cache.get(b'b') is None
+    assert cache.get(b'c') == 3
+    assert cache.get(b'a') == 1
+    stats = cache.get_stats()
+    assert (stats['size'], stats['hits'], stats['misses']) == (2, 3, 1)
+    assert stats['hit_ratio'] == pytest.approx(0.75)
+
+
+def test_action_zero_is_cached():
+    cache = DecisionCache(2)
+    cache.put(b'a', 0)
+    assert cache.get(b'a') == 0
+    assert cache.hits == 1
+
+
+def test_clear_counts_only_real_invalidations():
+    cache = DecisionCache(2)
+    cache.clear()
+    cache.put(b'a', 1)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.invalidations == 1
+
+
+def test_cached_actions_match_the_network():
+    rng = np.random.default_rng(0)
+    states = rng.uniform([0, -10, -90, 0, 0, 0, 0, 0], [200, 30, 90, 3, 4, 23, 1, 1], size=(64, 8))
+    cached = DQNAgent(seed=0, decision_cache_size=128)
+    plain = DQNAgent(seed=0)
+    cached.epsilon = plain.epsilon = 0.0
+
+    expected = plain.act_batch(states)
+    np.testing.assert_array_equal(cached.act_batch(states), expected)
+    np.testing.assert_array_equal(cached.act_batch(states), expected)
+    assert [cached.act(list(state)) for state in states[:8]] == list(expected[:8])
+    assert cached.decision_cache.hits == 64 + 8
+
+
+def test_exact_keys_keep_sign_and_precision():
+    agent = DQNAgent(seed=0, decision_cache_size=8)
+    keys = agent._cache_keys(agent._prepare([STATE, [STATE[0], -STATE[1]] + STATE[2:],
+                                             [STATE[0] + 0.01] + STATE[1:]]))
+    assert len(set(keys)) == 3
+
+
+def test_resolution_bins_nearby_states_together():
+    agent = DQNAgent(seed=0, decision_cache_size=8, decision_cache_resolution=1e-3)
+    near = [STATE[0] + 0.05] + STATE[1:]   # 0.05 m apart, within one 0.2 m bin
+    far = [STATE[0] + 5.0] + STATE[1:]
+    keys = agent._cache_keys(agent._prepare([STATE, near, far]))
+
+    assert keys[0] == keys[1] != keys[2]
+    with pytest.raises(ValueError):
+        DQNAgent(decision_cache_resolution=-1.0)
+
+
+def test_replay_and_load_invalidate_the_cache(tmp_path):
+    agent = DQNAgent(seed=0, decision_cache_size=8)
+    agent.epsilon = 0.0
+    agent.act(STATE)
+    for _ in range(8):
+        agent.remember(STATE, 1, 1.0, STATE, True)
+    agent.replay(batch_size=4)
+    assert len(agent.decision_cache) == 0
+
+    agent.epsilon = 0.0
+    agent.act(STATE)
+    path = str(tmp_path / 'model.json')
+    DQNAgent(seed=5).save_model(path)
+    agent.load_model(path)
+    assert len(agent.decision_cache) == 0
+    assert agent.decision_cache.invalidations == 2
+
+
+def test_exploration_bypasses_the_cache():
+    agent = DQNAgent(seed=0, decision_cache_size=8)
+    agent.epsilon = 1.0
+    for _ in range(10):
+        agent.act(STATE)
+
+    assert agent.decision_cache.get_stats()['hits'] == 0
+    assert len(agent.decision_cache) == 0
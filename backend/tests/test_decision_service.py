@@ -0,0 +1,184 @@
+"""Decision Service Tests
+
+Covers ``MicroBatcher`` batching and error propagation, ``DecisionService``
+model loading and retries, and validation of decision requests.
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import threading
+
+import pytest
+
+from api.decision_service import DecisionService, MicroBatcher, ModelUnavailableError
+from api.validation import validate_decision_request
+
+STATE = [25.0, 5.0, 10.0, 1.0, 0.0, 12.0, 0.9, 0.2]
+
+
+@pytest.fixture
+def batcher_factory():
+    batchers = []
+
+    def make(infer_fn, **kwargs):
+        batcher = MicroBatcher(infer_fn, **kwargs)
+        batchers.append(batcher)
+        return batcher
+
+    yield make
+    for batcher in batchers:
+        batcher.close()
+
+
+def test_concurrent_calls_share_a_batch(batcher_factory):
+    sizes = []
+
+    def infer(items):
+        sizes.append(len(items))
+        return [item * 2 for item in items]
+
+    batcher = batcher_factory(infer, max_batch_size=8, max_wait_ms=50)
+    futures = [batcher.submit(i) for i in range(5)]
+
+    assert [future.result(2) for future in futures] == [0, 2, 4, 6, 8]
+    assert sizes == [5]
+    assert batcher.get_stats()['largest_batch'] == 5
+
+
+def test_batch_size_is_bounded(batcher_factory):
+    sizes = []
+    batcher = batcher_factory(lambda items: sizes.append(len(items)) or items, max_batch_size=3, max_wait_ms=50)
+    futures = [batcher.submit(i) for i in range(7)]
+
+    assert [future.result(2) for future in futures] == list(range(7))
+    assert max(sizes) <= 3 and sum(sizes) == 7
+
+
+def test_inference_error_fails_every_caller(batcher_factory):
+    def infer(items):
+        raise RuntimeError("model exploded")
+
+    batcher = batcher_factory(infer, max_wait_ms=20)
+    futures = [batcher.submit(i) for i in range(3)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="model exploded"):
+            future.result(2)
+    # The worker keeps serving after a failed batch
+    assert batcher.get_stats()['batches'] >= 1
+
+
+def test_wrong_result_count_fails_every_caller(batcher_factory):
+    batcher = batcher_factory(lambda items: items[:-1], max_wait_ms=20)
+    futures = [batcher.submit(i) for i in range(3)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="results for a batch of"):
+            future.result(2)
+
+
+def test_submit_after_close_raises():
+    batcher = MicroBatcher(lambda items: items)
+    batcher.close()
+    with pytest.raises(RuntimeError):
+        batcher.submit(1)
+
+
+def test_decision_state_must_be_eight_finite_numbers():
+    assert validate_decision_request({'state': STATE}) == (True, None)
+    assert validate_decision_request({'state': STATE[:7]})[0] is False
+    for bad in (float('nan'), float('inf'), float('-inf')):
+        is_valid, error = validate_decision_request({'state': [bad] + STATE[1:]})
+        assert not is_valid and error == "Field 'state' must contain only finite numbers"
+
+
+def test_decision_endpoint_rejects_nan_state():
+    from app import create_app
+
+    client = create_app('testing').test_client()
+    response = client.post('/api/decisions', data='{"state": [NaN, 0, 0, 0, 0, 0, 0, 0]}',
+                           content_type='application/json')
+    assert response.status_code == 400
+
+
+def test_rule_agent_decisions():
+    service = DecisionService(max_wait_ms=1)
+    try:
+        result = service.decide(STATE, agent='rule')
+        assert result['agent'] == 'rule'
+        assert set(result) >= {'action', 'action_name', 'risk', 'batch_size'}
+        with pytest.raises(ValueError):
+            service.decide(STATE, agent='oracle')
+    finally:
+        service.close()
+
+
+def test_missing_model_is_retried_once_the_file_appears(tmp_path):
+    from rl_engine.dqn_agent import DQNAgent
+
+    path = str(tmp_path / 'model.json')
+    service = DecisionService(model_path=path, max_wait_ms=1)
+    try:
+        with pytest.raises(ModelUnavailableError):
+            service.decide(STATE)
+        assert 'does not exist' in service.get_stats()['dqn']['unavailable']
+        with pytest.raises(ModelUnavailableError):
+            service.decide(STATE)
+
+        DQNAgent(seed=0).save_model(path)
+        result = service.decide(STATE)
+
+        assert result['agent'] == 'dqn'
+        stats = service.get_stats()['dqn']
+        assert stats['model_loaded'] is True and 'unavailable' not in stats
+    finally:
+        service.close()
+
+
+def test_failed_load_is_retried_after_backoff(tmp_path):
+    path = str(tmp_path / 'model.json')
+    with open(path, 'w') as f:
+        f.write('{"not": "a model"}')
+    service = DecisionService(model_path=path, max_wait_ms=1, model_retry_seconds=3600)
+    attempts = []
+    create_agent = service._create_agent
+
+    def counting_create_agent(name):
+        attempts.append(name)
+        return create_agent(name)
+
+    service._create_agent = counting_create_agent
+    try:
+        for _ in range(3):
+            with pytest.raises(ModelUnavailableError):
+                service.decide(STATE)
+        assert attempts == ['dqn']
+
+        service.model_retry_seconds = 0
+        with pytest.raises(ModelUnavailableError):
+            service.decide(STATE)
+        assert attempts == ['dqn', 'dqn']
+    finally:
+        service.close()
+
+
+def test_concurrent_first_requests_create_one_agent():
+    service = DecisionService(max_wait_ms=5)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(service.decide(STATE, agent='rule')))
+               for _ in range(8)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(results) == 8
+        assert list(service.get_stats()) == ['rule', 'dqn']
+        assert service.get_stats()['rule']['requests'] == 8
+    finally:
+        service.close()
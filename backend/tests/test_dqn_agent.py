@@ -0,0 +1,122 @@
+"""DQNAgent Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from rl_engine.dqn_agent import DQNAgent, QNetwork, QTableAgent, collision_risk_batch
+
+STATE = [25.0, 5.0, 10.0, 1.0, 0.0, 12.0, 0.9, 0.2]
+
+
+def test_forward_shapes():
+    agent = DQNAgent(seed=0)
+    assert agent.predict(STATE).shape == (1, 5)
+    assert agent.predict([STATE] * 4).shape == (4, 5)
+    assert agent.act_batch([STATE] * 4).shape == (4,)
+
+
+def test_backward_matches_numerical_gradient():
+    rng = np.random.default_rng(0)
+    network = QNetwork((3, 4, 2), rng)
+    for param in network.params:
+        param[...] = rng.normal(size=param.shape)  # non-zero biases too
+    x = rng.normal(size=(5, 3)).astype(np.float32)
+    grad_out = rng.normal(size=(5, 2)).astype(np.float32)
+
+    _, activations = network.forward_train(x)
+    grads = network.backward(activations, grad_out)
+
+    def loss():
+        return float((network.forward(x) * grad_out).sum())
+
+    epsilon = 1e-2
+    for param, grad in zip(network.params, grads):
+        index = (0,) * param.ndim
+        original = param[index]
+        param[index] = original + epsilon
+        plus = loss()
+        param[index] = original - epsilon
+        minus = loss()
+        param[index] = original
+        assert grad[index] == pytest.approx((plus - minus) / (2 * epsilon), rel=1e-2, abs=1e-3)
+
+
+def test_replay_waits_for_enough_memory_then_trains():
+    agent = DQNAgent(seed=0, target_update_freq=2)
+    agent.replay(batch_size=8)
+    assert agent.train_steps == 0
+
+    for i in range(16):
+        agent.remember(STATE, i % 5, -1.0, STATE, False)
+    before = [param.copy() for param in agent.q_network.params]
+    agent.replay(batch_size=8)
+    agent.replay(batch_size=8)
+
+    assert agent.train_steps == 2
+    assert agent.epsilon < 1.0
+    assert any(not np.array_equal(a, b) for a, b in zip(before, agent.q_network.params))
+    # Synced on the second step
+    for online, target in zip(agent.q_network.params, agent.target_network.params):
+        np.testing.assert_array_equal(online, target)
+
+
+def test_training_fits_a_fixed_target():
+    agent = DQNAgent(seed=0, gamma=0.0, learning_rate=0.01)
+    for _ in range(64):
+        agent.remember(STATE, 2, 1.0, STATE, True)
+    for _ in range(300):
+        agent.replay(batch_size=16)
+
+    assert agent.predict(STATE)[0, 2] == pytest.approx(1.0, abs=0.05)
+
+
+def test_greedy_act_is_deterministic_with_zero_epsilon():
+    agent = DQNAgent(seed=1)
+    agent.epsilon = 0.0
+    expected = int(agent.predict(STATE).argmax())
+
+    assert all(agent.act(STATE) == expected for _ in range(5))
+    assert agent.get_stats()['total_actions'] == 5
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / 'model.json')
+    agent = DQNAgent(seed=2)
+    agent.train_steps = 7
+    agent.save_model(path)
+
+    loaded = DQNAgent(seed=3)
+    loaded.load_model(path)
+
+    np.testing.assert_allclose(loaded.predict(STATE), agent.predict(STATE), rtol=1e-6)
+    assert loaded.train_steps == 7
+
+
+def test_load_rejects_other_models(tmp_path):
+    path = str(tmp_path / 'model.json')
+    DQNAgent(hidden_sizes=(16,)).save_model(path)
+    with pytest.raises(ValueError):
+        DQNAgent().load_model(path)
+
+    QTableAgent().save_model(path)
+    with pytest.raises(ValueError):
+        DQNAgent().load_model(path)
+
+
+def test_collision_risk_batch_matches_scalar_version():
+    agent = DQNAgent(seed=0)
+    states = [[d, v] + STATE[2:] for d in (0.0, 5.0, 15.0, 29.0, 50.0) for v in (-5.0, 0.0, 10.0, 40.0)]
+    expected = [agent.evaluate_collision_risk(state) for state in states]
+
+    np.testing.assert_allclose(collision_risk_batch(states), expected)
+    assert json.loads(json.dumps(agent.get_stats()))['network_parameters'] > 0
@@ -0,0 +1,93 @@
+"""Agent Evaluation Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import numpy as np
+import pytest
+
+from rl_engine.evaluation import COUNTERS, REFERENCE, evaluate_agents, make_scenarios, merge_counters, rollout, \
+    run_evaluation, summarize
+
+SETTINGS = {'horizon': 12, 'dt': 0.5, 'hazard_share': 0.5}
+
+
+def maintain(states):
+    return np.zeros(len(states), dtype=np.int64)
+
+
+def test_scenarios_are_seeded():
+    env_a, states_a = make_scenarios(256, seed=4, **SETTINGS)
+    env_b, states_b = make_scenarios(256, seed=4, **SETTINGS)
+
+    np.testing.assert_array_equal(states_a, states_b)
+    np.testing.assert_array_equal(env_a.brake_time, env_b.brake_time)
+    braking = env_a.lead_acceleration < 0
+    assert 0.3 < braking.mean() < 0.7
+    assert (env_a.brake_time[~braking] == 0).all()
+
+
+def test_rollouts_are_paired_on_rows_the_policy_leaves_alone():
+    reference = rollout(maintain, 512, seed=3, settings=SETTINGS)
+
+    def brake_in_bad_weather(states):
+        return np.where(states[:, 4] > 0, 2, 0)
+
+    _, states = make_scenarios(512, seed=3, **SETTINGS)
+    untouched = states[:, 4] == 0
+    result = rollout(brake_in_bad_weather, 512, seed=3, settings=SETTINGS)
+
+    assert untouched.any() and (~untouched).any()
+    np.testing.assert_array_equal(result['collided'][untouched], reference['collided'][untouched])
+    np.testing.assert_allclose(result['peak_risk'][untouched], reference['peak_risk'][untouched])
+    assert reference['collided'].any()
+    assert result['decisions'] <= 512 * SETTINGS['horizon']
+
+
+def test_evaluate_agents_counts_and_credits_outcomes():
+    class HardBrake:
+        collisions_avoided = 0
+
+        def act_batch(self, states):
+            return np.full(len(states), 2, dtype=np.int64)
+
+        def record_outcomes(self, avoided):
+            self.collisions_avoided += avoided
+
+    agent = HardBrake()
+    settings = {**SETTINGS, 'num_scenarios': 300, 'chunk_size': 128, 'seed': 1}
+    totals = evaluate_agents({'brake': agent}, [0, 1, 2, 3], settings)
+
+    assert totals['brake']['scenarios'] == totals[REFERENCE]['scenarios'] == 300
+    assert agent.collisions_avoided == totals['brake']['avoided']
+    assert (totals[REFERENCE]['collisions'] - totals['brake']['collisions']
+            == totals['brake']['avoided'] - totals['brake']['induced'])
+
+
+def test_merge_counters_and_summarize():
+    shard = {name: 1 for name in COUNTERS}
+    merged = merge_counters([{'dqn': shard, REFERENCE: shard}, {'dqn': {**shard, 'collisions': 3}}])
+
+    assert merged['dqn']['scenarios'] == 2 and merged['dqn']['collisions'] == 4
+    assert merged[REFERENCE]['scenarios'] == 1
+    summary = summarize(merged)
+    assert summary['dqn']['collision_rate'] == 2.0
+    assert summary['dqn']['collisions_avoided'] == 2
+    assert 'collisions_avoided' not in summary[REFERENCE]
+
+
+def test_results_do_not_depend_on_process_count():
+    settings = {**SETTINGS, 'num_scenarios': 200, 'chunk_size': 64, 'model_path': None, 'seed': 2}
+
+    single = run_evaluation(settings, processes=1)
+    parallel = run_evaluation(settings, processes=2)
+
+    assert parallel['processes'] == 2
+    for name, result in single['results'].items():
+        assert result['collisions'] == parallel['results'][name]['collisions']
+        assert result['avg_peak_risk'] == pytest.approx(parallel['results'][name]['avg_peak_risk'])
@@ -0,0 +1,176 @@
+"""TimerWheel and ExpiryManager Tests
+
+All tests drive a fake clock, so no test sleeps.
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import pytest
+
+from api.expiry import ExpiryManager, TimerWheel
+from api.stores import RecordLog, VehicleRegistry
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_wheel_rejects_invalid_configuration():
+    with pytest.raises(ValueError):
+        TimerWheel(tick_seconds=0)
+    with pytest.raises(ValueError):
+        TimerWheel(slots=0)
+
+
+def test_wheel_fires_at_deadline_not_before():
+    clock = FakeClock()
+    wheel = TimerWheel(tick_seconds=1.0, slots=8, clock=clock)
+    wheel.schedule('a', 3.0)
+
+    assert wheel.advance(clock.now + 2.0) == []
+    assert 'a' in wheel
+    assert wheel.advance(clock.now + 3.0) == ['a']
+    assert 'a' not in wheel and len(wheel) == 0
+
+
+def test_wheel_deadline_beyond_one_rotation_waits_for_its_own_turn():
+    clock = FakeClock()
+    wheel = TimerWheel(tick_seconds=1.0, slots=8, clock=clock)
+    wheel.schedule('near', 2.0)
+    wheel.schedule('far', 2.0 + 8)  # same bucket, one rotation later
+
+    assert wheel.advance(clock.now + 2.0) == ['near']
+    assert wheel.advance(clock.now + 9.0) == []
+    assert wheel.advance(clock.now + 10.0) == ['far']
+
+
+def test_wheel_advance_over_several_rotations_pops_everything_due():
+    clock = FakeClock()
+    wheel = TimerWheel(tick_seconds=1.0, slots=8, clock=clock)
+    for delay in range(1, 30):
+        wheel.schedule(delay, float(delay))
+
+    expired = wheel.advance(clock.now + 20.0)
+
+    assert sorted(expired) == list(range(1, 21))
+    assert sorted(wheel.advance(clock.now + 100.0)) == list(range(21, 30))
+
+
+def test_wheel_reschedule_and_cancel():
+    clock = FakeClock()
+    wheel = TimerWheel(tick_seconds=1.0, slots=8, clock=clock)
+    wheel.schedule('a', 2.0)
+    wheel.schedule('a', 5.0)
+    wheel.schedule('b', 2.0)
+
+    assert wheel.cancel('b') is True
+    assert wheel.cancel('b') is False
+    assert wheel.advance(clock.now + 3.0) == []
+    assert wheel.advance(clock.now + 5.0) == ['a']
+
+
+def make_manager(clock, **kwargs):
+    registry = VehicleRegistry(stripes=4)
+    alerts = RecordLog('alert_id')
+    wheel = TimerWheel(tick_seconds=1.0, slots=16, clock=clock)
+    settings = dict(stale_after=10.0, remove_after=30.0, alert_ttl=20.0, alert_retention=40.0)
+    settings.update(kwargs)
+    return ExpiryManager(registry, alerts, wheel=wheel, **settings), registry, alerts
+
+
+def test_manager_rejects_remove_before_stale():
+    with pytest.raises(ValueError):
+        make_manager(FakeClock(), stale_after=10.0, remove_after=5.0)
+
+
+def test_vehicle_goes_stale_then_is_removed():
+    clock = FakeClock()
+    removed = []
+    manager, registry, _ = make_manager(clock, on_vehicle_removed=removed.append)
+    manager.touch_vehicle('veh-1')
+    registry.put('veh-1', {'vehicle_id': 'veh-1', 'status': 'active'})
+
+    assert manager.expire_due(clock.now + 5.0)['vehicles_staled'] == 0
+    assert manager.expire_due(clock.now + 10.0)['vehicles_staled'] == 1
+    assert registry.get('veh-1')['status'] == 'stale'
+    assert manager.expire_due(clock.now + 29.0)['vehicles_removed'] == 0
+    assert manager.expire_due(clock.now + 30.0)['vehicles_removed'] == 1
+    assert 'veh-1' not in registry
+    assert removed == ['veh-1']
+    assert manager.stats['vehicles_staled'] == 1 and manager.stats['vehicles_removed'] == 1
+
+
+def test_touch_pushes_back_stale_deadline():
+    clock = FakeClock()
+    manager, registry, _ = make_manager(clock)
+    manager.touch_vehicle('veh-1')
+    registry.put('veh-1', {'vehicle_id': 'veh-1', 'status': 'active'})
+
+    clock.now += 8.0
+    manager.touch_vehicle('veh-1')
+
+    assert manager.expire_due(clock.now + 5.0)['vehicles_staled'] == 0
+    assert registry.get('veh-1')['status'] == 'active'
+    assert manager.expire_due(clock.now + 10.0)['vehicles_staled'] == 1
+
+
+def test_touch_after_deadline_popped_keeps_vehicle_active():
+    clock = FakeClock()
+    manager, registry, _ = make_manager(clock)
+    manager.touch_vehicle('veh-1')
+    registry.put('veh-1', {'vehicle_id': 'veh-1', 'status': 'active'})
+    # Activity recorded just before the sweep runs, without a new deadline
+    manager._last_seen['veh-1'] = clock.now + 9.0
+
+    counts = manager.expire_due(clock.now + 10.0)
+
+    assert counts['vehicles_staled'] == 0
+    assert registry.get('veh-1')['status'] == 'active'
+    assert ('vehicle', 'veh-1') in manager.wheel
+
+
+def test_forget_vehicle_cancels_its_deadline():
+    clock = FakeClock()
+    manager, registry, _ = make_manager(clock)
+    manager.touch_vehicle('veh-1')
+    registry.put('veh-1', {'vehicle_id': 'veh-1', 'status': 'active'})
+    manager.forget_vehicle('veh-1')
+
+    assert manager.expire_due(clock.now + 100.0)['vehicles_staled'] == 0
+    assert registry.get('veh-1')['status'] == 'active'
+
+
+def test_alert_expires_then_is_removed_after_retention():
+    clock = FakeClock()
+    expired = []
+    manager, _, alerts = make_manager(clock, on_alert_expired=expired.append)
+    alerts.append({'alert_id': 'a-1', 'status': 'active'})
+    manager.track_alert('a-1')
+
+    assert manager.expire_due(clock.now + 19.0)['alerts_expired'] == 0
+    assert manager.expire_due(clock.now + 20.0)['alerts_expired'] == 1
+    assert alerts.get('a-1')['status'] == 'expired'
+    assert expired == ['a-1']
+    assert manager.expire_due(clock.now + 59.0)['alerts_removed'] == 0
+    assert manager.expire_due(clock.now + 60.0)['alerts_removed'] == 1
+    assert alerts.get('a-1') is None
+
+
+def test_alert_ttl_override():
+    clock = FakeClock()
+    manager, _, alerts = make_manager(clock)
+    alerts.append({'alert_id': 'a-1', 'status': 'active'})
+    manager.track_alert('a-1', ttl=2.0)
+
+    assert manager.expire_due(clock.now + 2.0)['alerts_expired'] == 1
@@ -0,0 +1,127 @@
+"""NDJSON Export and Replay Tests
+
+Covers the export helpers, the export endpoint and ``simulation/replay.py``,
+including a full export/replay round trip against a local server.
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import json
+
+import pytest
+
+from api.export import filter_time_range, iter_ndjson_chunks, parse_time_bound
+from tests.conftest import load_simulation_module
+
+replay = load_simulation_module('replay')
+
+
+def test_parse_time_bound_normalizes_offsets():
+    assert parse_time_bound(None) is None
+    assert parse_time_bound('2026-10-19T06:00:00') == '2026-10-19T06:00:00'
+    assert '+' not in parse_time_bound('2026-10-19T06:00:00+00:00')
+    with pytest.raises(ValueError):
+        parse_time_bound('yesterday')
+
+
+def test_filter_time_range_is_half_open():
+    records = [{'t': f"2026-10-19T06:00:0{i}"} for i in range(5)]
+    selected = filter_time_range(records, 't', since='2026-10-19T06:00:01', until='2026-10-19T06:00:03')
+    assert [record['t'] for record in selected] == ['2026-10-19T06:00:01', '2026-10-19T06:00:02']
+
+
+def test_ndjson_chunks_split_on_record_boundaries():
+    records = [{'id': i, 'payload': 'x' * 20} for i in range(50)]
+    chunks = list(iter_ndjson_chunks(records, chunk_bytes=100))
+
+    assert len(chunks) > 1
+    assert all(chunk.endswith('\n') for chunk in chunks)
+    lines = ''.join(chunks).splitlines()
+    assert [json.loads(line)['id'] for line in lines] == list(range(50))
+
+
+def test_export_endpoint_validates_arguments():
+    from app import create_app
+
+    client = create_app('testing').test_client()
+    assert client.get('/api/export/unknown').status_code == 404
+    assert client.get('/api/export/safety_alerts?since=soon').status_code == 400
+
+
+def test_iter_replay_preserves_recorded_pace(tmp_path):
+    path = tmp_path / 'log.ndjson'
+    path.write_text('\n'.join(json.dumps({'message_id': str(i), 'timestamp': f"2026-10-19T06:00:0{2 * i}"})
+                              for i in range(3)) + '\n\n')
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    offsets = [offset for offset, _ in replay.iter_replay(str(path), speed=2.0, sleep=sleep, clock=lambda: now[0])]
+
+    assert offsets == [0.0, 2.0, 4.0]
+    assert sleeps == [pytest.approx(1.0), pytest.approx(1.0)]
+
+
+def test_to_request_maps_records_back_to_routes():
+    message = {'message_id': 'm', 'sender_id': 'a', 'recipient_id': 'b', 'message_type': 't', 'payload': {}}
+    alert = {'alert_id': 'x', 'alert_type': 'ice', 'severity': 'high', 'position': {'lat': 1.0, 'lon': 2.0},
+             'message': 'm', 'source_vehicle_id': 'a', 'reporter_count': 3}
+
+    assert replay.to_request(message) == ('/api/communication/send', {
+        'sender_id': 'a', 'recipient_id': 'b', 'message_type': 't', 'payload': {}, 'priority': 'medium'})
+    route, payload = replay.to_request(alert)
+    assert route == '/api/safety/alerts'
+    assert payload['vehicle_id'] == 'a' and payload['radius'] == 100
+    assert replay.to_request({'other': 1}) is None
+
+
+def test_retry_delay_prefers_retry_after_and_caps_backoff():
+    class Response:
+        def __init__(self, headers):
+            self.headers = headers
+
+    assert replay.retry_delay(Response({'Retry-After': '3'}), attempt=0) == 3.0
+    assert replay.retry_delay(Response({}), attempt=2) == 2.0
+    assert replay.retry_delay(Response({'Retry-After': 'soon'}), attempt=10) == 30.0
+
+
+def test_export_then_replay_round_trip(live_server, tmp_path):
+    import requests
+
+    for i in range(3):
+        response = requests.post(live_server + '/api/communication/send', json={
+            'sender_id': 'replay-sender', 'recipient_id': 'broadcast', 'message_type': 'beacon',
+            'payload': {'seq': i}}, timeout=5)
+        assert response.status_code == 200
+    exported = requests.get(live_server + '/api/export/communication_logs', timeout=5)
+    lines = [line for line in exported.text.splitlines()
+             if json.loads(line)['sender_id'] == 'replay-sender']
+    path = tmp_path / 'messages.ndjson'
+    path.write_text('\n'.join(lines) + '\n')
+
+    summary = replay.replay_to_api(str(path), live_server, speed=0)
+
+    assert exported.headers['Content-Type'].startswith('application/x-ndjson')
+    assert summary['sent'] == 3 and summary['statuses'] == {'200': 3}
+    assert summary['unreplayed_merged_reports'] == 0
+
+
+def test_replay_counts_merged_alert_reports(live_server, tmp_path):
+    alert = {'alert_id': 'x', 'alert_type': 'replay-ice', 'severity': 'high', 'position': {'lat': 40.0, 'lon': 40.0},
+             'radius': 120, 'message': 'm', 'source_vehicle_id': 'replay-reporter',
+             'created_at': '2026-10-19T06:00:00', 'reporter_count': 3}
+    path = tmp_path / 'alerts.ndjson'
+    path.write_text(json.dumps(alert) + '\n')
+
+    summary = replay.replay_to_api(str(path), live_server, speed=0)
+
+    assert summary['statuses'] == {'200': 1}
+    assert summary['unreplayed_merged_reports'] == 2
@@ -0,0 +1,94 @@
+"""Load Generator Tests
+
+Covers the fleet model and report aggregation of
+``simulation/load_generator.py`` and a short run against a local server.
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import random
+
+import pytest
+
+from api.geo import distance_m
+from api.validation import validate_safety_alert, validate_v2v_message, validate_vehicle_registration, \
+    validate_vehicle_update
+from tests.conftest import load_simulation_module
+
+load_generator = load_simulation_module('load_generator')
+
+
+def test_vehicles_are_deterministic_per_seed():
+    a = load_generator.SimulatedVehicle('veh', random.Random(3))
+    b = load_generator.SimulatedVehicle('veh', random.Random(3))
+    for _ in range(20):
+        a.step(0.5)
+        b.step(0.5)
+    assert (a.lat, a.lon, a.speed, a.heading) == (b.lat, b.lon, b.speed, b.heading)
+
+
+def test_vehicle_motion_stays_physical():
+    vehicle = load_generator.SimulatedVehicle('veh', random.Random(1))
+    for _ in range(200):
+        lat, lon, speed = vehicle.lat, vehicle.lon, vehicle.speed
+        vehicle.step(1.0)
+        assert 0.0 <= vehicle.speed <= load_generator.MAX_SPEED
+        assert 0.0 <= vehicle.heading < 360.0
+        # Distance covered in one step never exceeds the speed bound
+        assert distance_m(lat, lon, vehicle.lat, vehicle.lon) <= max(speed, vehicle.speed) + 0.5
+
+
+def test_payloads_pass_backend_validation():
+    vehicle = load_generator.SimulatedVehicle('veh', random.Random(2))
+
+    assert validate_vehicle_registration(vehicle.registration()) == (True, None)
+    assert validate_vehicle_update(vehicle.update()) == (True, None)
+    assert validate_safety_alert(vehicle.alert()) == (True, None)
+    assert validate_v2v_message(vehicle.message('other')) == (True, None)
+
+
+def test_percentiles_ms():
+    assert load_generator.percentiles_ms([]) == {'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'max_ms': None}
+    values = [i / 1000.0 for i in range(1, 101)]
+    assert load_generator.percentiles_ms(values) == {'p50_ms': 50.0, 'p95_ms': 95.0, 'p99_ms': 99.0,
+                                                    'max_ms': 100.0}
+
+
+def test_summarize_merges_shards():
+    config = {'url': 'http://x', 'vehicles': 2, 'update_rate': 1.0, 'alert_rate': 0.0, 'message_rate': 0.0,
+              'duration': 1.0, 'processes': 2, 'workers': 1, 'sockets': 0, 'seed': 1}
+    shards = [
+        {'elapsed': 2.0, 'latencies': {'update': [0.01, 0.02]}, 'statuses': {'update': {'200': 2}},
+         'spans': {'update': [0.0, 1.0]}, 'lag': [0.0], 'sockets': None},
+        {'elapsed': 1.0, 'latencies': {'update': [0.03], 'register': [0.05]},
+         'statuses': {'update': {'429': 1}, 'register': {'200': 1}},
+         'spans': {'update': [0.5, 2.0], 'register': [0.0, 0.05]}, 'lag': [0.1], 'sockets': None}
+    ]
+
+    report = load_generator.summarize(config, shards)
+
+    assert report['elapsed_seconds'] == 2.0 and report['total_requests'] == 4
+    update = report['endpoints']['update']
+    assert update['requests'] == 3 and update['success'] == 2
+    assert update['statuses'] == {'200': 2, '429': 1}
+    assert update['throughput_rps'] == 1.5
+    assert 'sockets' not in report
+
+
+def test_short_run_against_local_server(live_server):
+    pytest.importorskip('requests')
+    config = {'url': live_server, 'vehicles': 4, 'update_rate': 5.0, 'alert_rate': 0.0, 'message_rate': 1.0,
+              'duration': 1.0, 'processes': 1, 'workers': 2, 'sockets': 0, 'timeout': 5.0, 'seed': 1}
+
+    report = load_generator.run_load(config)
+
+    assert report['endpoints']['register']['success'] == 4
+    update = report['endpoints']['update']
+    assert update['statuses'] == {'200': update['requests']}
+    assert update['requests'] >= 8
+    assert update['p50_ms'] is not None
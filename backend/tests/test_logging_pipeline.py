@@ -0,0 +1,132 @@
+"""Logging Pipeline Tests
+
+Tests that install a pipeline restore the default one (as ``app.py`` does on
+import) afterwards.
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import io
+import json
+import logging
+import queue
+
+import pytest
+
+from api import logging_pipeline
+from api.logging_pipeline import EventSampler, JsonFormatter, NonBlockingQueueHandler, configure_logging, \
+    event_policies_from_env, get_logging_stats
+
+
+def make_record(msg='hello %s', args=('world',), level=logging.INFO, **extra):
+    record = logging.LogRecord('test', level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def restore_logging():
+    yield
+    configure_logging()
+
+
+def test_json_formatter_includes_extra_fields():
+    entry = json.loads(JsonFormatter().format(make_record(event='vehicle_update', vehicle_id='veh-1')))
+
+    assert entry['message'] == 'hello world' and entry['level'] == 'INFO'
+    assert entry['event'] == 'vehicle_update' and entry['vehicle_id'] == 'veh-1'
+
+
+def test_sampler_passes_untagged_unknown_and_warning_records():
+    sampler = EventSampler({'noisy': {'sample_rate': 0.0}})
+
+    assert sampler.filter(make_record())
+    assert sampler.filter(make_record(event='other'))
+    assert sampler.filter(make_record(level=logging.WARNING, event='noisy'))
+    assert not sampler.filter(make_record(event='noisy'))
+    assert sampler.stats['noisy'] == {'passed': 0, 'sampled_out': 1, 'rate_limited': 0}
+
+
+def test_sampler_keeps_about_the_sample_rate_and_tags_records():
+    sampler = EventSampler({'noisy': {'sample_rate': 0.25}}, seed=1)
+    records = [make_record(event='noisy') for _ in range(2000)]
+    kept = [record for record in records if sampler.filter(record)]
+
+    assert 400 < len(kept) < 600
+    assert all(record.sample_rate == 0.25 for record in kept)
+    assert sampler.stats['noisy']['passed'] + sampler.stats['noisy']['sampled_out'] == 2000
+
+
+def test_sampler_rate_caps_bursts():
+    sampler = EventSampler({'noisy': {'sample_rate': 1.0, 'rate': 0.001, 'burst': 3}})
+    results = [sampler.filter(make_record(event='noisy')) for _ in range(10)]
+
+    assert results == [True] * 3 + [False] * 7
+    assert sampler.stats['noisy']['rate_limited'] == 7
+
+
+def test_event_policies_from_env(monkeypatch):
+    monkeypatch.setenv('V2V_LOG_SAMPLE_VEHICLE_UPDATE', '0.5')
+    monkeypatch.setenv('V2V_LOG_RATE_VEHICLE_UPDATE_BURST', '7')
+    policies = event_policies_from_env()
+
+    assert policies['vehicle_update'] == {'sample_rate': 0.5, 'rate': 20.0, 'burst': 7.0}
+
+
+def test_queue_handler_drops_when_full_and_binds_arguments():
+    handler = NonBlockingQueueHandler(queue.Queue(2))
+    args = ['before']
+    for _ in range(5):
+        handler.emit(make_record(args=(args,)))
+    args[0] = 'after'
+
+    assert handler.dropped == 3
+    record = handler.queue.get_nowait()
+    assert record.msg == "hello ['before']" and record.args is None
+
+
+def test_sync_pipeline_writes_text(restore_logging):
+    stream = io.StringIO()
+    configure_logging(level='INFO', fmt='text', async_mode=False, policies={}, stream=stream)
+    logging.getLogger('test.sync').info('plain line')
+
+    assert ' - test.sync - INFO - plain line' in stream.getvalue()
+    assert get_logging_stats() == {'async': False, 'queued': 0, 'dropped': 0, 'events': {}}
+
+
+def test_async_pipeline_flushes_on_stop_and_reports_stats(restore_logging):
+    stream = io.StringIO()
+    policies = {'noisy': {'sample_rate': 0.0}}
+    pipeline = configure_logging(level='INFO', fmt='json', async_mode=True, queue_size=100,
+                                 policies=policies, stream=stream)
+    logger = logging.getLogger('test.async')
+    logger.info('kept', extra={'vehicle_id': 'veh-1'})
+    logger.info('dropped', extra={'event': 'noisy'})
+    pipeline.stop()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line['message'] for line in lines if line['logger'] == 'test.async'] == ['kept']
+    assert lines[-1]['vehicle_id'] == 'veh-1'
+    stats = get_logging_stats()
+    assert stats['async'] is True and stats['dropped'] == 0
+    assert stats['events']['noisy']['sampled_out'] == 1
+
+
+def test_reconfiguring_replaces_the_previous_pipeline(restore_logging):
+    first = configure_logging(async_mode=True, stream=io.StringIO())
+    second = configure_logging(async_mode=False, stream=io.StringIO())
+    root = logging.getLogger()
+
+    assert first.handler not in root.handlers
+    assert second.handler in root.handlers
+    assert logging_pipeline._pipeline is second
+
+
+def test_stats_are_none_without_a_pipeline(monkeypatch):
+    monkeypatch.setattr(logging_pipeline, '_pipeline', None)
+    assert get_logging_stats() is None
@@ -0,0 +1,115 @@
+"""Sampling Profiler Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from api.profiling import ProfileSession, SamplingProfiler, collapse_stack
+
+
+def test_collapse_stack_is_root_first():
+    def inner():
+        return collapse_stack(sys._getframe())
+
+    def outer():
+        return inner()
+
+    labels = outer().split(';')
+    assert labels[-1].startswith('test_collapse_stack_is_root_first.<locals>.inner (test_profiling.py:')
+    assert labels[-2].startswith('test_collapse_stack_is_root_first.<locals>.outer')
+    assert len(collapse_stack(sys._getframe(), max_depth=2).split(';')) == 2
+
+
+def test_session_collapsed_output_and_summary():
+    session = ProfileSession(sample_rate=1.0, interval_ms=5.0, duration=None)
+    for _ in range(3):
+        session.add('api.get_vehicles', 'main;handler;query')
+    session.add('api.get_vehicles', 'main;handler;serialize')
+    session.add('api.send_message', 'main;send')
+
+    assert session.collapsed().splitlines() == [
+        'api.get_vehicles;main;handler;query 3',
+        'api.get_vehicles;main;handler;serialize 1',
+        'api.send_message;main;send 1'
+    ]
+    assert session.collapsed('api.send_message') == 'api.send_message;main;send 1\n'
+    assert session.collapsed('unknown') == ''
+    summary = session.summary(top=1)
+    assert summary['samples'] == 5 and summary['active'] is True
+    assert summary['endpoints']['api.get_vehicles'] == {
+        'samples': 4, 'hottest_frames': [{'frame': 'query', 'samples': 3}]}
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'sample_rate': 0.0}, {'sample_rate': 1.5}, {'interval_ms': 0.5}, {'duration': 0}, {'duration': 10_000}
+])
+def test_start_validates_arguments(kwargs):
+    with pytest.raises(ValueError):
+        SamplingProfiler().start(**kwargs)
+
+
+def test_background_threads_are_sampled_and_session_stops_at_deadline():
+    profiler = SamplingProfiler(thread_prefixes=('decisions-test',))
+    finished = []
+    profiler.add_listener(finished.append)
+    stop = threading.Event()
+
+    def busy():
+        while not stop.is_set():
+            sum(range(1000))
+
+    worker = threading.Thread(target=busy, name='decisions-test-1', daemon=True)
+    worker.start()
+    try:
+        session = profiler.start(duration=0.3, interval_ms=2.0)
+        with pytest.raises(RuntimeError):
+            profiler.start()
+        deadline = time.monotonic() + 5
+        while profiler.running and time.monotonic() < deadline:
+            time.sleep(0.02)
+    finally:
+        stop.set()
+        worker.join()
+
+    assert not profiler.running
+    assert finished == [session]
+    assert session.stacks['thread:decisions-test-1']
+    assert 'busy' in session.collapsed()
+
+
+def test_admin_profiler_requires_token_and_profiles_requests(monkeypatch):
+    from app import create_app
+    from api.profiling import profiler
+
+    client = create_app('testing').test_client()
+    monkeypatch.delenv('V2V_ADMIN_TOKEN', raising=False)
+    assert client.post('/admin/profiler/start').status_code == 403
+
+    monkeypatch.setenv('V2V_ADMIN_TOKEN', 'secret')
+    assert client.post('/admin/profiler/start', headers={'X-Admin-Token': 'wrong'}).status_code == 401
+
+    headers = {'Authorization': 'Bearer secret'}
+    assert client.post('/admin/profiler/start', json={'sample_rate': 2}, headers=headers).status_code == 400
+    response = client.post('/admin/profiler/start', json={'interval_ms': 1}, headers=headers)
+    try:
+        assert response.status_code == 200
+        assert client.post('/admin/profiler/start', headers=headers).status_code == 409
+        client.get('/api/vehicles')
+    finally:
+        stopped = client.post('/admin/profiler/stop', headers=headers)
+
+    assert stopped.status_code == 200
+    assert stopped.get_json()['data']['active'] is False
+    assert profiler.session.requests_profiled >= 1
+    collapsed = client.get('/admin/profiler/collapsed', headers=headers)
+    assert collapsed.status_code == 200 and collapsed.mimetype == 'text/plain'
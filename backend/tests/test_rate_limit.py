@@ -0,0 +1,129 @@
+"""Rate Limiting Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import pytest
+from flask import Flask
+
+from api.rate_limit import RateLimitRegistry, TokenBucketLimiter, rate_limited
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_limiter_rejects_invalid_configuration():
+    with pytest.raises(ValueError):
+        TokenBucketLimiter(rate=0, burst=5)
+    with pytest.raises(ValueError):
+        TokenBucketLimiter(rate=1, burst=0.5)
+
+
+def test_burst_then_refill():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate=2, burst=3, clock=clock)
+
+    assert [limiter.allow('a') for _ in range(4)] == [True, True, True, False]
+    assert limiter.retry_after('a') == pytest.approx(0.5)
+    clock.now += 0.5
+    assert limiter.allow('a') is True
+    assert limiter.allow('a') is False
+    assert (limiter.allowed, limiter.rejected) == (4, 2)
+
+
+def test_clients_have_independent_buckets():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate=1, burst=1, clock=clock)
+
+    assert limiter.allow('a') is True
+    assert limiter.allow('a') is False
+    assert limiter.allow('b') is True
+    assert limiter.retry_after('unknown') == 0.0
+
+
+def test_refill_is_capped_at_burst():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate=10, burst=2, clock=clock)
+    limiter.allow('a')
+    clock.now += 100
+
+    assert [limiter.allow('a') for _ in range(3)] == [True, True, False]
+
+
+def test_idle_buckets_are_evicted():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate=1, burst=1, idle_seconds=10, clock=clock)
+    limiter.allow('a')
+    clock.now += 11
+    limiter.allow('b')
+
+    assert len(limiter) == 1
+    assert limiter.evicted == 1
+
+
+def test_registry_metrics_and_unknown_endpoints():
+    registry = RateLimitRegistry({'send': {'rate': 1, 'burst': 1}})
+
+    assert registry.allow('other', 'a') is True
+    assert registry.retry_after('other', 'a') == 0.0
+    assert registry.allow('send', 'a') is True
+    assert registry.allow('send', 'a') is False
+    metrics = registry.get_metrics()['send']
+    assert (metrics['allowed'], metrics['rejected'], metrics['active_buckets']) == (1, 1, 1)
+
+
+def test_decorator_skips_requests_without_a_key():
+    registry = RateLimitRegistry({'send': {'rate': 1, 'burst': 1}})
+    rejected = []
+    view = rate_limited(registry, 'send', lambda **kwargs: kwargs.get('client'),
+                        lambda retry_after: rejected.append(retry_after) or 'rejected')(lambda **kwargs: 'ok')
+
+    assert [view(client=None) for _ in range(3)] == ['ok', 'ok', 'ok']
+    assert view(client='a') == 'ok'
+    assert view(client='a') == 'rejected'
+    assert 0 < rejected[0] <= 1
+
+
+def test_rejected_route_returns_429_with_retry_after():
+    from api import routes
+
+    app = Flask(__name__)
+    registry = RateLimitRegistry({'send': {'rate': 0.25, 'burst': 1}})
+
+    @app.route('/send', methods=['POST'])
+    @rate_limited(registry, 'send', routes.json_field('sender_id'), routes.rate_limit_exceeded)
+    def send():
+        return 'ok'
+
+    client = app.test_client()
+    assert client.post('/send', json={'sender_id': 'veh-1'}).status_code == 200
+    response = client.post('/send', json={'sender_id': 'veh-1'})
+
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '4'
+    assert response.get_json()['message'] == "Rate limit exceeded"
+    assert client.post('/send', json={'sender_id': 'veh-2'}).status_code == 200
+
+
+def test_safety_alert_endpoint_is_rate_limited_per_vehicle():
+    from app import create_app
+
+    client = create_app('testing').test_client()
+    payload = {'alert_type': 'rate-test', 'severity': 'low', 'position': {'lat': 10.0, 'lon': 10.0},
+               'message': 'm', 'vehicle_id': 'rate-test-vehicle'}
+    statuses = [client.post('/api/safety/alerts', json=payload).status_code for _ in range(7)]
+
+    assert statuses[:5] == [200] * 5
+    assert statuses[-1] == 429
@@ -0,0 +1,55 @@
+"""Startup Budget Tests
+
+Cold start (``import app`` plus ``create_app()``) must stay within
+``V2V_STARTUP_BUDGET_MS``, and the lazily imported ``rl_engine`` and
+``sockets`` packages must stay cheap to import while still resolving every
+name they export.
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import os
+import subprocess
+import sys
+
+from benchmarks.bench_startup import BACKEND_DIR, measure_startup
+
+STARTUP_BUDGET_MS = float(os.environ.get('V2V_STARTUP_BUDGET_MS', 1500))
+
+
+def run_python(script: str) -> subprocess.CompletedProcess:
+    """Run ``script`` in a fresh interpreter from the backend directory."""
+    return subprocess.run([sys.executable, '-c', script], cwd=BACKEND_DIR, capture_output=True, text=True)
+
+
+def test_cold_start_within_budget():
+    startup = measure_startup(runs=3)
+    assert startup['cold_start_ms'] <= STARTUP_BUDGET_MS, (
+        f"Cold start {startup['cold_start_ms']:.1f} ms exceeds budget of {STARTUP_BUDGET_MS:.1f} ms "
+        f"(run python -m benchmarks.bench_startup for the slowest imports)")
+
+
+def test_rl_engine_import_is_lazy():
+    completed = run_python("import sys, rl_engine; print('numpy' in sys.modules)")
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.strip() == 'False'
+
+
+def test_rl_engine_star_import_resolves_all_names():
+    completed = run_python("from rl_engine import *; import rl_engine; "
+                           "missing = [n for n in rl_engine.__all__ if n not in globals()]; "
+                           "assert not missing, missing")
+    assert completed.returncode == 0, completed.stderr
+
+
+def test_sockets_star_import_resolves_all_names():
+    completed = run_python("from sockets import *; import sockets; "
+                           "missing = [n for n in sockets.__all__ if n not in globals()]; "
+                           "assert not missing, missing; "
+                           "assert all(getattr(sockets, n) for n in sockets.__all__)")
+    assert completed.returncode == 0, completed.stderr
@@ -0,0 +1,100 @@
+"""VehicleRegistry and RecordLog Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import threading
+
+import pytest
+
+from api.stores import RecordLog, VehicleRegistry
+
+
+def test_registry_rejects_zero_stripes():
+    with pytest.raises(ValueError):
+        VehicleRegistry(stripes=0)
+
+
+def test_registry_update_is_copy_on_write():
+    registry = VehicleRegistry(stripes=4)
+    original = {'vehicle_id': 'veh-1', 'speed': 1.0}
+    registry.put('veh-1', original)
+
+    updated = registry.update('veh-1', {'speed': 2.0})
+
+    assert updated == {'vehicle_id': 'veh-1', 'speed': 2.0}
+    assert original['speed'] == 1.0
+    assert registry.get('veh-1') is updated
+    assert registry.update('missing', {'speed': 1.0}) is None
+
+
+def test_registry_remove_if_checks_predicate_under_lock():
+    registry = VehicleRegistry(stripes=4)
+    registry.put('veh-1', {'vehicle_id': 'veh-1', 'status': 'active'})
+
+    assert registry.remove_if('veh-1', lambda record: record['status'] == 'stale') is None
+    assert 'veh-1' in registry
+    assert registry.remove_if('veh-1', lambda record: record['status'] == 'active')['vehicle_id'] == 'veh-1'
+    assert 'veh-1' not in registry
+    assert registry.remove('veh-1') is None
+
+
+def test_registry_concurrent_modify_loses_no_updates():
+    registry = VehicleRegistry(stripes=4)
+    for i in range(8):
+        registry.put(f"veh-{i}", {'vehicle_id': f"veh-{i}", 'count': 0})
+
+    def writer():
+        for n in range(500):
+            registry.modify(f"veh-{n % 8}", lambda current: {**current, 'count': current['count'] + 1})
+
+    threads = [threading.Thread(target=writer) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(registry) == 8
+    assert sum(record['count'] for record in registry.values()) == 4 * 500
+
+
+def test_record_log_update_and_remove():
+    log = RecordLog('alert_id')
+    log.append({'alert_id': 'a', 'status': 'active'})
+    log.append({'alert_id': 'b', 'status': 'active'})
+
+    assert log.update('a', {'status': 'expired'})['status'] == 'expired'
+    assert log.remove('b')['alert_id'] == 'b'
+    assert log.remove('b') is None
+    assert log.get('b') is None
+    assert [record['alert_id'] for record in log] == ['a']
+    assert len(log) == 1
+
+
+def test_record_log_compaction_keeps_order_and_index():
+    log = RecordLog('id', compact_min=4)
+    for i in range(10):
+        log.append({'id': str(i)})
+    for i in range(0, 10, 2):
+        log.remove(str(i))
+
+    assert log._tombstones < 4  # compacted at least once
+    assert [record['id'] for record in log.snapshot()] == ['1', '3', '5', '7', '9']
+    assert log.get('7') == {'id': '7'}
+    log.append({'id': '10'})
+    assert log.get('10') == {'id': '10'}
+
+
+def test_record_log_snapshot_is_isolated_from_later_writes():
+    log = RecordLog('id')
+    log.append({'id': '1'})
+    snapshot = log.snapshot()
+    log.append({'id': '2'})
+    log.remove('1')
+
+    assert snapshot == [{'id': '1'}]
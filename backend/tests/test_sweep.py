@@ -0,0 +1,95 @@
+"""Hyperparameter Sweep Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import json
+
+import pytest
+
+from rl_engine.sweep import grid_configs, random_configs, rung_cutoffs, run_sweep, run_trial, trial_id
+
+SETTINGS = {'steps': 6, 'num_envs': 2, 'rungs': 3, 'eval_envs': 2, 'eval_steps': 3, 'eval_seed': 1,
+            'prune_percentile': 25, 'prune_margin': 0.0, 'seed': 0}
+CONFIGS = [{'gamma': 0.9, 'batch_size': 4, 'memory_size': 64}, {'gamma': 0.99, 'batch_size': 4, 'memory_size': 64}]
+
+
+def test_grid_configs_cover_every_combination():
+    configs = grid_configs({'b': [1, 2], 'a': ['x', 'y', 'z']})
+    assert len(configs) == 6
+    assert configs[0] == {'a': 'x', 'b': 1}
+
+
+def test_random_configs_are_seeded_and_in_range():
+    ranges = {'learning_rate': {'low': 1e-4, 'high': 1e-2, 'log': True}}
+    first = random_configs({'batch_size': [32, 64]}, ranges, trials=20, seed=3)
+
+    assert first == random_configs({'batch_size': [32, 64]}, ranges, trials=20, seed=3)
+    assert all(1e-4 <= config['learning_rate'] <= 1e-2 for config in first)
+    assert {config['batch_size'] for config in first} == {32, 64}
+
+
+def test_trial_id_depends_on_config_and_settings():
+    config = {'gamma': 0.9, 'batch_size': 32}
+    assert trial_id(config, SETTINGS) == trial_id(dict(reversed(list(config.items()))), dict(SETTINGS))
+    assert trial_id(config, SETTINGS) != trial_id({**config, 'gamma': 0.95}, SETTINGS)
+    assert trial_id(config, SETTINGS) != trial_id(config, {**SETTINGS, 'steps': 7})
+
+
+def test_rung_cutoffs_use_the_requested_percentile():
+    records = [{'rung_scores': [score, score]} for score in (1.0, 2.0, 3.0, 4.0, 5.0)]
+    records.append({'rung_scores': [0.0]})
+
+    assert rung_cutoffs(records, 50) == {0: 2.5, 1: 3.0}
+    low = rung_cutoffs(records, 25)
+    assert low[0] == pytest.approx(1.25) and low[1] == pytest.approx(2.0)
+    assert rung_cutoffs(records[:2], 50) == {}
+
+
+def test_trial_evaluates_at_every_rung():
+    record = run_trial(CONFIGS[0], SETTINGS, cutoffs={})
+
+    assert record['status'] == 'completed'
+    assert len(record['rung_scores']) == SETTINGS['rungs']
+    assert record['trial_id'] == trial_id(CONFIGS[0], SETTINGS)
+
+
+def test_trial_is_pruned_below_cutoff_but_not_at_the_final_step():
+    pruned = run_trial(CONFIGS[0], SETTINGS, cutoffs={0: float('inf')})
+    assert pruned['status'] == 'pruned' and len(pruned['rung_scores']) == 1
+
+    last = run_trial(CONFIGS[0], SETTINGS, cutoffs={SETTINGS['rungs'] - 1: float('inf')})
+    assert last['status'] == 'completed'
+
+
+def test_sweep_resumes_from_checkpoint(tmp_path):
+    out = str(tmp_path / 'sweep')
+    records = run_sweep(CONFIGS, SETTINGS, out, workers=1)
+    checkpoint = tmp_path / 'sweep' / 'trials.jsonl'
+
+    assert len(records) == 2 and all(record['status'] == 'completed' for record in records)
+    assert len(checkpoint.read_text().splitlines()) == 2
+    assert (tmp_path / 'sweep' / 'results.md').read_text().startswith('| rank |')
+
+    run_sweep(CONFIGS, SETTINGS, out, workers=1)
+    assert len(checkpoint.read_text().splitlines()) == 2
+
+
+def test_failed_trials_are_retried_unless_skipped(tmp_path):
+    out = tmp_path / 'sweep'
+    out.mkdir()
+    failed = {'trial_id': trial_id(CONFIGS[0], SETTINGS), 'config': CONFIGS[0], 'settings': SETTINGS,
+              'status': 'failed', 'score': float('-inf'), 'collision_rate': 1.0, 'rung_scores': [],
+              'train_steps': 0, 'wall_seconds': 0.0}
+    (out / 'trials.jsonl').write_text(json.dumps(failed) + '\n')
+
+    kept = run_sweep(CONFIGS[:1], SETTINGS, str(out), workers=1, skip_failed=True)
+    assert kept[0]['status'] == 'failed'
+
+    retried = run_sweep(CONFIGS[:1], SETTINGS, str(out), workers=1)
+    assert retried[0]['status'] == 'completed'
@@ -0,0 +1,81 @@
+"""Trajectory History Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import pytest
+
+from api.trajectory import TrajectoryBuffer, TrajectoryStore
+
+
+def sample(t: float):
+    return (t, 50.0 + t, 8.0 + t, 10.0 + t, 90.0 + t)
+
+
+def test_buffer_rejects_zero_capacity():
+    with pytest.raises(ValueError):
+        TrajectoryBuffer(0)
+
+
+def test_buffer_wraps_and_keeps_newest_in_order():
+    buffer = TrajectoryBuffer(3)
+    assert buffer.latest() is None
+    for t in range(5):
+        buffer.append(*sample(float(t)))
+
+    assert len(buffer) == 3
+    assert buffer.samples() == [sample(2.0), sample(3.0), sample(4.0)]
+    assert buffer.samples(limit=2) == [sample(3.0), sample(4.0)]
+    assert buffer.samples(limit=0) == []
+    assert buffer.latest() == sample(4.0)
+
+
+def test_buffer_memory_is_fixed_per_capacity():
+    buffer = TrajectoryBuffer(120)
+    empty = buffer.nbytes
+    for t in range(500):
+        buffer.append(*sample(float(t)))
+
+    assert empty == buffer.nbytes == 120 * 5 * 8
+
+
+def test_store_tracks_vehicles_independently():
+    store = TrajectoryStore(capacity=2, stripes=4)
+    store.record('a', *sample(1.0))
+    store.record('a', *sample(2.0))
+    store.record('a', *sample(3.0))
+    store.record('b', *sample(9.0))
+
+    assert store.track('a') == [sample(2.0), sample(3.0)]
+    assert store.track('a', limit=1) == [sample(3.0)]
+    assert store.track('b') == [sample(9.0)]
+    assert store.track('missing') is None
+    assert len(store) == 2 and 'a' in store
+    assert store.memory_bytes() == 2 * 2 * 5 * 8
+
+    store.discard('a')
+    assert store.track('a') is None and 'a' not in store
+
+
+def test_track_endpoint_validates_limit():
+    from app import create_app
+
+    client = create_app('testing').test_client()
+    assert client.post('/api/vehicles/register', json={
+        'vehicle_id': 'track-test', 'position': {'lat': 1.0, 'lon': 2.0}, 'speed': 3.0, 'heading': 4.0
+    }).status_code == 200
+    client.put('/api/vehicles/track-test/update', json={'position': {'lat': 1.001, 'lon': 2.0}})
+
+    response = client.get('/api/vehicles/track-test/track?limit=1')
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert data['count'] == 1 and data['samples'][0]['lat'] == 1.001
+    assert client.get('/api/vehicles/track-test/track').get_json()['data']['count'] == 2
+    for limit in ('0', '-1', 'abc'):
+        assert client.get(f'/api/vehicles/track-test/track?limit={limit}').status_code == 400
+    assert client.get('/api/vehicles/unknown-vehicle/track').status_code == 404
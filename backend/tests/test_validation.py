@@ -0,0 +1,98 @@
+"""Compiled Validator Tests
+
+Run from the backend directory:
+    python -m pytest tests
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+from api.validation import (
+    ARRAY, NUMBER, OBJECT, STRING, Field, compile_batch_validator, compile_schema,
+    validate_safety_alert, validate_vehicle_batch_update, validate_vehicle_registration,
+    validate_vehicle_update
+)
+
+REGISTRATION = {
+    'vehicle_id': 'veh-1',
+    'position': {'lat': 52.5, 'lon': 13.4},
+    'speed': 12.0,
+    'heading': 90.0
+}
+
+
+def test_valid_registration_passes():
+    assert validate_vehicle_registration(REGISTRATION) == (True, None)
+
+
+def test_non_object_payload_is_rejected():
+    assert validate_vehicle_registration([REGISTRATION]) == (False, "Payload must be a JSON object")
+
+
+def test_missing_and_wrong_type_messages():
+    payload = {key: value for key, value in REGISTRATION.items() if key != 'speed'}
+    assert validate_vehicle_registration(payload) == (False, "Missing required field: speed")
+    assert validate_vehicle_registration({**REGISTRATION, 'speed': 'fast'}) == (
+        False, "Field 'speed' must be a number")
+
+
+def test_bool_is_not_a_number():
+    is_valid, error = validate_vehicle_registration({**REGISTRATION, 'speed': True})
+    assert not is_valid and error == "Field 'speed' must be a number"
+
+
+def test_range_checks():
+    assert validate_vehicle_registration({**REGISTRATION, 'heading': 361.0}) == (
+        False, "Field 'heading' must be between 0.0 and 360.0")
+    assert compile_schema({'n': Field(NUMBER, min_value=1)})({'n': 0}) == (False, "Field 'n' must be at least 1")
+    assert compile_schema({'n': Field(NUMBER, max_value=1)})({'n': 2}) == (False, "Field 'n' must be at most 1")
+
+
+def test_nested_position_uses_shared_message():
+    is_valid, error = validate_vehicle_registration({**REGISTRATION, 'position': {'lat': 52.5}})
+    assert not is_valid and error == "Position must contain 'lat' and 'lon' coordinates"
+    is_valid, error = validate_vehicle_registration({**REGISTRATION, 'position': {'lat': 91.0, 'lon': 0.0}})
+    assert not is_valid and error == "Field 'position.lat' must be between -90.0 and 90.0"
+
+
+def test_choices_and_optional_fields():
+    assert validate_vehicle_update({}) == (True, None)
+    assert validate_vehicle_update({'status': 'emergency'}) == (True, None)
+    is_valid, error = validate_vehicle_update({'status': 'stale'})
+    assert not is_valid and error.startswith("Field 'status' must be one of")
+    is_valid, error = validate_safety_alert({
+        'alert_type': 'ice', 'severity': 'extreme', 'position': {'lat': 0.0, 'lon': 0.0},
+        'message': 'm', 'vehicle_id': 'veh-1'})
+    assert not is_valid and 'severity' in error
+
+
+def test_array_length_and_item_types():
+    validate = compile_schema({'values': Field(ARRAY, length=2, item_types=NUMBER)})
+    assert validate({'values': [1, 2.5]}) == (True, None)
+    assert validate({'values': [1]}) == (False, "Field 'values' must have exactly 2 items")
+    assert validate({'values': [1, 'x']}) == (False, "Field 'values' items must be a number")
+    assert validate({'values': [1, False]}) == (False, "Field 'values' items must be a number")
+
+
+def test_custom_message_overrides_missing_and_type_errors():
+    validate = compile_schema({'meta': Field(OBJECT, message="meta is required")})
+    assert validate({}) == (False, "meta is required")
+    assert validate({'meta': 'x'}) == (False, "meta is required")
+
+
+def test_batch_validator_reports_item_errors_by_index():
+    validate = compile_batch_validator(compile_schema({'id': Field(STRING)}), max_items=3)
+    assert validate([{'id': 'a'}, {'id': 'b'}]) == (True, None, [])
+    assert validate({'id': 'a'}) == (False, "Batch must be a JSON array", [])
+    assert validate([{'id': 'a'}] * 4) == (False, "Batch exceeds maximum of 3 items", [])
+    assert validate([{'id': 'a'}, {}, {'id': 1}]) == (False, None, [
+        {'index': 1, 'error': "Missing required field: id"},
+        {'index': 2, 'error': "Field 'id' must be a string"}
+    ])
+
+
+def test_vehicle_batch_update_requires_vehicle_id():
+    is_valid, _, item_errors = validate_vehicle_batch_update([{'vehicle_id': 'veh-1', 'speed': 3.0}, {'speed': 3.0}])
+    assert not is_valid
+    assert item_errors == [{'index': 1, 'error': "Missing required field: vehicle_id"}]
@@ -0,0 +1,389 @@
+"""Load Generator for the V2V Backend
+
+Simulates a fleet of vehicles driving around a city centre and drives a
+locally running backend with the traffic they would produce:
+
+- every vehicle registers once (``POST /api/vehicles/register``)
+- sends position updates at ``--update-rate`` Hz (``PUT /api/vehicles/<id>/update``)
+- posts safety alerts and V2V messages at low per-vehicle rates
+- optionally holds Socket.IO connections open on the ``/v2v`` and ``/safety``
+  namespaces for the whole run
+
+Vehicles follow a smooth random-acceleration, random-turn motion model. Each
+worker thread drives a share of the fleet from a schedule, reusing one HTTP
+connection pool, and ``--processes`` splits the fleet across processes so the
+generator is not the bottleneck. The run ends with a JSON report of
+throughput, status codes and p50/p95/p99 latency per endpoint, plus how far
+the generator fell behind its own schedule.
+
+Usage:
+    python simulation/load_generator.py --vehicles 500 --update-rate 2 --duration 60
+    python simulation/load_generator.py --vehicles 2000 --processes 4 --sockets 200 -o report.json
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import argparse
+import heapq
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+METERS_PER_DEGREE = math.pi * 6371000.0 / 180.0
+CITY_CENTRE = (42.3314, -83.0458)
+CITY_RADIUS_M = 5000.0
+MAX_SPEED = 35.0  # m/s
+ALERT_TYPES = ('collision_warning', 'road_hazard', 'emergency_vehicle', 'traffic_jam')
+SEVERITIES = ('low', 'medium', 'high', 'critical')
+MESSAGE_TYPES = ('position_broadcast', 'intent_sharing', 'hazard_relay')
+
+
+class SimulatedVehicle:
+    """Vehicle with smooth random acceleration and steering.
+
+    Attributes:
+        vehicle_id (str): Unique id used against the API
+        lat, lon (float): Position (degrees)
+        speed (float): Speed (m/s)
+        heading (float): Degrees clockwise from north
+    """
+
+    __slots__ = ('vehicle_id', 'lat', 'lon', 'speed', 'heading', 'acceleration', 'turn_rate', 'rng')
+
+    def __init__(self, vehicle_id: str, rng: random.Random):
+        self.vehicle_id = vehicle_id
+        self.rng = rng
+        distance = CITY_RADIUS_M * math.sqrt(rng.random())
+        bearing = rng.uniform(0.0, 2.0 * math.pi)
+        self.lat = CITY_CENTRE[0] + distance * math.cos(bearing) / METERS_PER_DEGREE
+        self.lon = CITY_CENTRE[1] + distance * math.sin(bearing) / (
+            METERS_PER_DEGREE * math.cos(math.radians(CITY_CENTRE[0])))
+        self.speed = rng.uniform(5.0, 20.0)
+        self.heading = rng.uniform(0.0, 360.0)
+        self.acceleration = 0.0
+        self.turn_rate = 0.0
+
+    def step(self, dt: float) -> None:
+        """Advance the vehicle ``dt`` seconds."""
+        rng = self.rng
+        # Drivers change acceleration and steering every few seconds
+        if rng.random() < dt / 3.0:
+            self.acceleration = rng.uniform(-2.5, 1.5)
+        if rng.random() < dt / 5.0:
+            self.turn_rate = rng.choice((0.0, 0.0, 0.0, rng.uniform(-15.0, 15.0)))
+        self.speed = min(max(self.speed + self.acceleration * dt, 0.0), MAX_SPEED)
+        self.heading = (self.heading + self.turn_rate * dt) % 360.0
+        distance = self.speed * dt
+        bearing = math.radians(self.heading)
+        self.lat += distance * math.cos(bearing) / METERS_PER_DEGREE
+        self.lon += distance * math.sin(bearing) / (METERS_PER_DEGREE * math.cos(math.radians(self.lat)))
+
+    def position(self) -> Dict[str, float]:
+        return {'lat': round(self.lat, 7), 'lon': round(self.lon, 7)}
+
+    def registration(self) -> Dict[str, Any]:
+        return {
+            'vehicle_id': self.vehicle_id,
+            'position': self.position(),
+            'speed': round(self.speed, 2),
+            'heading': round(self.heading, 1),
+            'vehicle_type': 'passenger_car',
+            'capabilities': ['v2v', 'adas']
+        }
+
+    def update(self) -> Dict[str, Any]:
+        return {'position': self.position(), 'speed': round(self.speed, 2), 'heading': round(self.heading, 1)}
+
+    def alert(self) -> Dict[str, Any]:
+        return {
+            'alert_type': self.rng.choice(ALERT_TYPES),
+            'severity': self.rng.choice(SEVERITIES),
+            'position': self.position(),
+            'radius': self.rng.choice((50, 100, 250)),
+            'message': 'Simulated hazard report',
+            'vehicle_id': self.vehicle_id
+        }
+
+    def message(self, recipient_id: str) -> Dict[str, Any]:
+        return {
+            'sender_id': self.vehicle_id,
+            'recipient_id': recipient_id,
+            'message_type': self.rng.choice(MESSAGE_TYPES),
+            'payload': {'position': self.position(), 'speed': round(self.speed, 2)},
+            'priority': 'medium'
+        }
+
+
+class Recorder:
+    """Per-worker latency samples and status counts keyed by endpoint."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.spans: Dict[str, List[float]] = {}
+        self.lag: List[float] = []
+
+    def request(self, session, endpoint: str, method: str, url: str, payload: Dict[str, Any],
+                timeout: float) -> None:
+        started = time.monotonic()
+        try:
+            response = session.request(method, url, json=payload, timeout=timeout)
+            status = str(response.status_code)
+        except Exception as e:
+            status = type(e).__name__
+        finished = time.monotonic()
+        self.latencies[endpoint].append(finished - started)
+        self.statuses[endpoint][status] += 1
+        span = self.spans.get(endpoint)
+        if span is None:
+            self.spans[endpoint] = [started, finished]
+        else:
+            span[1] = finished
+
+    def merge(self, other: 'Recorder') -> None:
+        for endpoint, values in other.latencies.items():
+            self.latencies[endpoint].extend(values)
+        for endpoint, counts in other.statuses.items():
+            self.statuses[endpoint].update(counts)
+        merge_spans(self.spans, other.spans)
+        self.lag.extend(other.lag)
+
+
+def merge_spans(spans: Dict[str, List[float]], other: Dict[str, List[float]]) -> None:
+    """Widen each endpoint's [first start, last finish] span to cover ``other``."""
+    for endpoint, (first, last) in other.items():
+        span = spans.get(endpoint)
+        if span is None:
+            spans[endpoint] = [first, last]
+        else:
+            span[0], span[1] = min(span[0], first), max(span[1], last)
+
+
+def _drive(vehicles: List[SimulatedVehicle], config: Dict[str, Any], recorder: Recorder,
+           fleet_ids: List[str]) -> None:
+    """Worker loop: register, then send each vehicle's traffic on schedule for ``duration``."""
+    import requests
+
+    base = config['url'].rstrip('/')
+    timeout = config['timeout']
+    update_interval = 1.0 / config['update_rate']
+    alert_probability = config['alert_rate'] * update_interval
+    message_probability = config['message_rate'] * update_interval
+    rng = random.Random(config['seed'])
+    session = requests.Session()
+
+    for vehicle in vehicles:
+        recorder.request(session, 'register', 'POST', f"{base}/api/vehicles/register",
+                         vehicle.registration(), timeout)
+
+    # (due time, index) schedule, spread over the first interval
+    now = time.monotonic()
+    deadline = now + config['duration']
+    schedule = [(now + rng.random() * update_interval, i) for i in range(len(vehicles))]
+    heapq.heapify(schedule)
+    last_step = [now] * len(vehicles)
+
+    while schedule:
+        due, index = schedule[0]
+        now = time.monotonic()
+        if due >= deadline:
+            break
+        if due > now:
+            time.sleep(min(due - now, deadline - now))
+            continue
+        heapq.heapreplace(schedule, (due + update_interval, index))
+        recorder.lag.append(now - due)
+
+        vehicle = vehicles[index]
+        vehicle.step(now - last_step[index])
+        last_step[index] = now
+        recorder.request(session, 'update', 'PUT', f"{base}/api/vehicles/{vehicle.vehicle_id}/update",
+                         vehicle.update(), timeout)
+        if rng.random() < alert_probability:
+            recorder.request(session, 'alert', 'POST', f"{base}/api/safety/alerts", vehicle.alert(), timeout)
+        if rng.random() < message_probability:
+            recipient = rng.choice(fleet_ids) if rng.random() < 0.7 else 'broadcast'
+            recorder.request(session, 'message', 'POST', f"{base}/api/communication/send",
+                             vehicle.message(recipient), timeout)
+
+
+def _hold_sockets(count: int, config: Dict[str, Any], done: threading.Event) -> Dict[str, Any]:
+    """Open ``count`` Socket.IO clients and keep them connected until ``done`` is set."""
+    import socketio
+
+    namespaces = ['/v2v', '/safety']
+    clients, connect_times, failures = [], [], Counter()
+    for _ in range(count):
+        client = socketio.Client(reconnection=False)
+        started = time.perf_counter()
+        try:
+            client.connect(config['url'], namespaces=namespaces, wait_timeout=config['timeout'])
+            connect_times.append(time.perf_counter() - started)
+            clients.append(client)
+        except Exception as e:
+            failures[type(e).__name__] += 1
+
+    done.wait()
+    still_connected = sum(1 for client in clients if client.connected)
+    for client in clients:
+        client.disconnect()
+    return {'connect_times': connect_times, 'failures': dict(failures), 'held': still_connected}
+
+
+def run_shard(config: Dict[str, Any], shard: int) -> Dict[str, Any]:
+    """Run one process's share of the fleet and return its raw measurements."""
+    processes = config['processes']
+    first = shard * config['vehicles'] // processes
+    last = (shard + 1) * config['vehicles'] // processes
+    run_id = config['run_id']
+    vehicles = [SimulatedVehicle(f"load-{run_id}-{i}", random.Random(config['seed'] * 1000003 + i))
+                for i in range(first, last)]
+    fleet_ids = [f"load-{run_id}-{i}" for i in range(config['vehicles'])]
+
+    workers = max(1, min(config['workers'], len(vehicles)))
+    recorders = [Recorder() for _ in range(workers)]
+    threads = [
+        threading.Thread(target=_drive, args=(vehicles[i::workers], dict(config, seed=config['seed'] + 7919 * i),
+                                              recorders[i], fleet_ids), daemon=True)
+        for i in range(workers)
+    ]
+    socket_count = config['sockets'] // processes + (1 if shard < config['sockets'] % processes else 0)
+    done = threading.Event()
+    sockets = {}
+    if socket_count:
+        holder = threading.Thread(target=lambda: sockets.update(_hold_sockets(socket_count, config, done)),
+                                  daemon=True)
+        holder.start()
+
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    done.set()
+    if socket_count:
+        holder.join()
+
+    merged = Recorder()
+    for recorder in recorders:
+        merged.merge(recorder)
+    return {
+        'elapsed': elapsed,
+        'latencies': dict(merged.latencies),
+        'statuses': {endpoint: dict(counts) for endpoint, counts in merged.statuses.items()},
+        'spans': merged.spans,
+        'lag': merged.lag,
+        'sockets': sockets or None
+    }
+
+
+def percentiles_ms(values: List[float]) -> Dict[str, float]:
+    """p50/p95/p99/max of latencies in seconds, in milliseconds."""
+    if not values:
+        return {'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'max_ms': None}
+    values = sorted(values)
+    pick = lambda fraction: round(values[int(fraction * (len(values) - 1))] * 1000, 3)
+    return {'p50_ms': pick(0.50), 'p95_ms': pick(0.95), 'p99_ms': pick(0.99), 'max_ms': round(values[-1] * 1000, 3)}
+
+
+def summarize(config: Dict[str, Any], shards: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge shard measurements into the JSON report."""
+    elapsed = max(shard['elapsed'] for shard in shards)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Counter] = defaultdict(Counter)
+    spans: Dict[str, List[float]] = {}
+    lag: List[float] = []
+    for shard in shards:
+        for endpoint, values in shard['latencies'].items():
+            latencies[endpoint].extend(values)
+        for endpoint, counts in shard['statuses'].items():
+            statuses[endpoint].update(counts)
+        merge_spans(spans, shard['spans'])
+        lag.extend(shard['lag'])
+
+    endpoints = {}
+    for endpoint, values in latencies.items():
+        counts = statuses[endpoint]
+        first, last = spans[endpoint]
+        endpoints[endpoint] = {
+            'requests': len(values),
+            'throughput_rps': round(len(values) / max(last - first, 1e-9), 1),
+            'success': sum(n for status, n in counts.items() if status.startswith('2')),
+            'statuses': dict(counts),
+            **percentiles_ms(values)
+        }
+
+    report = {
+        'config': {key: config[key] for key in ('url', 'vehicles', 'update_rate', 'alert_rate', 'message_rate',
+                                                'duration', 'processes', 'workers', 'sockets', 'seed')},
+        'elapsed_seconds': round(elapsed, 3),
+        'total_requests': sum(len(values) for values in latencies.values()),
+        'total_throughput_rps': round(sum(len(values) for values in latencies.values()) / elapsed, 1),
+        'target_update_rps': config['vehicles'] * config['update_rate'],
+        'endpoints': endpoints,
+        'schedule_lag': percentiles_ms(lag)
+    }
+    socket_results = [shard['sockets'] for shard in shards if shard['sockets']]
+    if config['sockets']:
+        failures = Counter()
+        for result in socket_results:
+            failures.update(result['failures'])
+        report['sockets'] = {
+            'requested': config['sockets'],
+            'connected': sum(len(result['connect_times']) for result in socket_results),
+            'held_to_end': sum(result['held'] for result in socket_results),
+            'failures': dict(failures),
+            'connect': percentiles_ms([t for result in socket_results for t in result['connect_times']])
+        }
+    return report
+
+
+def run_load(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the configured load and return the report."""
+    config = dict(config, run_id=config.get('run_id') or uuid.uuid4().hex[:8])
+    if config['processes'] == 1:
+        shards = [run_shard(config, 0)]
+    else:
+        with ProcessPoolExecutor(max_workers=config['processes']) as pool:
+            shards = list(pool.map(run_shard, [config] * config['processes'], range(config['processes'])))
+    return summarize(config, shards)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate simulated vehicle load against the backend")
+    parser.add_argument('--url', default='http://localhost:5000', help="Backend root URL")
+    parser.add_argument('--vehicles', type=int, default=100)
+    parser.add_argument('--update-rate', type=float, default=1.0, help="Position updates per vehicle per second")
+    parser.add_argument('--alert-rate', type=float, default=0.01, help="Safety alerts per vehicle per second")
+    parser.add_argument('--message-rate', type=float, default=0.1, help="V2V messages per vehicle per second")
+    parser.add_argument('--duration', type=float, default=30.0, help="Seconds of load after each worker registers")
+    parser.add_argument('--processes', type=int, default=1, help="Generator processes")
+    parser.add_argument('--workers', type=int, default=16, help="Request threads per process")
+    parser.add_argument('--sockets', type=int, default=0, help="Socket.IO connections to hold open")
+    parser.add_argument('--timeout', type=float, default=5.0, help="Per-request timeout in seconds")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('-o', '--output', help="Also write the report to this file")
+    args = parser.parse_args()
+
+    config = {key: value for key, value in vars(args).items() if key != 'output'}
+    config['processes'] = max(1, min(args.processes, args.vehicles))
+    report = run_load(config)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    print(text)
+
+
+if __name__ == '__main__':
+    main()
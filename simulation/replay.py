@@ -0,0 +1,214 @@
+"""Offline Replay of Exported V2V Logs
+
+Feeds an NDJSON export from ``GET /api/export/<log_name>`` back into a running
+backend (or into any Python consumer, such as a simulator) preserving the
+recorded inter-arrival times, optionally accelerated. Used for incident
+analysis and for reproducing recorded load.
+
+Record kinds are detected by their id field:
+- ``message_id`` records are re-sent to ``POST /api/communication/send``
+- ``alert_id`` records are re-posted to ``POST /api/safety/alerts``
+
+The ``safety_alerts`` log holds canonical alerts only: duplicate reports were
+merged into them by the backend and are not exported individually. Replaying
+an alert therefore posts one report from its original source vehicle, carrying
+the final (possibly escalated) severity and the widened radius. The extra
+reporters and the escalation history are not rebuilt on the target. The
+summary counts these lost reports as ``unreplayed_merged_reports``.
+
+Accelerated replays exceed the backend's per-client rate limits (safety alerts
+allow 1/s with bursts of 5 per vehicle). A 429 response is retried after its
+``Retry-After`` delay, backing off exponentially, up to ``--max-retries``
+times; posts still rejected after that are counted in the summary as
+``rejected``. To replay at full speed instead, start the target backend with
+the limits raised, e.g. ``V2V_RATE_LIMIT_SAFETY_ALERT_RATE=1000`` and
+``V2V_RATE_LIMIT_SAFETY_ALERT_BURST=1000``.
+
+Usage:
+    python simulation/replay.py communication_logs.ndjson --speed 10
+    python simulation/replay.py safety_alerts.ndjson --speed 0   # as fast as possible
+    python simulation/replay.py safety_alerts.ndjson --speed 60 --max-retries 0   # drop rate-limited posts
+
+Author: V2V Safety Team
+Date: October 19, 2026
+Version: 1.0.0
+"""
+
+import argparse
+import json
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+TIME_FIELDS = ('timestamp', 'created_at')
+
+
+def read_ndjson(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream records from an NDJSON file, skipping blank lines."""
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def record_time(record: Dict[str, Any]) -> Optional[float]:
+    """Return the record's timestamp in seconds, or None if it has none."""
+    for field in TIME_FIELDS:
+        if field in record:
+            return datetime.fromisoformat(record[field]).timestamp()
+    return None
+
+
+def iter_replay(path: str, speed: float = 1.0,
+                sleep=time.sleep, clock=time.monotonic) -> Iterator[Tuple[float, Dict[str, Any]]]:
+    """Yield records at their recorded pace.
+
+    Args:
+        path: NDJSON export file
+        speed: Time acceleration factor; 0 replays without delays
+        sleep: Sleep function (injectable for simulators with virtual time)
+        clock: Monotonic clock
+
+    Returns:
+        Iterator of (seconds since first record in recorded time, record)
+    """
+    first_recorded = None
+    started = clock()
+    for record in read_ndjson(path):
+        recorded = record_time(record)
+        if recorded is None:
+            offset = 0.0
+        else:
+            if first_recorded is None:
+                first_recorded = recorded
+            offset = max(0.0, recorded - first_recorded)
+        if speed > 0:
+            delay = started + offset / speed - clock()
+            if delay > 0:
+                sleep(delay)
+        yield offset, record
+
+
+def to_request(record: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Map an exported record back to the (path, payload) that created it."""
+    if 'message_id' in record:
+        return '/api/communication/send', {
+            'sender_id': record['sender_id'],
+            'recipient_id': record['recipient_id'],
+            'message_type': record['message_type'],
+            'payload': record['payload'],
+            'priority': record.get('priority', 'medium')
+        }
+    if 'alert_id' in record:
+        return '/api/safety/alerts', {
+            'alert_type': record['alert_type'],
+            'severity': record['severity'],
+            'position': record['position'],
+            'radius': record.get('radius', 100),
+            'message': record['message'],
+            'vehicle_id': record['source_vehicle_id']
+        }
+    return None
+
+
+def retry_delay(response, attempt: int, backoff: float = 0.5, max_delay: float = 30.0) -> float:
+    """Seconds to wait before retrying a rate-limited request.
+
+    Args:
+        response: The 429 response
+        attempt: Zero-based retry number
+        backoff: Base delay when the response has no usable Retry-After header
+        max_delay: Upper bound on the delay
+
+    Returns:
+        The Retry-After delay, or an exponential backoff, whichever is longer
+    """
+    try:
+        retry_after = float(response.headers.get('Retry-After', 0))
+    except ValueError:
+        retry_after = 0.0
+    return min(max_delay, max(retry_after, backoff * 2 ** attempt))
+
+
+def replay_to_api(path: str, base_url: str, speed: float = 1.0, timeout: float = 5.0,
+                  max_retries: int = 5, sleep=time.sleep) -> Dict[str, Any]:
+    """Replay an export against a running backend.
+
+    Rate-limited posts (HTTP 429) are retried after the server's Retry-After
+    delay; the replay then catches up with the recorded pace.
+
+    Args:
+        path: NDJSON export file
+        base_url: Backend root URL, e.g. http://localhost:5000
+        speed: Time acceleration factor; 0 replays without delays
+        timeout: Per-request timeout in seconds
+        max_retries: Retries per rate-limited post; 0 drops it on the first 429
+        sleep: Sleep function for retry delays
+
+    Returns:
+        Summary with counts per final HTTP status, retries, rejected posts,
+        merged alert reports that could not be replayed and achieved request rate
+    """
+    import requests
+
+    session = requests.Session()
+    statuses = Counter()
+    skipped = 0
+    retries = 0
+    rejected = 0
+    unreplayed_merged = 0
+    started = time.monotonic()
+    for _, record in iter_replay(path, speed):
+        request = to_request(record)
+        if request is None:
+            skipped += 1
+            continue
+        route, payload = request
+        # Only the canonical alert is exported; its merged reports are lost
+        unreplayed_merged += max(0, record.get('reporter_count', 1) - 1)
+        for attempt in range(max_retries + 1):
+            try:
+                response = session.post(base_url.rstrip('/') + route, json=payload, timeout=timeout)
+            except requests.RequestException:
+                statuses['error'] += 1
+                break
+            if response.status_code != 429 or attempt == max_retries:
+                statuses[str(response.status_code)] += 1
+                rejected += response.status_code == 429
+                break
+            retries += 1
+            sleep(retry_delay(response, attempt))
+    elapsed = time.monotonic() - started
+
+    sent = sum(statuses.values())
+    return {
+        'file': path,
+        'speed': speed,
+        'sent': sent,
+        'skipped': skipped,
+        'statuses': dict(statuses),
+        'rate_limit_retries': retries,
+        'rejected': rejected,
+        'unreplayed_merged_reports': unreplayed_merged,
+        'elapsed_seconds': round(elapsed, 3),
+        'requests_per_second': round(sent / elapsed, 1) if elapsed > 0 else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay an NDJSON log export against the backend")
+    parser.add_argument('path', help="NDJSON file from GET /api/export/<log_name>")
+    parser.add_argument('--url', default='http://localhost:5000', help="Backend root URL")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="Time acceleration (1 = real time, 0 = no delays)")
+    parser.add_argument('--max-retries', type=int, default=5,
+                        help="Retries per rate-limited (429) post before counting it as rejected")
+    args = parser.parse_args()
+
+    print(json.dumps(replay_to_api(args.path, args.url, args.speed, max_retries=args.max_retries), indent=2))
+
+
+if __name__ == '__main__':
+    main()